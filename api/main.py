@@ -3,7 +3,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from api.src.admin import admin
 from api.src.cache.cache import cache
 from api.src.core.config import config
+from api.src.core.security import password_executor
+from api.src.database.database import engine, s3_clients
 from api.src.rabbitmq.client import rabbitmq_client
+from api.src.rabbitmq.producer import publisher
 from api.src.routers.database_router import database_router
 from api.src.routers.family_router import family_router
 from api.src.routers.meal_router import meal_router
@@ -55,8 +58,12 @@ async def startup():
 
 @app.on_event("shutdown")
 async def shutdown():
+    await publisher.close()
     #await rabbitmq_client.close()
     await cache.disconnect()
+    await engine.dispose()
+    await s3_clients.close()
+    password_executor.shutdown(wait=False)
 
 app.include_router(user_weight_router)
 app.include_router(database_router)
@@ -30,7 +30,7 @@ class AdminAuth(AuthProvider):
     ) -> Response:
         async for session in get_async_session():
             user = await self.staff_repository.find_by_login(session, username)
-            if not user or not Security.verify_password(password, user.hashed_password):
+            if not user or not await Security.verify_password_async(password, user.hashed_password):
                 raise LoginFailed("Invalid username or password")
 
             access_token = Security.create_access_token(
@@ -112,7 +112,7 @@ class StaffView(ModelView):
         if not data.get("role"):
             raise FormValidationError({"role": "Роль обязательна для заполнения"})
 
-        obj.hashed_password = Security.get_password_hash(password)
+        obj.hashed_password = await Security.get_password_hash_async(password)
 
         # Устанавливаем is_active из данных или по умолчанию True
         obj.is_active = data.get("is_active", True)
@@ -125,7 +125,7 @@ class StaffView(ModelView):
     ) -> None:
         password = data.get("password")
         if password:
-            obj.hashed_password = Security.get_password_hash(password)
+            obj.hashed_password = await Security.get_password_hash_async(password)
 
         name = data.get("name")
         if name and len(name.strip().split()) != 3:
@@ -420,7 +420,7 @@ class UserView(ModelView, MixinImageControl):
         if errors:
             raise FormValidationError(errors)
 
-        obj.hashed_password = Security.get_password_hash(data["password"])
+        obj.hashed_password = await Security.get_password_hash_async(data["password"])
         obj.email = data["login"]
 
         if data.get("gender"):
@@ -488,7 +488,7 @@ class UserView(ModelView, MixinImageControl):
             raise FormValidationError(errors)
 
         if "password" in data and data["password"]:
-            obj.hashed_password = Security.get_password_hash(data["password"])
+            obj.hashed_password = await Security.get_password_hash_async(data["password"])
 
         if "login" in data:
             obj.email = data["login"]
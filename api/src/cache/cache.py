@@ -1,27 +1,73 @@
 import redis.asyncio as aioredis
-import json
-from datetime import datetime
-from typing import Optional, Union
+from typing import Iterable, Optional, TypeVar, Union
+from pydantic import TypeAdapter
+from api.src.cache.serializers import BaseSerializer, get_serializer
 from api.src.core.config import config
 from api.src.exceptions import CacheGetError, CacheSetError, CacheDeleteError
 from api.logging_config import logger
 
 
+T = TypeVar("T")
+
+
 class Cache:
-    def __init__(self, redis_url: str = config.REDIS_URL):
+    # KEYS: tag sets first (ARGV[1] of them), then plain keys; everything is removed in one round-trip.
+    INVALIDATE_SCRIPT = """
+    local deleted = 0
+    local tag_count = tonumber(ARGV[1])
+    for i = 1, #KEYS do
+        if i <= tag_count then
+            local members = redis.call('SMEMBERS', KEYS[i])
+            for j = 1, #members, 1000 do
+                deleted = deleted + redis.call('DEL', unpack(members, j, math.min(j + 999, #members)))
+            end
+        end
+        deleted = deleted + redis.call('DEL', KEYS[i])
+    end
+    return deleted
+    """
+
+    # KEYS: the cached key, then its tag sets; ARGV: value, expire, max tag members.
+    # A tag set lives as long as its longest-lived member, and a set that reached the cap is
+    # invalidated as a whole instead of growing further.
+    SET_SCRIPT = """
+    local expire = tonumber(ARGV[2])
+    local max_members = tonumber(ARGV[3])
+    for i = 2, #KEYS do
+        if redis.call('SCARD', KEYS[i]) >= max_members then
+            local members = redis.call('SMEMBERS', KEYS[i])
+            for j = 1, #members, 1000 do
+                redis.call('DEL', unpack(members, j, math.min(j + 999, #members)))
+            end
+            redis.call('DEL', KEYS[i])
+        end
+        redis.call('SADD', KEYS[i], KEYS[1])
+        if redis.call('TTL', KEYS[i]) < expire then
+            redis.call('EXPIRE', KEYS[i], expire)
+        end
+    end
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', expire)
+    return #KEYS - 1
+    """
+
+    def __init__(
+        self,
+        redis_url: str = config.REDIS_URL,
+        serializer: BaseSerializer | None = None,
+        tag_max_members: int = config.CACHE_TAG_MAX_MEMBERS,
+    ):
         self.redis_url = redis_url
+        self.serializer = serializer or get_serializer()
+        self.tag_max_members = tag_max_members
         self.pool: Optional[aioredis.Redis] = None
+        self._invalidate_script = None
+        self._set_script = None
 
     async def connect(self) -> None:
-        self.pool = await aioredis.from_url(self.redis_url, decode_responses=True)
+        self.pool = await aioredis.from_url(self.redis_url)
         logger.info("Connected to Redis (cache)")
 
-    def _convert_recorded_at(self, item: dict) -> dict:
-        if "recorded_at" in item:
-            item["recorded_at"] = datetime.fromisoformat(item["recorded_at"]).date()
-        return item
-
-    async def get(self, key: str) -> Union[dict, list] | None:
+    async def _get_raw(self, key: str) -> bytes | None:
         if not self.pool:
             logger.error("Redis connection is not established")
             return None
@@ -29,37 +75,77 @@ class Cache:
         try:
             logger.info(f"Attempting to get data from cache for key {key}")
             value = await self.pool.get(key)
-            if value:
-                logger.info(f"Data successfully retrieved from cache for key {key}")
-                data = json.loads(value)
-
-                if isinstance(data, list):
-                    data = [self._convert_recorded_at(item) for item in data]
-                else:
-                    data = self._convert_recorded_at(data)
-
-                return data
-            else:
-                logger.warning(f"Data not found in cache for key {key}")
-                return None
         except Exception:
             logger.exception(f"Error while getting data from cache for key {key}")
             raise CacheGetError
 
-    async def set(self, key: str, value: dict, expire: int = 3600) -> None:
-        if not self.pool:
-            logger.error("Redis connection is not established")
-            return
+        if value is None:
+            logger.warning(f"Data not found in cache for key {key}")
+            return None
+
+        logger.info(f"Data successfully retrieved from cache for key {key}")
+        return value
 
+    async def _set_raw(self, key: str, value: bytes, expire: int, tags: Iterable[str]) -> None:
         try:
             logger.info(f"Adding data to cache with key {key}")
-            json_value = json.dumps(value)
-            await self.pool.set(key, json_value, ex=expire)
+            tag_keys = [self._tag_key(tag) for tag in tags]
+            if tag_keys:
+                if self._set_script is None:
+                    self._set_script = self.pool.register_script(self.SET_SCRIPT)
+                await self._set_script(keys=[key, *tag_keys], args=[value, expire, self.tag_max_members])
+            else:
+                await self.pool.set(key, value, ex=expire)
             logger.info(f"Data successfully added to cache with key {key}")
-        except Exception as e:
+        except Exception:
             logger.exception(f"Error while adding data to cache with key {key}")
             raise CacheSetError
 
+    async def get(self, key: str) -> Union[dict, list] | None:
+        value = await self._get_raw(key)
+        if value is None:
+            return None
+
+        try:
+            return self.serializer.loads(value)
+        except Exception:
+            return await self._drop_undecodable(key)
+
+    async def get_model(self, key: str, adapter: TypeAdapter[T]) -> T | None:
+        value = await self._get_raw(key)
+        if value is None:
+            return None
+
+        try:
+            return self.serializer.loads_model(adapter, value)
+        except Exception:
+            return await self._drop_undecodable(key)
+
+    async def _drop_undecodable(self, key: str) -> None:
+        # Entries written in an older format (or for an older schema) are treated as a miss and removed.
+        logger.warning(f"Cached data for key {key} could not be decoded, treating it as a miss")
+        try:
+            await self.pool.delete(key)
+        except Exception:
+            logger.exception(f"Error while deleting undecodable cache entry for key {key}")
+        return None
+
+    async def set(self, key: str, value: dict | list, expire: int = 3600, tags: Iterable[str] = ()) -> None:
+        if not self.pool:
+            logger.error("Redis connection is not established")
+            return
+
+        await self._set_raw(key, self.serializer.dumps(value), expire, tags)
+
+    async def set_model(
+        self, key: str, value: T, adapter: TypeAdapter[T], expire: int = 3600, tags: Iterable[str] = ()
+    ) -> None:
+        if not self.pool:
+            logger.error("Redis connection is not established")
+            return
+
+        await self._set_raw(key, self.serializer.dumps_model(adapter, value), expire, tags)
+
     async def delete(self, key: str) -> None:
         if not self.pool:
             logger.error("Redis connection is not established")
@@ -68,6 +154,29 @@ class Cache:
         await self.pool.delete(key)
         logger.info(f"Cache deleted for key {key}")
 
+    async def delete_many(self, *keys: str) -> None:
+        await self.invalidate_tags(keys=keys)
+
+    async def invalidate_tags(self, *tags: str, keys: Iterable[str] = ()) -> None:
+        if not self.pool:
+            logger.error("Redis connection is not established")
+            raise CacheDeleteError
+
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        keys = list(keys)
+        if not tag_keys and not keys:
+            return
+
+        if self._invalidate_script is None:
+            self._invalidate_script = self.pool.register_script(self.INVALIDATE_SCRIPT)
+
+        deleted = await self._invalidate_script(keys=[*tag_keys, *keys], args=[len(tag_keys)])
+        logger.info(f"Cache invalidated for tags {list(tags)} and keys {keys} ({deleted} keys)")
+
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        return f"tag:{tag}"
+
     async def flushdb(self) -> None:
         if not self.pool:
             logger.error("Redis connection is not established")
@@ -0,0 +1,113 @@
+from contextlib import suppress
+from typing import AsyncIterator, Iterable
+from uuid import UUID
+import orjson
+from api.src.cache.cache import cache, Cache
+from api.src.core.config import config
+from api.logging_config import logger
+
+
+class NotificationChannel:
+    """Per-user unread counters in Redis plus a pub/sub channel that pushes counter changes to clients."""
+
+    # KEYS: counters; ARGV: delta, event type, then one channel per counter.
+    # A counter is only moved when it already exists, a missing one is rebuilt from the database on next read.
+    PUBLISH_SCRIPT = """
+    local delta = tonumber(ARGV[1])
+    for i = 1, #KEYS do
+        local count = false
+        if redis.call('EXISTS', KEYS[i]) == 1 then
+            count = redis.call('INCRBY', KEYS[i], delta)
+            if count < 0 then
+                redis.call('SET', KEYS[i], 0, 'KEEPTTL')
+                count = 0
+            end
+        end
+        redis.call('PUBLISH', ARGV[i + 2], cjson.encode({type = ARGV[2], unread_count = count or cjson.null}))
+    end
+    return #KEYS
+    """
+
+    def __init__(
+        self,
+        redis_cache: Cache = cache,
+        ttl: int = config.NOTIFICATION_COUNTER_TTL,
+        fill_ttl: int = config.NOTIFICATION_COUNTER_FILL_TTL,
+    ):
+        self.redis_cache = redis_cache
+        self.ttl = ttl
+        self.fill_ttl = fill_ttl
+        self._publish_script = None
+
+    @staticmethod
+    def _counter_key(user_id: UUID) -> str:
+        return f"unread_notifications:{user_id}"
+
+    @staticmethod
+    def _channel(user_id: UUID) -> str:
+        return f"notifications:{user_id}"
+
+    async def get_unread_count(self, user_id: UUID) -> int | None:
+        if not self.redis_cache.pool:
+            return None
+        try:
+            value = await self.redis_cache.pool.get(self._counter_key(user_id))
+        except Exception:
+            logger.exception(f"Error while reading unread notification count for user {user_id}")
+            return None
+        return int(value) if value is not None else None
+
+    async def fill_unread_count(self, user_id: UUID, count: int) -> None:
+        # The count was read from the database and may already be stale: never overwrite a live counter,
+        # and keep the filled value short-lived so a missed increment heals quickly.
+        if not self.redis_cache.pool:
+            return
+        try:
+            await self.redis_cache.pool.set(self._counter_key(user_id), count, ex=self.fill_ttl, nx=True)
+        except Exception:
+            logger.exception(f"Error while storing unread notification count for user {user_id}")
+
+    async def publish_created(self, user_ids: Iterable[UUID]) -> None:
+        user_ids = list(user_ids)
+        if not user_ids or not self.redis_cache.pool:
+            return
+        if self._publish_script is None:
+            self._publish_script = self.redis_cache.pool.register_script(self.PUBLISH_SCRIPT)
+        try:
+            await self._publish_script(
+                keys=[self._counter_key(user_id) for user_id in user_ids],
+                args=[1, "created", *(self._channel(user_id) for user_id in user_ids)],
+            )
+        except Exception:
+            # Push is best-effort: drop the counters so the next read is taken from the database.
+            logger.exception("Error while publishing created notifications")
+            with suppress(Exception):
+                await self.redis_cache.delete_many(*(self._counter_key(user_id) for user_id in user_ids))
+
+    async def publish_count(self, user_id: UUID, count: int, event: str) -> None:
+        if not self.redis_cache.pool:
+            return
+        try:
+            async with self.redis_cache.pool.pipeline(transaction=False) as pipe:
+                pipe.set(self._counter_key(user_id), count, ex=self.ttl)
+                pipe.publish(self._channel(user_id), orjson.dumps({"type": event, "unread_count": count}))
+                await pipe.execute()
+        except Exception:
+            logger.exception(f"Error while publishing notification count for user {user_id}")
+
+    async def subscribe(self, user_id: UUID, keepalive: float = config.NOTIFICATION_STREAM_KEEPALIVE) -> AsyncIterator[bytes | None]:
+        """Yields raw event payloads, and None every `keepalive` seconds without events."""
+        pubsub = self.redis_cache.pool.pubsub()
+        await pubsub.subscribe(self._channel(user_id))
+        logger.info(f"Notification stream opened for user {user_id}")
+        try:
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=keepalive)
+                yield message["data"] if message else None
+        finally:
+            await pubsub.unsubscribe(self._channel(user_id))
+            await pubsub.aclose()
+            logger.info(f"Notification stream closed for user {user_id}")
+
+
+notification_channel = NotificationChannel()
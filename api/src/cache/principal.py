@@ -0,0 +1,132 @@
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from api.src.cache.cache import cache, Cache
+from api.src.core.config import config
+from api.src.models.user import User
+from api.logging_config import logger
+
+
+class UserPrincipalCache:
+    EXCLUDED_COLUMNS = {"hashed_password"}
+
+    def __init__(
+        self,
+        redis_cache: Cache = cache,
+        max_size: int = config.USER_CACHE_MAX_SIZE,
+        local_ttl: int = config.USER_CACHE_LOCAL_TTL,
+        redis_ttl: int = config.USER_CACHE_TTL,
+    ):
+        self.redis_cache = redis_cache
+        self.max_size = max_size
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self._local: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    @staticmethod
+    def _key(login: str) -> str:
+        return f"user_principal:{login}"
+
+    def _get_local(self, login: str) -> dict | None:
+        entry = self._local.get(login)
+        if entry is None:
+            return None
+
+        expires_at, data = entry
+        if expires_at < time.monotonic():
+            self._local.pop(login, None)
+            return None
+
+        self._local.move_to_end(login)
+        return data
+
+    def _set_local(self, login: str, data: dict) -> None:
+        self._local[login] = (time.monotonic() + self.local_ttl, data)
+        self._local.move_to_end(login)
+        while len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+
+    def _dump(self, user: User) -> dict:
+        data = {}
+        for column in User.__table__.columns:
+            if column.key in self.EXCLUDED_COLUMNS:
+                continue
+            value = getattr(user, column.key)
+            if isinstance(value, UUID):
+                value = str(value)
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, Enum):
+                value = value.value
+            data[column.key] = value
+        return data
+
+    def _load(self, data: dict) -> User:
+        values = {}
+        for column in User.__table__.columns:
+            if column.key not in data:
+                continue
+            value = data[column.key]
+            python_type = column.type.python_type
+            if value is not None and not isinstance(value, python_type):
+                if python_type is datetime:
+                    value = datetime.fromisoformat(value)
+                else:
+                    value = python_type(value)
+            values[column.key] = value
+
+        user = User(**values)
+        make_transient_to_detached(user)
+        return user
+
+    async def get(self, session: AsyncSession, login: str) -> User | None:
+        data = self._get_local(login)
+
+        if data is None and self.redis_cache.pool:
+            try:
+                raw = await self.redis_cache.pool.get(self._key(login))
+            except Exception:
+                logger.exception(f"Error while getting user principal from cache for {login}")
+                raw = None
+            if raw:
+                data = json.loads(raw)
+                self._set_local(login, data)
+
+        if data is None:
+            return None
+
+        return await session.merge(self._load(data), load=False)
+
+    async def set(self, login: str, user: User) -> None:
+        data = self._dump(user)
+        self._set_local(login, data)
+
+        if not self.redis_cache.pool:
+            return
+
+        try:
+            await self.redis_cache.pool.set(self._key(login), json.dumps(data), ex=self.redis_ttl)
+        except Exception:
+            logger.exception(f"Error while adding user principal to cache for {login}")
+
+    async def invalidate(self, *logins: str | None) -> None:
+        logins = [login for login in logins if login]
+        for login in logins:
+            self._local.pop(login, None)
+
+        if not logins or not self.redis_cache.pool:
+            return
+
+        try:
+            await self.redis_cache.pool.delete(*(self._key(login) for login in logins))
+            logger.info(f"User principal cache invalidated for {logins}")
+        except Exception:
+            logger.exception(f"Error while invalidating user principal cache for {logins}")
+
+
+user_principal_cache = UserPrincipalCache()
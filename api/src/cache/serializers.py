@@ -0,0 +1,100 @@
+import json
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any
+import orjson
+from pydantic import TypeAdapter
+from api.src.core.config import config
+
+
+class BaseSerializer(ABC):
+    RAW = b"\x00"
+    COMPRESSED = b"\x01"
+
+    def __init__(self, compress_threshold: int = 0):
+        self.compress_threshold = compress_threshold
+
+    @abstractmethod
+    def _dumps(self, value: Any) -> bytes: ...
+
+    @abstractmethod
+    def _loads(self, data: bytes) -> Any: ...
+
+    def _dumps_model(self, adapter: TypeAdapter, value: Any) -> bytes:
+        return self._dumps(adapter.dump_python(value, mode="json"))
+
+    def _loads_model(self, adapter: TypeAdapter, data: bytes) -> Any:
+        return adapter.validate_python(self._loads(data))
+
+    def _pack(self, payload: bytes) -> bytes:
+        if self.compress_threshold and len(payload) > self.compress_threshold:
+            return self.COMPRESSED + zlib.compress(payload)
+        return self.RAW + payload
+
+    @classmethod
+    def _unpack(cls, data: bytes) -> bytes:
+        header, payload = data[:1], data[1:]
+        if header == cls.COMPRESSED:
+            return zlib.decompress(payload)
+        if header == cls.RAW:
+            return payload
+        raise ValueError(f"Unknown cache payload header {header!r}")
+
+    def dumps(self, value: Any) -> bytes:
+        return self._pack(self._dumps(value))
+
+    def loads(self, data: bytes) -> Any:
+        return self._loads(self._unpack(data))
+
+    def dumps_model(self, adapter: TypeAdapter, value: Any) -> bytes:
+        return self._pack(self._dumps_model(adapter, value))
+
+    def loads_model(self, adapter: TypeAdapter, data: bytes) -> Any:
+        return self._loads_model(adapter, self._unpack(data))
+
+
+class JsonSerializer(BaseSerializer):
+    def _dumps(self, value: Any) -> bytes:
+        return json.dumps(value).encode()
+
+    def _loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps_model(self, adapter: TypeAdapter, value: Any) -> bytes:
+        return adapter.dump_json(value)
+
+    def _loads_model(self, adapter: TypeAdapter, data: bytes) -> Any:
+        return adapter.validate_json(data)
+
+
+class OrjsonSerializer(JsonSerializer):
+    def _dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def _loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackSerializer(BaseSerializer):
+    def __init__(self, compress_threshold: int = 0):
+        import msgpack
+
+        super().__init__(compress_threshold)
+        self._msgpack = msgpack
+
+    def _dumps(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, use_bin_type=True)
+
+    def _loads(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data, raw=False)
+
+
+SERIALIZERS: dict[str, type[BaseSerializer]] = {
+    "json": JsonSerializer,
+    "orjson": OrjsonSerializer,
+    "msgpack": MsgpackSerializer,
+}
+
+
+def get_serializer(name: str = config.CACHE_SERIALIZER) -> BaseSerializer:
+    return SERIALIZERS[name](compress_threshold=config.CACHE_COMPRESS_THRESHOLD)
@@ -0,0 +1,52 @@
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from api.src.cache.cache import cache, Cache
+from api.src.core.config import config
+from api.src.models.family import FamilyMember, FamilyProduct
+from api.logging_config import logger
+
+
+class ProductVisibility:
+    def __init__(self, redis_cache: Cache = cache, ttl: int = config.PRODUCT_VISIBILITY_TTL):
+        self.redis_cache = redis_cache
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(user_id: UUID) -> str:
+        return f"visible_family_products:{user_id}"
+
+    async def get_family_product_ids(self, session: AsyncSession, user_id: UUID) -> list[UUID]:
+        cached_ids = await self.redis_cache.get(self._key(user_id))
+        if cached_ids is not None:
+            return [UUID(product_id) for product_id in cached_ids]
+
+        query = (
+            select(FamilyProduct.product_id)
+            .join(FamilyMember, FamilyMember.family_id == FamilyProduct.family_id)
+            .where(FamilyMember.user_id == user_id)
+            .distinct()
+        )
+        result = await session.execute(query)
+        product_ids = list(result.scalars().all())
+
+        await self.redis_cache.set(self._key(user_id), [str(product_id) for product_id in product_ids], expire=self.ttl)
+        return product_ids
+
+    async def invalidate_users(self, *user_ids: UUID) -> None:
+        if not user_ids:
+            return
+
+        tags = [tag for user_id in user_ids for tag in (f"user_products:{user_id}", f"product_search:{user_id}")]
+        await self.redis_cache.invalidate_tags(*tags, keys=[self._key(user_id) for user_id in user_ids])
+        logger.info(f"Product visibility invalidated for users {list(user_ids)}")
+
+    async def get_family_user_ids(self, session: AsyncSession, family_id: UUID) -> list[UUID]:
+        result = await session.execute(select(FamilyMember.user_id).where(FamilyMember.family_id == family_id))
+        return list(result.scalars().all())
+
+    async def invalidate_family(self, session: AsyncSession, family_id: UUID) -> None:
+        await self.invalidate_users(*await self.get_family_user_ids(session, family_id))
+
+
+product_visibility = ProductVisibility()
@@ -15,6 +15,15 @@ class Configuration:
     DB_USER = os.environ.get("DB_USER")
     DB_PASS = os.environ.get("DB_PASS")
 
+    DB_ECHO = os.environ.get("DB_ECHO", "false").lower() == "true"
+    DB_USE_NULL_POOL = os.environ.get("DB_USE_NULL_POOL", "false").lower() == "true"
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "true").lower() == "true"
+    DB_STATEMENT_CACHE_SIZE = int(os.environ.get("DB_STATEMENT_CACHE_SIZE", 100))
+
     DB_NAME_TEST = os.environ.get("DB_NAME_TEST")
     DB_HOST_TEST = os.environ.get("DB_HOST_TEST")
     DB_HOST_DOCKER_TEST = os.environ.get("DB_HOST_DOCKER_TEST")
@@ -27,16 +36,32 @@ class Configuration:
     ALGORITHM = os.environ.get("ALGORITHM")
     ACCESS_TOKEN_EXPIRE_MINUTES = int(os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES"))
 
+    BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", 12))
+    PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", 4))
+
     RABBITMQ_DEFAULT_USER = os.environ.get("RABBITMQ_DEFAULT_USER")
     RABBITMQ_DEFAULT_PASS = os.environ.get("RABBITMQ_DEFAULT_PASS")
     RABBITMQ_DEFAULT_HOST = os.environ.get("RABBITMQ_DEFAULT_HOST")
     RABBITMQ_DEFAULT_VHOST = os.environ.get("RABBITMQ_DEFAULT_VHOST")
     RABBITMQ_DEFAULT_PORT = int(os.environ.get("RABBITMQ_DEFAULT_PORT"))
+    RABBITMQ_PREFETCH_COUNT = int(os.environ.get("RABBITMQ_PREFETCH_COUNT", 32))
+    RABBITMQ_CONSUMER_CONCURRENCY = int(os.environ.get("RABBITMQ_CONSUMER_CONCURRENCY", 16))
+    RABBITMQ_MAX_RETRIES = int(os.environ.get("RABBITMQ_MAX_RETRIES", 5))
+    RABBITMQ_RETRY_DELAY = float(os.environ.get("RABBITMQ_RETRY_DELAY", 5))
+    RABBITMQ_PUBLISH_BATCH_SIZE = int(os.environ.get("RABBITMQ_PUBLISH_BATCH_SIZE", 100))
+    RABBITMQ_PUBLISH_FLUSH_INTERVAL = float(os.environ.get("RABBITMQ_PUBLISH_FLUSH_INTERVAL", 0.05))
+    RABBITMQ_PUBLISH_MAX_BUFFER = int(os.environ.get("RABBITMQ_PUBLISH_MAX_BUFFER", 10000))
+    RABBITMQ_PUBLISH_PERSISTENT = os.environ.get("RABBITMQ_PUBLISH_PERSISTENT", "true").lower() == "true"
 
     SMTP_USER = os.environ.get("SMTP_USER")
     SMTP_PASSWORD = os.environ.get("SMTP_PASSWORD")
     SMTP_PORT = os.environ.get("SMTP_PORT")
     SMTP_HOST = os.environ.get("SMTP_HOST")
+    SMTP_TIMEOUT = int(os.environ.get("SMTP_TIMEOUT", 30))
+    SMTP_IDLE_TIMEOUT = int(os.environ.get("SMTP_IDLE_TIMEOUT", 60))
+    MAIL_BACKEND = os.environ.get("MAIL_BACKEND", "smtp")
+    MAIL_FILE_PATH = os.environ.get("MAIL_FILE_PATH", "var/mail")
+    MAIL_BATCH_SIZE = int(os.environ.get("MAIL_BATCH_SIZE", 50))
 
     S3_ENDPOINT = os.environ.get("S3_ENDPOINT")
     S3_BUCKET = os.environ.get("S3_BUCKET")
@@ -44,8 +69,25 @@ class Configuration:
     S3_KEY_ID = os.environ.get("S3_KEY_ID")
     S3_SECRET_ACCESS_KEY = os.environ.get("S3_SECRET_ACCESS_KEY")
     S3_ACCESS_DOMAIN = os.environ.get("S3_ACCESS_DOMAIN")
+    S3_MAX_POOL_CONNECTIONS = int(os.environ.get("S3_MAX_POOL_CONNECTIONS", 50))
+    S3_CONNECT_TIMEOUT = int(os.environ.get("S3_CONNECT_TIMEOUT", 10))
+    S3_READ_TIMEOUT = int(os.environ.get("S3_READ_TIMEOUT", 60))
+    S3_MULTIPART_THRESHOLD = int(os.environ.get("S3_MULTIPART_THRESHOLD", 16 * 1024 * 1024))
+    S3_MULTIPART_PART_SIZE = int(os.environ.get("S3_MULTIPART_PART_SIZE", 8 * 1024 * 1024))
+    S3_MULTIPART_CONCURRENCY = int(os.environ.get("S3_MULTIPART_CONCURRENCY", 4))
+    MAX_FILE_SIZE = int(os.environ.get("MAX_FILE_SIZE", 10 * 1024 * 1024))
+    REMOTE_FILE_MAX_SIZE = int(os.environ.get("REMOTE_FILE_MAX_SIZE", 50 * 1024 * 1024))
+    REMOTE_FILE_TIMEOUT = int(os.environ.get("REMOTE_FILE_TIMEOUT", 300))
+    ALLOWED_MIME_TYPES = os.environ.get("ALLOWED_MIME_TYPES", "image/jpeg,image/png,image/webp,image/gif").split(",")
+    OBJECT_STORAGE_BACKEND = os.environ.get("OBJECT_STORAGE_BACKEND", "s3")
+    OBJECT_STORAGE_PATH = os.environ.get("OBJECT_STORAGE_PATH", "var/objects")
+    OBJECT_STORAGE_URL = os.environ.get("OBJECT_STORAGE_URL", "/media")
 
     TEMPLATES_PATH = Jinja2Templates(directory="api/src/templates")
+    EMAIL_TEMPLATES_DIR = os.environ.get("EMAIL_TEMPLATES_DIR", "api/src/templates")
+    EMAIL_TEMPLATES_SUBDIR = os.environ.get("EMAIL_TEMPLATES_SUBDIR", "email_notifications")
+    EMAIL_TEMPLATES_CACHE_DIR = os.environ.get("EMAIL_TEMPLATES_CACHE_DIR")
+    EMAIL_TEMPLATES_RELOAD = os.environ.get("EMAIL_TEMPLATES_RELOAD", "false").lower() == "true"
     LOGGER_FILE_PATH = os.environ.get("LOGGER_FILE_PATH")
     FILE_PATH = os.environ.get("FILE_PATH")
 
@@ -59,6 +101,23 @@ class Configuration:
 
     REDIS_URL = os.environ.get("REDIS_URL")
 
+    DAILY_WEIGHT_BATCH_SIZE = int(os.environ.get("DAILY_WEIGHT_BATCH_SIZE", 5000))
+    RETENTION_BATCH_SIZE = int(os.environ.get("RETENTION_BATCH_SIZE", 1000))
+    RETENTION_BATCH_SLEEP = float(os.environ.get("RETENTION_BATCH_SLEEP", 0.1))
+    USER_WEIGHT_RETENTION_DAYS = int(os.environ.get("USER_WEIGHT_RETENTION_DAYS", 30))
+    MEAL_PRODUCTS_RETENTION_DAYS = int(os.environ.get("MEAL_PRODUCTS_RETENTION_DAYS", 7))
+    CACHE_TAG_MAX_MEMBERS = int(os.environ.get("CACHE_TAG_MAX_MEMBERS", 1000))
+    CACHE_SERIALIZER = os.environ.get("CACHE_SERIALIZER", "orjson")
+    CACHE_COMPRESS_THRESHOLD = int(os.environ.get("CACHE_COMPRESS_THRESHOLD", 0))
+
+    USER_CACHE_TTL = int(os.environ.get("USER_CACHE_TTL", 300))
+    USER_CACHE_LOCAL_TTL = int(os.environ.get("USER_CACHE_LOCAL_TTL", 10))
+    USER_CACHE_MAX_SIZE = int(os.environ.get("USER_CACHE_MAX_SIZE", 1024))
+    NOTIFICATION_COUNTER_TTL = int(os.environ.get("NOTIFICATION_COUNTER_TTL", 86400))
+    NOTIFICATION_COUNTER_FILL_TTL = int(os.environ.get("NOTIFICATION_COUNTER_FILL_TTL", 60))
+    NOTIFICATION_STREAM_KEEPALIVE = float(os.environ.get("NOTIFICATION_STREAM_KEEPALIVE", 15))
+    PRODUCT_VISIBILITY_TTL = int(os.environ.get("PRODUCT_VISIBILITY_TTL", 3600))
+
     ENGLISH_PATTERN = re.compile(r'^[a-zA-Z0-9@._-]+$')
     SPECIAL_CHARS = "!@#$%^&*()_+-="
 
@@ -1,18 +1,26 @@
+import asyncio
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta, datetime
 import jwt as pyjwt
 from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
 from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
+from api.src.cache.principal import user_principal_cache
 from api.src.core.config import Configuration
 from api.src.database.database import get_async_session
 from api.src.exceptions import TokenDoesntExist, CredentialsException, TokenHasExpired, InvalidToken, UserDoesntExist, \
     CustomExceptions, StaffDoesntExist
 from api.src.dependencies.repositories import get_staff_repository, get_user_repository
+from api.src.models.user import User
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=Configuration.BCRYPT_ROUNDS)
+password_executor = ThreadPoolExecutor(
+    max_workers=Configuration.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
@@ -42,11 +50,9 @@ class Security:
         if not login:
             raise InvalidToken
 
-        user_repository = get_user_repository()
-        user = await user_repository.find_by_login_or_email(db, login)
+        user = await Security._get_user_principal(db, login)
         if user is None:
             raise UserDoesntExist
-        print(user)
         return user
 
     @staticmethod
@@ -65,11 +71,18 @@ class Security:
         if not login:
             return None
 
+        return await Security._get_user_principal(db, login)
+
+    @staticmethod
+    async def _get_user_principal(db: AsyncSession, login: str) -> User | None:
+        user = await user_principal_cache.get(db, login)
+        if user is not None:
+            return user
+
         user_repository = get_user_repository()
         user = await user_repository.find_by_login_or_email(db, login)
-        if user is None:
-            return None
-
+        if user is not None:
+            await user_principal_cache.set(login, user)
         return user
 
     @staticmethod
@@ -111,6 +124,16 @@ class Security:
     def get_password_hash(cls, password):
         return pwd_context.hash(password)
 
+    @classmethod
+    async def verify_password_async(cls, plain_password, hashed_password) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(password_executor, cls.verify_password, plain_password, hashed_password)
+
+    @classmethod
+    async def get_password_hash_async(cls, password) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(password_executor, cls.get_password_hash, password)
+
     @classmethod
     def validate_password_strength(
             cls,
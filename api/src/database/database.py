@@ -1,16 +1,126 @@
+import asyncio
+import time
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import AsyncGenerator
 
 import aioboto3 as aioboto3
-from sqlalchemy import NullPool
+from aiobotocore.config import AioConfig
+from sqlalchemy import NullPool, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from api.src.core.config import config
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
 from api.logging_config import logger
 
 
-engine = create_async_engine(config.database_url, echo=True, poolclass=NullPool)
+@dataclass(slots=True)
+class PoolMetrics:
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    invalidations: int = 0
+    wait_count: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.wait_count += 1
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+
+    def to_dict(self) -> dict:
+        return {
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "invalidations": self.invalidations,
+            "wait_count": self.wait_count,
+            "wait_avg_ms": round(self.wait_total / self.wait_count * 1000, 3) if self.wait_count else 0.0,
+            "wait_max_ms": round(self.wait_max * 1000, 3),
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_metrics.record_wait(time.perf_counter() - started)
+
+
+def create_engine(database_url: str = config.database_url) -> AsyncEngine:
+    if config.DB_USE_NULL_POOL:
+        # pgbouncer in transaction mode: no client-side pool and no prepared statements,
+        # a server connection is not guaranteed to be the same between statements.
+        logger.info("Database engine created with NullPool")
+        return create_async_engine(
+            database_url,
+            echo=config.DB_ECHO,
+            poolclass=NullPool,
+            connect_args={"statement_cache_size": 0, "prepared_statement_cache_size": 0},
+        )
+
+    pooled_engine = create_async_engine(
+        database_url,
+        echo=config.DB_ECHO,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+        },
+    )
+    _register_pool_events(pooled_engine)
+    logger.info(
+        f"Database engine created with pool_size={config.DB_POOL_SIZE}, max_overflow={config.DB_MAX_OVERFLOW}"
+    )
+    return pooled_engine
+
+
+def _register_pool_events(async_engine: AsyncEngine) -> None:
+    pool = async_engine.sync_engine.pool
+
+    @event.listens_for(pool, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        pool_metrics.connects += 1
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        pool_metrics.checkouts += 1
+
+    @event.listens_for(pool, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        pool_metrics.checkins += 1
+
+    @event.listens_for(pool, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        pool_metrics.invalidations += 1
+
+
+def get_pool_status(async_engine: AsyncEngine | None = None) -> dict:
+    pool = (async_engine or engine).pool
+    status = {"pool_class": type(pool).__name__, **pool_metrics.to_dict()}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        })
+    return status
+
+
+engine = create_engine()
 async_session_maker = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
 Base = declarative_base()
 
@@ -18,19 +128,54 @@ Base = declarative_base()
 s3_session = aioboto3.Session()
 
 
+class S3ClientManager:
+    """A single S3 client per process, with its own connection pool, shared by every object operation."""
+
+    def __init__(self, session: aioboto3.Session = s3_session):
+        self._session = session
+        self._context = None
+        self._client = None
+        self._lock: asyncio.Lock | None = None
+
+    async def get(self):
+        if self._client is not None:
+            return self._client
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._client is None:
+                self._context = self._session.client(
+                    service_name="s3",
+                    region_name=config.S3_REGION,
+                    endpoint_url=config.S3_ENDPOINT,
+                    aws_access_key_id=config.S3_KEY_ID,
+                    aws_secret_access_key=config.S3_SECRET_ACCESS_KEY,
+                    config=AioConfig(
+                        max_pool_connections=config.S3_MAX_POOL_CONNECTIONS,
+                        connect_timeout=config.S3_CONNECT_TIMEOUT,
+                        read_timeout=config.S3_READ_TIMEOUT,
+                    ),
+                )
+                self._client = await self._context.__aenter__()
+                logger.info(f"S3 client created with max_pool_connections={config.S3_MAX_POOL_CONNECTIONS}")
+        return self._client
+
+    async def close(self) -> None:
+        if self._context is None:
+            return
+        context, self._context, self._client = self._context, None, None
+        await context.__aexit__(None, None, None)
+        logger.info("S3 client closed")
+
+
+s3_clients = S3ClientManager()
+
+
 @asynccontextmanager
 async def s3_client():
-    async with s3_session.client(
-        service_name="s3",
-        region_name=config.S3_REGION,
-        endpoint_url=config.S3_ENDPOINT,
-        aws_access_key_id=config.S3_KEY_ID,
-        aws_secret_access_key=config.S3_SECRET_ACCESS_KEY,
-    ) as s3_client:
-        yield s3_client
+    yield await s3_clients.get()
 
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
-        logger.info(f"Connected to database: {config.database_url}")
         yield session
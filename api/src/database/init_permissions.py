@@ -255,7 +255,7 @@ async def create_admin_user(db: AsyncSession, roles_map):
             login="admin@fooddiary.com",
             email="admin@fooddiary.com",
             name="Администратор Системы",
-            hashed_password=Security.get_password_hash("admin123"),
+            hashed_password=await Security.get_password_hash_async("admin123"),
             role_id=admin_role.id,
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow()  # Добавлено поле updated_at
@@ -1,3 +1,6 @@
+from api.src.core.config import config
+from api.src.repositories.daily_nutrition.base import BaseDailyNutritionRepository
+from api.src.repositories.daily_nutrition.sqlalchemy import SqlAlchemyDailyNutritionRepository
 from api.src.repositories.family.base import BaseFamilyRepository, BaseFamilyMemberRepository, \
     BaseFamilyProductRepository, BaseFamilyInvitationRepository, BaseFamilyNotificationRepository
 from api.src.repositories.family.sqlalchemy import SqlAlchemyFamilyRepository, SqlAlchemyFamilyMemberRepository, \
@@ -7,6 +10,7 @@ from api.src.repositories.meal.sqlalchemy import SqlAlchemyMealRepository
 from api.src.repositories.meal_products.base import BaseMealProductsRepository
 from api.src.repositories.meal_products.sqlalchemy import SqlAlchemyMealProductsRepository
 from api.src.repositories.objects.base import BaseObjectRepository
+from api.src.repositories.objects.filesystem import FileSystemObjectRepository
 from api.src.repositories.objects.s3 import S3ObjectRepository
 from api.src.repositories.product.base import BaseProductRepository
 from api.src.repositories.product.sqlalchemy import SqlAlchemyProductRepository
@@ -30,7 +34,13 @@ def get_meal_products_repository() -> BaseMealProductsRepository:
     return SqlAlchemyMealProductsRepository()
 
 
+def get_daily_nutrition_repository() -> BaseDailyNutritionRepository:
+    return SqlAlchemyDailyNutritionRepository()
+
+
 def get_object_repository() -> BaseObjectRepository:
+    if config.OBJECT_STORAGE_BACKEND == "filesystem":
+        return FileSystemObjectRepository()
     return S3ObjectRepository()
 
 
@@ -1,7 +1,7 @@
 from api.src.dependencies.repositories import get_user_repository, get_meal_repository, get_meal_products_repository, \
     get_user_weight_repository, get_product_repository, get_object_repository, get_family_repository, \
     get_family_member_repository, get_family_product_repository, get_family_invitation_repository, \
-    get_family_notification_repository
+    get_family_notification_repository, get_daily_nutrition_repository
 from api.src.services.family import FamilyService, FamilyMemberService, FamilyProductService, FamilyInvitationService, \
     FamilyNotificationService
 from api.src.services.meal import MealService
@@ -15,7 +15,7 @@ def get_user_service() -> UserService:
 
 
 def get_meal_service() -> MealService:
-    return MealService(get_meal_repository(), get_meal_products_repository())
+    return MealService(get_meal_repository(), get_meal_products_repository(), get_daily_nutrition_repository())
 
 
 def get_product_service() -> ProductService:
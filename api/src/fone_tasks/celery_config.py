@@ -23,7 +23,6 @@ celery_app.conf.update(
         Queue('cleanup_queue', Exchange('cleanup'), routing_key='cleanup'),
     ],
     task_routes={
-        'start_rabbitmq_consumer': {'queue': 'registration_queue'},
         'send_code': {'queue': 'email_queue'},
         'delete_old_user_weights': {'queue': 'cleanup_queue'},
         'delete_old_meal_products': {'queue': 'cleanup_queue'},
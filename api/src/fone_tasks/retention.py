@@ -0,0 +1,61 @@
+import asyncio
+from dataclasses import dataclass
+from time import perf_counter
+from sqlalchemy import Select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from api.src.core.config import config
+from api.src.database.database import async_session_maker
+from api.logging_config import logger
+
+
+@dataclass(slots=True)
+class RetentionStats:
+    name: str
+    batches: int = 0
+    deleted: int = 0
+    elapsed: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "batches": self.batches,
+            "deleted": self.deleted,
+            "elapsed": round(self.elapsed, 3),
+            "rows_per_second": round(self.deleted / self.elapsed, 1) if self.elapsed else 0.0,
+        }
+
+
+async def _delete_batch(session: AsyncSession, model, ids_query: Select, batch_size: int) -> int:
+    batch_ids = ids_query.limit(batch_size).scalar_subquery()
+    result = await session.execute(delete(model).where(model.id.in_(batch_ids)))
+    await session.commit()
+    return result.rowcount
+
+
+async def run_batched_retention(
+    name: str,
+    model,
+    ids_query: Select,
+    batch_size: int = config.RETENTION_BATCH_SIZE,
+    sleep_seconds: float = config.RETENTION_BATCH_SLEEP,
+    session_maker: sessionmaker = async_session_maker,
+) -> RetentionStats:
+    stats = RetentionStats(name)
+    started = perf_counter()
+
+    while True:
+        async with session_maker() as session:
+            deleted = await _delete_batch(session, model, ids_query, batch_size)
+
+        stats.batches += 1
+        stats.deleted += deleted
+        stats.elapsed = perf_counter() - started
+        logger.info(f"Retention {name}: batch {stats.batches} deleted {deleted} rows ({stats.deleted} total)")
+
+        if deleted < batch_size:
+            break
+        await asyncio.sleep(sleep_seconds)
+
+    logger.info(f"Retention {name} finished: {stats.to_dict()}")
+    return stats
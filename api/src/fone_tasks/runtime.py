@@ -0,0 +1,85 @@
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Coroutine
+from celery.signals import worker_process_init, worker_process_shutdown
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from api.src.database.database import create_engine
+from api.src.fone_tasks.celery_config import celery_app
+from api.logging_config import logger
+
+
+class WorkerRuntime:
+    """One event loop and one pooled engine per Celery worker process, reused by every task."""
+
+    def __init__(self, engine_factory: Callable[[], AsyncEngine] = create_engine):
+        self._engine_factory = engine_factory
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.engine: AsyncEngine | None = None
+        self._session_maker: sessionmaker | None = None
+        self._shutdown_hooks: list[Callable[[], Awaitable]] = []
+
+    def on_shutdown(self, hook: Callable[[], Awaitable]) -> None:
+        self._shutdown_hooks.append(hook)
+
+    def start(self) -> None:
+        if self.loop is not None and not self.loop.is_closed():
+            return
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.engine = self._engine_factory()
+        self._session_maker = sessionmaker(bind=self.engine, class_=AsyncSession, expire_on_commit=False)
+        logger.info("Celery worker runtime started")
+
+    def stop(self) -> None:
+        if self.loop is None or self.loop.is_closed():
+            return
+        try:
+            for hook in self._shutdown_hooks:
+                try:
+                    self.loop.run_until_complete(hook())
+                except Exception as e:
+                    logger.error(f"Error in worker shutdown hook: {e}")
+            if self.engine is not None:
+                self.loop.run_until_complete(self.engine.dispose())
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        finally:
+            self.loop.close()
+            self.loop = None
+            self.engine = None
+            self._session_maker = None
+            logger.info("Celery worker runtime stopped")
+
+    @property
+    def session_maker(self) -> sessionmaker:
+        if self._session_maker is None:
+            self.start()
+        return self._session_maker
+
+    def run(self, coro: Coroutine) -> Any:
+        self.start()
+        return self.loop.run_until_complete(coro)
+
+
+runtime = WorkerRuntime()
+
+
+@worker_process_init.connect
+def start_worker_runtime(**kwargs) -> None:
+    runtime.start()
+
+
+@worker_process_shutdown.connect
+def stop_worker_runtime(**kwargs) -> None:
+    runtime.stop()
+
+
+def async_task(*task_args, **task_kwargs) -> Callable[[Callable[..., Awaitable]], Any]:
+    def decorator(func: Callable[..., Awaitable]):
+        @functools.wraps(func)
+        def run_task(*args, **kwargs):
+            return runtime.run(func(*args, **kwargs))
+
+        return celery_app.task(*task_args, **task_kwargs)(run_task)
+
+    return decorator
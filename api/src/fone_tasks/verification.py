@@ -1,13 +1,8 @@
 import secrets
-import smtplib
-import ssl
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
 from typing import Optional
-import os
-from jinja2 import Template
 from api.src.cache.cache import cache
-from api.src.core.config import config
+from api.src.mail.mailer import build_message, mailer
+from api.src.mail.templates import email_templates
 from api.logging_config import logger
 
 
@@ -53,6 +48,8 @@ async def get_code_data(name: str, code: str) -> Optional[str]:
         logger.warning(f"Code not found or expired: {name}_{code}")
         return None
 
+    data = data.decode()
+
     logger.info(f"Retrieved {name} data for code {code}: {data}")
     return data
 
@@ -89,7 +86,7 @@ async def verify_code(name: str, code: str, expected_data: str) -> bool:
     return is_valid
 
 
-def send_mail(
+async def send_mail(
         recipient: str,
         text: str = None,
         subject: str = None,
@@ -103,12 +100,7 @@ def send_mail(
 
     if template_name and context:
         try:
-            template_path = os.path.join("templates", "emails", template_name)
-            with open(template_path, 'r', encoding='utf-8') as file:
-                template_content = file.read()
-
-            template = Template(template_content)
-            text = template.render(**context)
+            text = email_templates.render(template_name, **context)
             use_html = True
         except Exception as e:
             logger.error(f"Error loading template {template_name}: {e}")
@@ -118,41 +110,6 @@ def send_mail(
         logger.error("No text content for email")
         return
 
-    message = MIMEMultipart()
-    message["Subject"] = subject
-    message["From"] = config.SMTP_USER
-    message["To"] = recipient
-    message.attach(MIMEText(text, "html" if use_html else "plain"))
-
-    try:
-        context = ssl.create_default_context()
-
-        logger.info(f"Attempting to connect to SMTP: {config.SMTP_HOST}:{config.SMTP_PORT}")
-
-        with smtplib.SMTP(
-                host=config.SMTP_HOST,
-                port=config.SMTP_PORT,
-                timeout=30
-        ) as server:
-            server.ehlo()
-            if server.has_extn('STARTTLS'):
-                server.starttls(context=context)
-                server.ehlo()
-
-            logger.info(f"Logging in as: {config.SMTP_USER}")
-            server.login(config.SMTP_USER, config.SMTP_PASSWORD)
-
-            logger.info(f"Sending email to: {recipient}")
-            server.send_message(message)
-
-        logger.info(f"Email sent successfully to {recipient}")
-
-    except smtplib.SMTPServerDisconnected as e:
-        logger.error(f"SMTP server disconnected: {str(e)}")
-        raise
-    except smtplib.SMTPException as e:
-        logger.error(f"SMTP error: {str(e)}")
-        raise
-    except Exception as e:
-        logger.error(f"Failed to send email to {recipient}: {str(e)}")
-        raise
+    logger.info(f"Sending email to: {recipient}")
+    await mailer.send(build_message(recipient, subject, text, use_html))
+    logger.info(f"Email sent successfully to {recipient}")
@@ -0,0 +1,157 @@
+import asyncio
+import time
+import uuid
+from abc import ABC, abstractmethod
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Callable
+import aiosmtplib
+from api.src.core.config import config
+from api.logging_config import logger
+
+
+ResultCallback = Callable[[int, Exception | None], None]
+
+
+class MailConnectionError(Exception):
+    pass
+
+
+class MailBackend(ABC):
+    @abstractmethod
+    async def send_batch(
+        self, messages: list[EmailMessage], on_result: ResultCallback | None = None
+    ) -> list[Exception | None]:
+        """Sends messages in order; `on_result(index, error)` is called as soon as each one is done."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        return None
+
+
+class SmtpBackend(MailBackend):
+    """Keeps one authenticated SMTP session open and reuses it until it goes idle or drops."""
+
+    def __init__(
+        self,
+        host: str = config.SMTP_HOST,
+        port: int = int(config.SMTP_PORT or 587),
+        username: str = config.SMTP_USER,
+        password: str = config.SMTP_PASSWORD,
+        timeout: int = config.SMTP_TIMEOUT,
+        idle_timeout: int = config.SMTP_IDLE_TIMEOUT,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.client: aiosmtplib.SMTP | None = None
+        self._last_used = 0.0
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        logger.info(f"Connecting to SMTP: {self.host}:{self.port}")
+        client = aiosmtplib.SMTP(hostname=self.host, port=self.port, timeout=self.timeout, start_tls=None)
+        try:
+            await client.connect()
+            if self.username:
+                await client.login(self.username, self.password)
+        except Exception as e:
+            client.close()
+            raise MailConnectionError(f"Could not connect to SMTP {self.host}:{self.port}: {e}") from e
+        return client
+
+    async def _get_client(self) -> aiosmtplib.SMTP:
+        idle = time.monotonic() - self._last_used
+        if self.client is not None and (not self.client.is_connected or idle > self.idle_timeout):
+            await self.close()
+        if self.client is None:
+            self.client = await self._connect()
+        return self.client
+
+    async def _send(self, message: EmailMessage) -> None:
+        client = await self._get_client()
+        try:
+            await client.send_message(message)
+        except aiosmtplib.SMTPServerDisconnected:
+            logger.warning("SMTP connection dropped, reconnecting")
+            self.client = None
+            client = await self._get_client()
+            await client.send_message(message)
+        self._last_used = time.monotonic()
+
+    async def send_batch(
+        self, messages: list[EmailMessage], on_result: ResultCallback | None = None
+    ) -> list[Exception | None]:
+        results: list[Exception | None] = []
+        connection_error: MailConnectionError | None = None
+        for index, message in enumerate(messages):
+            error = connection_error
+            if error is None:
+                try:
+                    await self._send(message)
+                except MailConnectionError as e:
+                    # The server is unreachable: fail the rest of the batch instead of timing out on each message.
+                    logger.error(f"{e}, failing {len(messages) - index} queued emails")
+                    error = connection_error = e
+                except Exception as e:
+                    logger.error(f"Failed to send email to {message['To']}: {e}")
+                    error = e
+            results.append(error)
+            if on_result is not None:
+                on_result(index, error)
+        return results
+
+    async def close(self) -> None:
+        if self.client is None:
+            return
+        client, self.client = self.client, None
+        try:
+            if client.is_connected:
+                await client.quit()
+        except aiosmtplib.SMTPException as e:
+            logger.warning(f"Error closing SMTP connection: {e}")
+            client.close()
+
+
+class MemoryBackend(MailBackend):
+    def __init__(self):
+        self.outbox: list[EmailMessage] = []
+
+    async def send_batch(
+        self, messages: list[EmailMessage], on_result: ResultCallback | None = None
+    ) -> list[Exception | None]:
+        self.outbox.extend(messages)
+        return [None] * len(messages)
+
+
+class FileBackend(MailBackend):
+    def __init__(self, directory: str = config.MAIL_FILE_PATH):
+        self.directory = Path(directory)
+
+    def _write(self, messages: list[EmailMessage]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for message in messages:
+            path = self.directory / f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex}.eml"
+            path.write_bytes(message.as_bytes())
+
+    async def send_batch(
+        self, messages: list[EmailMessage], on_result: ResultCallback | None = None
+    ) -> list[Exception | None]:
+        await asyncio.to_thread(self._write, messages)
+        return [None] * len(messages)
+
+
+MAIL_BACKENDS: dict[str, type[MailBackend]] = {
+    "smtp": SmtpBackend,
+    "memory": MemoryBackend,
+    "file": FileBackend,
+}
+
+
+def get_mail_backend(name: str = config.MAIL_BACKEND) -> MailBackend:
+    try:
+        return MAIL_BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown mail backend: {name}")
@@ -0,0 +1,85 @@
+import asyncio
+from email.message import EmailMessage
+from api.src.core.config import config
+from api.src.mail.backends import MailBackend, get_mail_backend
+from api.logging_config import logger
+
+
+def build_message(recipient: str, subject: str, text: str, use_html: bool = False) -> EmailMessage:
+    message = EmailMessage()
+    message["Subject"] = subject
+    message["From"] = config.SMTP_USER
+    message["To"] = recipient
+    message.set_content(text, subtype="html" if use_html else "plain")
+    return message
+
+
+class Mailer:
+    """Queues outgoing messages and hands them to the backend in batches over one connection."""
+
+    def __init__(self, backend: MailBackend | None = None, batch_size: int = config.MAIL_BATCH_SIZE):
+        self._backend = backend
+        self.batch_size = batch_size
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def backend(self) -> MailBackend:
+        if self._backend is None:
+            self._backend = get_mail_backend()
+        return self._backend
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        return self._queue
+
+    async def send(self, message: EmailMessage) -> None:
+        future = asyncio.get_running_loop().create_future()
+        await self._ensure_worker().put((message, future))
+        await future
+
+    async def _next_batch(self) -> list[tuple[EmailMessage, asyncio.Future]]:
+        batch = [await self._queue.get()]
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, error: Exception | None) -> None:
+        if future.done():
+            return
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                # Each sender is released as soon as its own message is done, not when the batch ends.
+                results = await self.backend.send_batch(
+                    [message for message, _ in batch],
+                    on_result=lambda index, error: self._resolve(batch[index][1], error),
+                )
+            except Exception as e:
+                results = [e] * len(batch)
+            for (_, future), error in zip(batch, results):
+                self._resolve(future, error)
+            logger.info(f"Mail batch of {len(batch)} processed")
+
+    async def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self._backend is not None:
+            await self._backend.close()
+
+
+mailer = Mailer()
@@ -0,0 +1,66 @@
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, meta, select_autoescape
+from api.src.core.config import config
+from api.logging_config import logger
+
+
+class EmailTemplates:
+    """Compiles every email template once per process; templates without variables are rendered once."""
+
+    def __init__(
+        self,
+        directory: str = config.EMAIL_TEMPLATES_DIR,
+        subdirectory: str = config.EMAIL_TEMPLATES_SUBDIR,
+        cache_dir: str | None = config.EMAIL_TEMPLATES_CACHE_DIR,
+        auto_reload: bool = config.EMAIL_TEMPLATES_RELOAD,
+    ):
+        self.subdirectory = subdirectory.strip("/")
+        self.auto_reload = auto_reload
+        self.environment = Environment(
+            loader=FileSystemLoader(directory),
+            autoescape=select_autoescape(["html"]),
+            bytecode_cache=FileSystemBytecodeCache(cache_dir) if cache_dir else FileSystemBytecodeCache(),
+            auto_reload=auto_reload,
+            cache_size=-1,
+        )
+        self._templates: dict[str, Template] = {}
+        self._static: dict[str, str] = {}
+        self._loaded = False
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        return name.lstrip("/")
+
+    def _compile(self, name: str) -> Template:
+        template = self.environment.get_template(name)
+        self._templates[name] = template
+        if not self.auto_reload:
+            source, _, _ = self.environment.loader.get_source(self.environment, name)
+            if not meta.find_undeclared_variables(self.environment.parse(source)):
+                self._static[name] = template.render()
+        return template
+
+    def load_all(self) -> None:
+        prefix = f"{self.subdirectory}/" if self.subdirectory else ""
+        names = self.environment.list_templates(filter_func=lambda name: name.startswith(prefix))
+        for name in names:
+            self._compile(name)
+        self._loaded = True
+        logger.info(f"Compiled {len(names)} email templates")
+
+    def get(self, name: str) -> Template:
+        if not self._loaded:
+            self.load_all()
+        name = self._normalize(name)
+        if self.auto_reload:
+            return self.environment.get_template(name)
+        template = self._templates.get(name)
+        return template if template is not None else self._compile(name)
+
+    def render(self, name: str, **context) -> str:
+        static = self._static.get(self._normalize(name))
+        if static is not None:
+            return static
+        return self.get(name).render(**context)
+
+
+email_templates = EmailTemplates()
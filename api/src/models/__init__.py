@@ -4,6 +4,7 @@ from .product import Product
 from .staff import Staff
 from .user_weight import UserWeight
 from .meal_products import MealProducts
+from .daily_nutrition import DailyNutrition
 from .brand import Brand
 from .family import Family, FamilyMember, FamilyInvitation, FamilyProduct, FamilyRole, InvitationStatus, FamilyNotification
 from .staff import Permission, Role, PermissionsEnum
@@ -15,6 +16,7 @@ __all__ = [
     'Staff',
     'UserWeight',
     'MealProducts',
+    'DailyNutrition',
     'Brand',
     'Family',
     'FamilyMember',
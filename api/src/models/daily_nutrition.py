@@ -0,0 +1,22 @@
+from datetime import date
+from sqlalchemy import Date, Double, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+from api.src.models.base import Base
+
+
+class DailyNutrition(Base):
+    __tablename__ = "daily_nutrition"
+
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    weight: Mapped[float] = mapped_column(Double, nullable=False, default=0)
+    calories: Mapped[float] = mapped_column(Double, nullable=False, default=0)
+    proteins: Mapped[float] = mapped_column(Double, nullable=False, default=0)
+    fats: Mapped[float] = mapped_column(Double, nullable=False, default=0)
+    carbohydrates: Mapped[float] = mapped_column(Double, nullable=False, default=0)
+    meal_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint('user_id', 'day', name='uq_daily_nutrition_user_day'),
+    )
@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID
-from sqlalchemy import String, Boolean, Text, ForeignKey, DateTime
+from sqlalchemy import String, Boolean, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.ext.hybrid import hybrid_property
@@ -70,8 +70,8 @@ class Family(Base):
 class FamilyMember(Base):
     __tablename__ = "family_members"
 
-    family_id: Mapped[UUID] = mapped_column(ForeignKey("families.id"), nullable=False)
-    user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"), nullable=False)
+    family_id: Mapped[UUID] = mapped_column(ForeignKey("families.id"), nullable=False, index=True)
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"), nullable=False, index=True)
     role: Mapped[FamilyRole] = mapped_column(SQLEnum(FamilyRole), default=FamilyRole.MEMBER)
 
     family: Mapped["Family"] = relationship("Family", back_populates="members")
@@ -122,7 +122,7 @@ class FamilyInvitation(Base):
 class FamilyProduct(Base):
     __tablename__ = "family_products"
 
-    family_id: Mapped[UUID] = mapped_column(ForeignKey("families.id"), nullable=False)
+    family_id: Mapped[UUID] = mapped_column(ForeignKey("families.id"), nullable=False, index=True)
     product_id: Mapped[UUID] = mapped_column(ForeignKey("product.id"), nullable=False)
     added_by: Mapped[UUID] = mapped_column(ForeignKey("user.id"), nullable=False)
 
@@ -144,6 +144,9 @@ class FamilyProduct(Base):
 
 class FamilyNotification(Base):
     __tablename__ = "family_notifications"
+    __table_args__ = (
+        Index("ix_family_notifications_user_id_is_read_created_at", "user_id", "is_read", "created_at"),
+    )
 
     user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"), nullable=False)
     family_id: Mapped[UUID] = mapped_column(ForeignKey("families.id"), nullable=False)
@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import String, ForeignKey, Double
+from sqlalchemy import String, ForeignKey, Double, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID
 from api.src.models.base import Base
@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 
 class Meal(Base):
     __tablename__ = "meal"
+    __table_args__ = (
+        Index("ix_meal_created_at", "created_at"),
+    )
 
     name: Mapped[str] = mapped_column(String, index=True, nullable=False)
     weight: Mapped[float] = mapped_column(Double, nullable=False)
@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import String, Boolean, ForeignKey, Double, JSON
+from sqlalchemy import String, Boolean, ForeignKey, Double, JSON, Index, DDL, event
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID
@@ -14,8 +14,19 @@ if TYPE_CHECKING:
     from api.src.models.family import FamilyProduct
 
 
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+
 class Product(Base):
     __tablename__ = "product"
+    __table_args__ = (
+        Index(
+            "ix_product_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     slug: Mapped[str] = mapped_column(String(1200), unique=True, nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
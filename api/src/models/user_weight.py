@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import Double, ForeignKey
+from sqlalchemy import Double, ForeignKey, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID
 from api.src.models.base import Base
@@ -11,6 +11,10 @@ if TYPE_CHECKING:
 
 class UserWeight(Base):
     __tablename__ = 'user_weight'
+    __table_args__ = (
+        Index('ix_user_weight_user_id_created_at', 'user_id', 'created_at'),
+        Index('ix_user_weight_created_at', 'created_at'),
+    )
 
     user_id: Mapped[UUID] = mapped_column(
         ForeignKey('user.id'),
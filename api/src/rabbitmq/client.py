@@ -17,7 +17,7 @@ class RabbitMQClient:
             virtualhost=config.RABBITMQ_DEFAULT_VHOST,
             port=config.RABBITMQ_DEFAULT_PORT,
         )
-        self.channel = await self.connection.channel()
+        self.channel = await self.connection.channel(publisher_confirms=True)
         logger.info("RabbitMQClient connected")
 
     async def close(self):
@@ -26,11 +26,11 @@ class RabbitMQClient:
             await self.channel.close()
             logger.info("RabbitMQClient disconnected")
 
-    async def declare_queue(self, queue_name, durable=True):
+    async def declare_queue(self, queue_name, durable=True, arguments=None):
         if not self.channel:
             raise RabbitMQChannelError
         logger.info(f"RabbitMQClient declare_queue with name: {queue_name}")
-        return await self.channel.declare_queue(queue_name, durable=durable)
+        return await self.channel.declare_queue(queue_name, durable=durable, arguments=arguments)
 
 
 rabbitmq_client = RabbitMQClient()
@@ -1,43 +1,164 @@
+import asyncio
 import json
-from aio_pika import IncomingMessage
-from .client import rabbitmq_client
+from typing import Awaitable, Callable
+from aio_pika import IncomingMessage, Message
+from aio_pika.abc import AbstractQueue
+from .client import RabbitMQClient, rabbitmq_client
+from api.src.core.config import config
 from api.logging_config import logger
 from ..fone_tasks.verification import send_mail
 
+MessageHandler = Callable[[dict], Awaitable[None]]
 
-async def process_message(message: IncomingMessage):
-    try:
-        data = json.loads(message.body.decode())
-        logger.info(f'Processing message: {data}')
+DEFAULT_MESSAGE_TYPE = "registration"
+RETRY_HEADER = "x-retry-count"
 
-        if not data.get("email"):
-            logger.error("No email in message")
-            await message.reject(requeue=False)
-            return
 
-        send_mail(
-            recipient=data["email"],
-            subject="Welcome to Food Diary!",
-            template_name="registration_email_notification.html",
-            context={"user_name": data.get("login", "")}
+class DeadLetter(Exception):
+    pass
+
+
+class ConsumerEngine:
+    def __init__(
+        self,
+        client: RabbitMQClient = rabbitmq_client,
+        prefetch_count: int = config.RABBITMQ_PREFETCH_COUNT,
+        concurrency: int = config.RABBITMQ_CONSUMER_CONCURRENCY,
+        max_retries: int = config.RABBITMQ_MAX_RETRIES,
+        retry_delay: float = config.RABBITMQ_RETRY_DELAY,
+    ):
+        self.client = client
+        self.prefetch_count = prefetch_count
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._handlers: dict[str, MessageHandler] = {}
+        self._pending: asyncio.Queue | None = None
+        self._workers: list[asyncio.Task] = []
+        self._queue: AbstractQueue | None = None
+        self._consumer_tag: str | None = None
+
+    def register(self, message_type: str) -> Callable[[MessageHandler], MessageHandler]:
+        def decorator(handler: MessageHandler) -> MessageHandler:
+            self._handlers[message_type] = handler
+            return handler
+
+        return decorator
+
+    async def start(self, queue_name: str) -> None:
+        if not self.client.channel:
+            raise RuntimeError("RabbitMQ client is not connected")
+
+        await self.client.channel.set_qos(prefetch_count=self.prefetch_count)
+        self._queue = await self.client.declare_queue(queue_name, durable=True)
+        await self.client.declare_queue(f"{queue_name}.dead", durable=True)
+        # One delay queue per attempt: messages sit there for the attempt's TTL and are then
+        # dead-lettered back to the main queue, giving an exponential backoff between retries.
+        for attempt in range(1, self.max_retries + 1):
+            await self.client.declare_queue(
+                self._retry_queue(queue_name, attempt),
+                durable=True,
+                arguments={
+                    "x-message-ttl": int(self.retry_delay * 2 ** (attempt - 1) * 1000),
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": queue_name,
+                },
+            )
+
+        self._pending = asyncio.Queue(maxsize=self.concurrency)
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.concurrency)]
+        self._consumer_tag = await self._queue.consume(self._pending.put)
+        logger.info(
+            f"Started consuming messages from {queue_name} "
+            f"(prefetch={self.prefetch_count}, concurrency={self.concurrency})"
         )
 
-        await message.ack()
-        logger.info("Email sent successfully")
+    async def stop(self) -> None:
+        if self._queue is not None and self._consumer_tag is not None:
+            await self._queue.cancel(self._consumer_tag)
+            self._consumer_tag = None
+        if self._pending is not None:
+            await self._pending.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("Consumer drained and stopped")
+
+    async def _work(self) -> None:
+        while True:
+            message = await self._pending.get()
+            try:
+                await self.process_message(message)
+            finally:
+                self._pending.task_done()
+
+    async def process_message(self, message: IncomingMessage) -> None:
+        try:
+            data = json.loads(message.body.decode())
+            message_type = data.get("type", DEFAULT_MESSAGE_TYPE)
+            handler = self._handlers.get(message_type)
+            if handler is None:
+                raise DeadLetter(f"No handler for message type {message_type}")
+            await handler(data)
+            await message.ack()
+        except (json.JSONDecodeError, DeadLetter) as e:
+            logger.error(f"Dead-lettering message: {e}")
+            await self._dead_letter(message, str(e))
+        except Exception as e:
+            logger.error(f"Error processing message: {e}")
+            await self._retry(message, str(e))
+
+    async def _retry(self, message: IncomingMessage, reason: str) -> None:
+        retries = int((message.headers or {}).get(RETRY_HEADER, 0))
+        if retries >= self.max_retries:
+            await self._dead_letter(message, reason)
+            return
+        await self._republish(
+            message, self._retry_queue(message.routing_key, retries + 1), {RETRY_HEADER: retries + 1}
+        )
+
+    @staticmethod
+    def _retry_queue(queue_name: str, attempt: int) -> str:
+        return f"{queue_name}.retry.{attempt}"
+
+    async def _dead_letter(self, message: IncomingMessage, reason: str) -> None:
+        await self._republish(message, f"{message.routing_key}.dead", {"x-error": reason})
+
+    async def _republish(self, message: IncomingMessage, routing_key: str, headers: dict) -> None:
+        try:
+            await self.client.channel.default_exchange.publish(
+                Message(
+                    body=message.body,
+                    headers={**(message.headers or {}), **headers},
+                    content_type=message.content_type,
+                    delivery_mode=message.delivery_mode,
+                ),
+                routing_key=routing_key,
+            )
+            await message.ack()
+        except Exception as e:
+            logger.error(f"Failed to republish message to {routing_key}: {e}")
+            await message.nack(requeue=True)
+
+
+consumer_engine = ConsumerEngine()
+
 
-    except json.JSONDecodeError:
-        logger.error("Invalid JSON format")
-        await message.reject(requeue=False)
-    except Exception as e:
-        logger.error(f"Error processing message: {e}")
-        await message.reject(requeue=True)
+@consumer_engine.register(DEFAULT_MESSAGE_TYPE)
+async def handle_registration(data: dict) -> None:
+    if not data.get("email"):
+        raise DeadLetter("No email in message")
 
+    logger.info(f"Sending welcome email to {data['email']}")
+    await send_mail(
+        recipient=data["email"],
+        subject="Welcome to Food Diary!",
+        template_name="email_notifications/registration_email_notification.html",
+        context={"user_name": data.get("login", "")}
+    )
 
-async def consume_messages(queue_name: str = "registration_queue"):
-    if not rabbitmq_client.channel:
-        raise RuntimeError("RabbitMQ client is not connected")
 
-    queue = await rabbitmq_client.declare_queue(queue_name, durable=True)
-    print(f"Started consuming messages from {queue_name}")
-    logger.info(f"Started consuming messages from {queue_name}")
-    await queue.consume(process_message)
+async def consume_messages(queue_name: str = "registration_queue") -> ConsumerEngine:
+    await consumer_engine.start(queue_name)
+    return consumer_engine
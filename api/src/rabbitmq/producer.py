@@ -1,18 +1,129 @@
-from aio_pika import Message
-from .client import rabbitmq_client
-import json
+import asyncio
+from dataclasses import dataclass
+import orjson
+from aio_pika import DeliveryMode, Message
+from .client import RabbitMQClient, rabbitmq_client
+from api.src.core.config import config
 from api.logging_config import logger
 
 
-async def publish_message(message_data: dict, queue_name: str):
-    if not rabbitmq_client.channel:
-        raise RuntimeError("RabbitMQ client is not connected")
+@dataclass(slots=True)
+class PendingMessage:
+    body: bytes
+    queue_name: str
+    persistent: bool
+    attempts: int = 0
+
+
+class Publisher:
+    """Buffers messages in memory and publishes them in confirmed batches by size or time."""
+
+    def __init__(
+        self,
+        client: RabbitMQClient = rabbitmq_client,
+        batch_size: int = config.RABBITMQ_PUBLISH_BATCH_SIZE,
+        flush_interval: float = config.RABBITMQ_PUBLISH_FLUSH_INTERVAL,
+        persistent: bool = config.RABBITMQ_PUBLISH_PERSISTENT,
+        max_attempts: int = config.RABBITMQ_MAX_RETRIES,
+        max_buffer: int = config.RABBITMQ_PUBLISH_MAX_BUFFER,
+    ):
+        self.client = client
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.persistent = persistent
+        self.max_attempts = max_attempts
+        self.max_buffer = max_buffer
+        self._buffer: list[PendingMessage] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushing: set[asyncio.Task] = set()
+
+    def publish(self, message_data: dict, queue_name: str, persistent: bool | None = None) -> None:
+        self.publish_many([message_data], queue_name, persistent)
+
+    def publish_many(self, messages: list[dict], queue_name: str, persistent: bool | None = None) -> None:
+        if not self.client.channel:
+            raise RuntimeError("RabbitMQ client is not connected")
+        if len(self._buffer) + len(messages) > self.max_buffer:
+            logger.error(f"Publish buffer is full ({len(self._buffer)} messages), rejecting {len(messages)} messages")
+            raise RuntimeError("RabbitMQ publish buffer is full")
+
+        persistent = self.persistent if persistent is None else persistent
+        self._buffer.extend(PendingMessage(orjson.dumps(data), queue_name, persistent) for data in messages)
+        if len(self._buffer) >= self.batch_size:
+            self._schedule_flush()
+        else:
+            self._arm_timer()
+
+    def _arm_timer(self) -> None:
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.flush_interval, self._schedule_flush)
+
+    def _schedule_flush(self) -> None:
+        self._cancel_timer()
+        task = asyncio.create_task(self.flush())
+        self._flushing.add(task)
+        task.add_done_callback(self._flushing.discard)
+
+    async def _publish(self, pending: PendingMessage) -> None:
+        await self.client.channel.default_exchange.publish(
+            Message(
+                body=pending.body,
+                content_type="application/json",
+                delivery_mode=DeliveryMode.PERSISTENT if pending.persistent else DeliveryMode.NOT_PERSISTENT,
+            ),
+            routing_key=pending.queue_name,
+        )
 
-    message_body = json.dumps(message_data).encode()
+    async def flush(self) -> int:
+        confirmed = 0
+        while self._buffer:
+            if not self.client.channel:
+                logger.error(f"RabbitMQ client is not connected, {len(self._buffer)} messages kept in buffer")
+                self._arm_timer()
+                break
 
-    await rabbitmq_client.channel.default_exchange.publish(
-        Message(body=message_body),
-        routing_key=queue_name
-    )
-    print(f"Message published to queue {queue_name}: {message_data}")
-    logger.info(f'Message published to queue {queue_name}: {message_data}')
+            batch, self._buffer = self._buffer[:self.batch_size], self._buffer[self.batch_size:]
+            results = await asyncio.gather(*(self._publish(pending) for pending in batch), return_exceptions=True)
+
+            failed = []
+            for pending, result in zip(batch, results):
+                if not isinstance(result, Exception):
+                    confirmed += 1
+                    continue
+                pending.attempts += 1
+                if pending.attempts < self.max_attempts:
+                    failed.append(pending)
+                else:
+                    logger.error(f"Dropping message for {pending.queue_name} after {pending.attempts} attempts: {result}")
+
+            if failed:
+                logger.warning(f"{len(failed)} of {len(batch)} messages were not confirmed, retrying later")
+                self._buffer[:0] = failed
+                self._arm_timer()
+                break
+
+        if confirmed:
+            logger.info(f"Published {confirmed} messages")
+        return confirmed
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    async def close(self) -> None:
+        self._cancel_timer()
+        if self._flushing:
+            await asyncio.gather(*self._flushing, return_exceptions=True)
+        if self._buffer and self.client.channel:
+            await self.flush()
+        self._cancel_timer()
+        if self._buffer:
+            logger.error(f"Publisher closed with {len(self._buffer)} unpublished messages")
+
+
+publisher = Publisher()
+
+
+async def publish_message(message_data: dict, queue_name: str):
+    publisher.publish(message_data, queue_name)
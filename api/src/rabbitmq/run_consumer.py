@@ -1,20 +1,30 @@
 import asyncio
+import signal
 from api.src.rabbitmq.consumer import consume_messages
 from api.src.rabbitmq.client import rabbitmq_client
+from api.src.mail.mailer import mailer
 from api.logging_config import logger
 
 
 async def main():
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
+    engine = None
     try:
         await rabbitmq_client.connect()
-        await consume_messages()
-
-        while True:
-            await asyncio.sleep(1)
+        engine = await consume_messages()
+        await stop.wait()
+        logger.info("Shutdown requested, draining consumer")
     except Exception as e:
         logger.error(f"Consumer failed: {e}")
     finally:
+        if engine is not None:
+            await engine.stop()
         await rabbitmq_client.close()
+        await mailer.close()
 
 
 if __name__ == "__main__":
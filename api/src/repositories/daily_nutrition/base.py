@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from api.src.models.daily_nutrition import DailyNutrition
+
+
+class BaseDailyNutritionRepository(ABC):
+    @abstractmethod
+    async def apply_delta(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        day: date,
+        weight: float,
+        calories: float,
+        proteins: float,
+        fats: float,
+        carbohydrates: float,
+        meal_count: int = 0
+    ) -> None: ...
+
+    @abstractmethod
+    async def apply_deltas(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        deltas: dict[date, dict[str, float]]
+    ) -> None: ...
+
+    @abstractmethod
+    async def get_range(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        date_from: date,
+        date_to: date
+    ) -> list[DailyNutrition]: ...
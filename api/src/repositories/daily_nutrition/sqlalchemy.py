@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from datetime import date
+from uuid import UUID
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from api.src.models.base import generate_uuid
+from api.src.models.daily_nutrition import DailyNutrition
+from api.src.repositories.daily_nutrition.base import BaseDailyNutritionRepository
+
+
+DELTA_COLUMNS = ("weight", "calories", "proteins", "fats", "carbohydrates", "meal_count")
+
+
+@dataclass(slots=True)
+class SqlAlchemyDailyNutritionRepository(BaseDailyNutritionRepository):
+    async def apply_delta(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        day: date,
+        weight: float,
+        calories: float,
+        proteins: float,
+        fats: float,
+        carbohydrates: float,
+        meal_count: int = 0
+    ) -> None:
+        await self.apply_deltas(session, user_id, {
+            day: {
+                "weight": weight,
+                "calories": calories,
+                "proteins": proteins,
+                "fats": fats,
+                "carbohydrates": carbohydrates,
+                "meal_count": meal_count,
+            }
+        })
+
+    async def apply_deltas(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        deltas: dict[date, dict[str, float]]
+    ) -> None:
+        if not deltas:
+            return
+
+        stmt = insert(DailyNutrition).values([
+            {"id": generate_uuid(), "user_id": user_id, "day": day, **values}
+            for day, values in deltas.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_daily_nutrition_user_day",
+            set_={
+                **{key: getattr(DailyNutrition, key) + getattr(stmt.excluded, key) for key in DELTA_COLUMNS},
+                "updated_at": func.timezone("UTC", func.now()),
+            },
+        )
+        await session.execute(stmt)
+
+    async def get_range(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        date_from: date,
+        date_to: date
+    ) -> list[DailyNutrition]:
+        query = (
+            select(DailyNutrition)
+            .where(
+                DailyNutrition.user_id == user_id,
+                DailyNutrition.day.between(date_from, date_to),
+            )
+            .order_by(DailyNutrition.day)
+        )
+        result = await session.execute(query)
+        return list(result.scalars().all())
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.src.models.family import Family, FamilyMember, FamilyProduct, FamilyInvitation, InvitationStatus, FamilyRole, \
@@ -13,7 +14,10 @@ class BaseFamilyRepository(ABC):
     async def get_family_by_id(self, session: AsyncSession, family_id: UUID) -> Family | None: ...
 
     @abstractmethod
-    async def get_user_families(self, session: AsyncSession, user_id: UUID) -> list[Family]: ...
+    async def get_user_families(self, session: AsyncSession, user_id: UUID) -> list[tuple[Family, int, int]]: ...
+
+    @abstractmethod
+    async def get_family_with_counts(self, session: AsyncSession, family_id: UUID) -> tuple[Family, int, int] | None: ...
 
     @abstractmethod
     async def update_family(self, session: AsyncSession, family: Family, update_data: dict) -> Family: ...
@@ -53,6 +57,9 @@ class BaseFamilyMemberRepository(ABC):
     @abstractmethod
     async def get_family_members(self, session: AsyncSession, family_id: UUID) -> list[FamilyMember]: ...
 
+    @abstractmethod
+    async def get_member_user_ids(self, session: AsyncSession, family_id: UUID) -> list[UUID]: ...
+
     @abstractmethod
     async def get_user_memberships(self, session: AsyncSession, user_id: UUID) -> list[FamilyMember]: ...
 
@@ -92,13 +99,18 @@ class BaseFamilyNotificationRepository(ABC):
     @abstractmethod
     async def create_notification(self, session: AsyncSession, notification_data: dict) -> FamilyNotification: ...
 
+    @abstractmethod
+    async def create_notifications(self, session: AsyncSession,
+                                   notifications_data: list[dict]) -> list[FamilyNotification]: ...
+
     @abstractmethod
     async def get_notification_by_id(self, session: AsyncSession,
                                      notification_id: UUID) -> FamilyNotification | None: ...
 
     @abstractmethod
-    async def get_user_notifications(self, session: AsyncSession, user_id: UUID, is_read: bool | None = None) -> list[
-        FamilyNotification]: ...
+    async def get_user_notifications(self, session: AsyncSession, user_id: UUID, is_read: bool | None = None,
+                                     limit: int | None = None,
+                                     after: tuple[datetime, UUID] | None = None) -> list[FamilyNotification]: ...
 
     @abstractmethod
     async def get_family_notifications(self, session: AsyncSession, family_id: UUID) -> list[FamilyNotification]: ...
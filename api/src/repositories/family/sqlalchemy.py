@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from uuid import UUID
-from sqlalchemy import select, and_, or_, delete, func, update
+from sqlalchemy import Select, select, and_, or_, delete, func, insert, update, tuple_
 from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.src.models.family import Family, FamilyMember, FamilyInvitation, InvitationStatus, FamilyRole, FamilyProduct, \
@@ -21,37 +21,41 @@ class SqlAlchemyFamilyRepository(BaseFamilyRepository):
         return await self._crud.insert(session, family)
 
     async def get_family_by_id(self, session: AsyncSession, family_id: UUID) -> Family | None:
-        result = await session.execute(
-            select(Family)
-            .options(joinedload(Family.members), joinedload(Family.shared_products))
-            .where(Family.id == family_id)
-        )
-        return result.unique().scalar_one_or_none()
+        result = await session.execute(select(Family).where(Family.id == family_id))
+        return result.scalar_one_or_none()
 
-    async def get_user_families(self, session: AsyncSession, user_id: UUID) -> list[Family]:
-        created_families_result = await session.execute(
-            select(Family)
-            .options(joinedload(Family.members), joinedload(Family.shared_products))
-            .where(Family.created_by == user_id)
+    @staticmethod
+    def _with_counts() -> Select:
+        members_count = (
+            select(func.count(FamilyMember.id))
+            .where(FamilyMember.family_id == Family.id)
+            .correlate(Family)
+            .scalar_subquery()
         )
-
-        member_families_result = await session.execute(
-            select(Family)
-            .options(joinedload(Family.members), joinedload(Family.shared_products))
-            .join(FamilyMember)
-            .where(
-                FamilyMember.user_id == user_id,
-                Family.is_active == True
-            )
+        products_count = (
+            select(func.count(FamilyProduct.id))
+            .where(FamilyProduct.family_id == Family.id)
+            .correlate(Family)
+            .scalar_subquery()
         )
+        return select(Family, members_count, products_count)
 
-        created_families = created_families_result.unique().scalars().all()
-        member_families = member_families_result.unique().scalars().all()
+    async def get_family_with_counts(self, session: AsyncSession, family_id: UUID) -> tuple[Family, int, int] | None:
+        result = await session.execute(self._with_counts().where(Family.id == family_id))
+        row = result.one_or_none()
+        return tuple(row) if row else None
 
-        # Объединяем и удаляем дубликаты по ID
-        all_families = list(created_families) + list(member_families)
-        unique_families = {family.id: family for family in all_families}.values()
-        return list(unique_families)
+    async def get_user_families(self, session: AsyncSession, user_id: UUID) -> list[tuple[Family, int, int]]:
+        memberships = select(FamilyMember.family_id).where(FamilyMember.user_id == user_id)
+        result = await session.execute(
+            self._with_counts()
+            .where(or_(
+                Family.created_by == user_id,
+                and_(Family.id.in_(memberships), Family.is_active == True)
+            ))
+            .order_by(Family.created_at)
+        )
+        return [tuple(row) for row in result.all()]
 
     async def update_family(self, session: AsyncSession, family: Family, update_data: dict) -> Family:
         for key, value in update_data.items():
@@ -141,6 +145,12 @@ class SqlAlchemyFamilyMemberRepository(BaseFamilyMemberRepository):
         )
         return list(result.scalars().all())
 
+    async def get_member_user_ids(self, session: AsyncSession, family_id: UUID) -> list[UUID]:
+        result = await session.execute(
+            select(FamilyMember.user_id).where(FamilyMember.family_id == family_id)
+        )
+        return list(result.scalars().all())
+
     async def get_user_memberships(self, session: AsyncSession, user_id: UUID) -> list[FamilyMember]:
         result = await session.execute(
             select(FamilyMember)
@@ -228,15 +238,30 @@ class SqlAlchemyFamilyNotificationRepository(BaseFamilyNotificationRepository):
         notification = FamilyNotification(**notification_data)
         return await self._crud.insert(session, notification)
 
+    async def create_notifications(self, session: AsyncSession,
+                                   notifications_data: list[dict]) -> list[FamilyNotification]:
+        if not notifications_data:
+            return []
+        result = await session.scalars(
+            insert(FamilyNotification).returning(FamilyNotification),
+            notifications_data,
+        )
+        return list(result.all())
+
     async def get_notification_by_id(self, session: AsyncSession, notification_id: UUID) -> FamilyNotification | None:
         result = await session.execute(
             select(FamilyNotification)
-            .options(joinedload(FamilyNotification.family), joinedload(FamilyNotification.invitation))
+            .options(
+                joinedload(FamilyNotification.family),
+                joinedload(FamilyNotification.invitation).joinedload(FamilyInvitation.inviter)
+            )
             .where(FamilyNotification.id == notification_id)
         )
         return result.scalar_one_or_none()
 
-    async def get_user_notifications(self, session: AsyncSession, user_id: UUID, is_read: bool | None = None) -> list[FamilyNotification]:
+    async def get_user_notifications(self, session: AsyncSession, user_id: UUID, is_read: bool | None = None,
+                                     limit: int | None = None,
+                                     after: tuple[datetime, UUID] | None = None) -> list[FamilyNotification]:
         query = select(FamilyNotification).options(
             joinedload(FamilyNotification.family),
             joinedload(FamilyNotification.invitation).joinedload(FamilyInvitation.inviter)
@@ -244,8 +269,10 @@ class SqlAlchemyFamilyNotificationRepository(BaseFamilyNotificationRepository):
 
         if is_read is not None:
             query = query.where(FamilyNotification.is_read == is_read)
+        if after is not None:
+            query = query.where(tuple_(FamilyNotification.created_at, FamilyNotification.id) < after)
 
-        query = query.order_by(FamilyNotification.created_at.desc())
+        query = query.order_by(FamilyNotification.created_at.desc(), FamilyNotification.id.desc()).limit(limit)
 
         result = await session.execute(query)
         return list(result.scalars().all())
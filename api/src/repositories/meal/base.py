@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import date
+from typing import Iterable
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.src.models.meal import Meal
@@ -25,6 +26,15 @@ class BaseMealRepository(ABC):
         user_id: UUID
     ) -> Meal | None: ...
 
+    @abstractmethod
+    async def get_user_meals_by_ids(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        meal_ids: Iterable[UUID],
+        for_update: bool = False
+    ) -> list[Meal]: ...
+
     @abstractmethod
     async def get_meals_by_date(
         self,
@@ -48,6 +58,20 @@ class BaseMealRepository(ABC):
         meal_data: dict
     ) -> Meal: ...
 
+    @abstractmethod
+    async def create_meals(
+        self,
+        session: AsyncSession,
+        meals_data: list[dict]
+    ) -> list[Meal]: ...
+
+    @abstractmethod
+    async def delete_meals(
+        self,
+        session: AsyncSession,
+        meal_ids: Iterable[UUID]
+    ) -> None: ...
+
     @abstractmethod
     async def delete_meal_products(
         self,
@@ -58,5 +82,8 @@ class BaseMealRepository(ABC):
     @abstractmethod
     async def get_by_id(self, session: AsyncSession, meal_id: UUID) -> Meal | None: ...
 
+    @abstractmethod
+    async def get_by_id_for_update(self, session: AsyncSession, meal_id: UUID) -> Meal | None: ...
+
     @abstractmethod
     async def delete(self, session: AsyncSession, meal_id: UUID) -> None: ...
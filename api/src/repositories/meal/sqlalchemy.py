@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from datetime import date, timedelta, datetime, time
+from typing import Iterable
 from uuid import UUID
-from sqlalchemy import select, and_, delete, cast, Date
+from sqlalchemy import select, and_, delete, insert, cast, Date
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from api.src.models.meal import Meal
@@ -64,10 +65,40 @@ class SqlAlchemyMealRepository(BaseMealRepository):
                 Meal.id == meal_id,
                 Meal.user_id == user_id
             ))
+            .execution_options(populate_existing=True)
         )
         result = await session.execute(query)
         return result.unique().scalar_one_or_none()
 
+    async def get_user_meals_by_ids(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        meal_ids: Iterable[UUID],
+        for_update: bool = False
+    ) -> list[Meal]:
+        meal_ids = set(meal_ids)
+        if not meal_ids:
+            return []
+
+        query = (
+            select(Meal)
+            .options(
+                joinedload(Meal.meal_products)
+                .joinedload(MealProducts.product)
+            )
+            .where(and_(
+                Meal.id.in_(meal_ids),
+                Meal.user_id == user_id
+            ))
+            .execution_options(populate_existing=True)
+        )
+        if for_update:
+            # Lock only the meal rows (not the joined products), in a stable order to avoid deadlocks.
+            query = query.order_by(Meal.id).with_for_update(of=Meal)
+        result = await session.execute(query)
+        return list(result.unique().scalars().all())
+
     async def get_meals_by_date(
         self,
         session: AsyncSession,
@@ -125,6 +156,27 @@ class SqlAlchemyMealRepository(BaseMealRepository):
         meal = Meal(**meal_data)
         return await self._crud.insert(session, meal)
 
+    async def create_meals(
+        self,
+        session: AsyncSession,
+        meals_data: list[dict]
+    ) -> list[Meal]:
+        if not meals_data:
+            return []
+        result = await session.scalars(insert(Meal).returning(Meal, sort_by_parameter_order=True), meals_data)
+        return list(result.all())
+
+    async def delete_meals(
+        self,
+        session: AsyncSession,
+        meal_ids: Iterable[UUID]
+    ) -> None:
+        meal_ids = set(meal_ids)
+        if not meal_ids:
+            return
+        await session.execute(delete(MealProducts).where(MealProducts.meal_id.in_(meal_ids)))
+        await session.execute(delete(Meal).where(Meal.id.in_(meal_ids)))
+
     async def delete_meal_products(
         self,
         session: AsyncSession,
@@ -138,5 +190,15 @@ class SqlAlchemyMealRepository(BaseMealRepository):
     async def get_by_id(self, session: AsyncSession, meal_id: UUID) -> Meal | None:
         return await self._crud.get_by_id(session, meal_id)
 
+    async def get_by_id_for_update(self, session: AsyncSession, meal_id: UUID) -> Meal | None:
+        query = (
+            select(Meal)
+            .where(Meal.id == meal_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        result = await session.execute(query)
+        return result.scalar_one_or_none()
+
     async def delete(self, session: AsyncSession, meal_id: UUID) -> None:
         await self._crud.delete(session, meal_id)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.src.models.meal_products import MealProducts
@@ -39,3 +40,27 @@ class BaseMealProductsRepository(ABC):
         session: AsyncSession,
         meal_product: MealProducts
     ) -> None: ...
+
+    @abstractmethod
+    async def get_missing_product_ids(
+        self,
+        session: AsyncSession,
+        product_ids: Iterable[UUID]
+    ) -> set[UUID]: ...
+
+    @abstractmethod
+    async def sync_meal_products(
+        self,
+        session: AsyncSession,
+        meal_id: UUID,
+        product_weights: dict[UUID, float],
+        delete_missing: bool = True
+    ) -> None: ...
+
+    @abstractmethod
+    async def sync_many_meal_products(
+        self,
+        session: AsyncSession,
+        product_weights_by_meal: dict[UUID, dict[UUID, float]],
+        delete_missing: bool = True
+    ) -> None: ...
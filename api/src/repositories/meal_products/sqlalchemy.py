@@ -1,8 +1,12 @@
 from dataclasses import dataclass
+from typing import Iterable
 from uuid import UUID
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, delete, func, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from api.src.models.base import generate_uuid
 from api.src.models.meal_products import MealProducts
+from api.src.models.product import Product
 from api.src.repositories.meal_products.base import BaseMealProductsRepository
 from api.src.repositories.crud import CrudOperations
 
@@ -63,3 +67,67 @@ class SqlAlchemyMealProductsRepository(BaseMealProductsRepository):
         meal_product: MealProducts
     ) -> None:
         await self._crud.delete(session, meal_product.id)
+
+
+    async def get_missing_product_ids(
+        self,
+        session: AsyncSession,
+        product_ids: Iterable[UUID]
+    ) -> set[UUID]:
+        requested_ids = set(product_ids)
+        if not requested_ids:
+            return set()
+
+        result = await session.execute(select(Product.id).where(Product.id.in_(requested_ids)))
+        return requested_ids - set(result.scalars().all())
+
+    async def sync_meal_products(
+        self,
+        session: AsyncSession,
+        meal_id: UUID,
+        product_weights: dict[UUID, float],
+        delete_missing: bool = True
+    ) -> None:
+        await self.sync_many_meal_products(session, {meal_id: product_weights}, delete_missing)
+
+    async def sync_many_meal_products(
+        self,
+        session: AsyncSession,
+        product_weights_by_meal: dict[UUID, dict[UUID, float]],
+        delete_missing: bool = True
+    ) -> None:
+        if not product_weights_by_meal:
+            return
+
+        pairs = [
+            (meal_id, product_id)
+            for meal_id, product_weights in product_weights_by_meal.items()
+            for product_id in product_weights
+        ]
+        if delete_missing:
+            delete_stmt = delete(MealProducts).where(MealProducts.meal_id.in_(product_weights_by_meal.keys()))
+            if pairs:
+                delete_stmt = delete_stmt.where(tuple_(MealProducts.meal_id, MealProducts.product_id).not_in(pairs))
+            await session.execute(delete_stmt)
+
+        if not pairs:
+            return
+
+        insert_stmt = insert(MealProducts).values([
+            {
+                "id": generate_uuid(),
+                "meal_id": meal_id,
+                "product_id": product_id,
+                "product_weight": product_weights_by_meal[meal_id][product_id],
+            }
+            for meal_id, product_id in pairs
+        ])
+        await session.execute(
+            insert_stmt.on_conflict_do_update(
+                constraint="uq_meal_product",
+                set_={
+                    "product_weight": insert_stmt.excluded.product_weight,
+                    "updated_at": func.timezone("UTC", func.now()),
+                },
+            )
+        )
@@ -0,0 +1,75 @@
+import asyncio
+import mimetypes
+import shutil
+import uuid
+from os.path import splitext
+from pathlib import Path
+import aiohttp
+from fastapi import UploadFile
+from uuid_utils import uuid7
+from api.src.repositories.objects.base import BaseObjectRepository
+from api.src.repositories.objects.s3 import read_up_to
+from api.src.core.config import config
+
+
+class FileSystemObjectRepository(BaseObjectRepository):
+    def __init__(self, root: str = config.OBJECT_STORAGE_PATH, base_url: str = config.OBJECT_STORAGE_URL):
+        self.root = Path(root)
+        self.base_url = base_url.rstrip("/")
+
+    def _path(self, filename: str) -> Path:
+        path = (self.root / filename).resolve()
+        if self.root.resolve() not in path.parents:
+            raise ValueError(f"Invalid object name: {filename}")
+        return path
+
+    def _write(self, filename: str, source) -> None:
+        path = self._path(filename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as destination:
+            if isinstance(source, bytes):
+                destination.write(source)
+            else:
+                shutil.copyfileobj(source, destination)
+
+    async def add(self, file: UploadFile, file_key: str | None = None) -> str:
+        if file.filename is None:
+            raise ValueError("Filename is required")
+
+        filename = (file_key or str(uuid7())) + splitext(file.filename)[1]
+        await asyncio.to_thread(self._write, filename, file.file)
+        return filename
+
+    async def add_via_link(
+        self, link: str, content_type: str, file_key: str | None = None
+    ) -> str:
+        filename = (file_key or str(uuid7())) + (mimetypes.guess_extension(content_type) or "")
+
+        async with aiohttp.ClientSession() as session:
+            async with session.get(link) as response:
+                if response.status != 200:
+                    raise ValueError(
+                        f"Failed to download file from URL {link} with status {response.status}"
+                    )
+                data = await read_up_to(response.content, config.REMOTE_FILE_MAX_SIZE + 1)
+                if len(data) > config.REMOTE_FILE_MAX_SIZE:
+                    raise ValueError(f"File from URL {link} exceeds {config.REMOTE_FILE_MAX_SIZE} bytes")
+                await asyncio.to_thread(self._write, filename, data)
+
+        return filename
+
+    def get_url(self, filename: str) -> str:
+        return f"{self.base_url}/{filename}"
+
+    async def is_exist(self, filename: str) -> bool:
+        return await asyncio.to_thread(self._path(filename).is_file)
+
+    async def delete(self, filename: str) -> None:
+        await asyncio.to_thread(self._path(filename).unlink, missing_ok=True)
+
+    async def add_from_bytes(
+        self, file_data: bytes, file_name: str, content_type: str
+    ) -> str:
+        file_key = f"{uuid.uuid4()}-{file_name}"
+        await asyncio.to_thread(self._write, file_key, file_data)
+        return file_key
@@ -5,10 +5,25 @@ from os.path import splitext
 import uuid
 import aiohttp
 from fastapi import UploadFile
+from magic import from_buffer
 from uuid_utils import uuid7
 from api.src.dependencies.s3_uow import S3UnitOfWork
 from api.src.repositories.objects.base import BaseObjectRepository
 from api.src.core.config import config
+from api.logging_config import logger
+
+
+SNIFF_SIZE = 2048
+
+
+async def read_up_to(stream: aiohttp.StreamReader, size: int) -> bytes:
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = await stream.read(size - len(buffer))
+        if not chunk:
+            break
+        buffer.extend(chunk)
+    return bytes(buffer)
 
 
 class S3ObjectRepository(BaseObjectRepository):
@@ -63,13 +78,10 @@ class S3ObjectRepository(BaseObjectRepository):
     async def add_via_link(
         self, link: str, content_type: str, file_key: str | None = None
     ) -> str:
-        file_key = file_key or str(uuid7())
-        filename = file_key + (mimetypes.guess_extension(content_type) or "")
-
         timeout = aiohttp.ClientTimeout(
-            total=300,
+            total=config.REMOTE_FILE_TIMEOUT,
             connect=30,
-            sock_read=270,
+            sock_read=60,
         )
 
         async with aiohttp.ClientSession(timeout=timeout) as session:
@@ -79,24 +91,95 @@ class S3ObjectRepository(BaseObjectRepository):
                         raise ValueError(
                             f"Failed to download file from URL {link} with status {response.status}"
                         )
-                    file_data = await response.read()
+                    if (response.content_length or 0) > config.REMOTE_FILE_MAX_SIZE:
+                        raise ValueError(f"File from URL {link} exceeds {config.REMOTE_FILE_MAX_SIZE} bytes")
+                    return await self._ingest(response.content, file_key or str(uuid7()), link)
             except asyncio.TimeoutError as e:
-                print(f"AIOHTTP TimeoutError while downloading from {link}")
+                logger.error(f"Timeout while downloading from {link}")
                 raise aiohttp.client_exceptions.ConnectionTimeoutError(
                     f"Connection timeout to host {link}"
                 ) from e
 
-        await asyncio.sleep(0.05)
+    async def _ingest(self, stream: aiohttp.StreamReader, file_key: str, link: str) -> str:
+        head = await read_up_to(stream, min(config.S3_MULTIPART_THRESHOLD, config.REMOTE_FILE_MAX_SIZE + 1))
+        if len(head) > config.REMOTE_FILE_MAX_SIZE:
+            raise ValueError(f"File from URL {link} exceeds {config.REMOTE_FILE_MAX_SIZE} bytes")
+
+        content_type = from_buffer(head[:SNIFF_SIZE], mime=True)
+        if content_type not in config.ALLOWED_MIME_TYPES:
+            raise ValueError(f"File from URL {link} has unsupported type {content_type}")
+        filename = file_key + (mimetypes.guess_extension(content_type) or "")
 
         async with S3UnitOfWork() as s3:
-            await s3.safe_client.put_object(
+            if len(head) < config.S3_MULTIPART_THRESHOLD:
+                await s3.safe_client.put_object(
+                    Bucket=config.S3_BUCKET,
+                    Key=filename,
+                    Body=head,
+                    ContentType=content_type,
+                )
+            else:
+                await self._multipart_upload(s3.safe_client, stream, head, filename, content_type, link)
+
+        return filename
+
+    async def _multipart_upload(
+        self, client, stream: aiohttp.StreamReader, head: bytes, filename: str, content_type: str, link: str
+    ) -> None:
+        part_size = config.S3_MULTIPART_PART_SIZE
+        create_resp = await client.create_multipart_upload(
+            Bucket=config.S3_BUCKET, Key=filename, ContentType=content_type
+        )
+        upload_id = create_resp["UploadId"]
+        slots = asyncio.Semaphore(config.S3_MULTIPART_CONCURRENCY)
+        uploads: list[asyncio.Task] = []
+
+        async def upload_part(part_number: int, body: bytes) -> dict:
+            try:
+                resp = await client.upload_part(
+                    Bucket=config.S3_BUCKET,
+                    Key=filename,
+                    PartNumber=part_number,
+                    UploadId=upload_id,
+                    Body=body,
+                )
+                return {"ETag": resp["ETag"], "PartNumber": part_number}
+            finally:
+                slots.release()
+
+        try:
+            total = 0
+            pending = head
+            part_number = 1
+            while True:
+                # Back-pressure: do not read the next part from the network until an upload slot is free.
+                await slots.acquire()
+                if len(pending) < part_size:
+                    pending += await read_up_to(stream, part_size - len(pending))
+                body, pending = pending[:part_size], pending[part_size:]
+                if not body:
+                    slots.release()
+                    break
+                total += len(body)
+                if total > config.REMOTE_FILE_MAX_SIZE:
+                    slots.release()
+                    raise ValueError(f"File from URL {link} exceeds {config.REMOTE_FILE_MAX_SIZE} bytes")
+                uploads.append(asyncio.create_task(upload_part(part_number, body)))
+                part_number += 1
+
+            parts = await asyncio.gather(*uploads)
+            await client.complete_multipart_upload(
                 Bucket=config.S3_BUCKET,
                 Key=filename,
-                Body=file_data,
-                ContentType=content_type,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
             )
-
-        return filename
+        except BaseException:
+            for upload in uploads:
+                upload.cancel()
+            await asyncio.gather(*uploads, return_exceptions=True)
+            await client.abort_multipart_upload(Bucket=config.S3_BUCKET, Key=filename, UploadId=upload_id)
+            raise
 
     def get_url(self, filename: str) -> str:
         return f"{config.S3_ACCESS_DOMAIN}/{filename}"
@@ -131,28 +214,4 @@ class S3ObjectRepository(BaseObjectRepository):
     async def add_from_url_streaming(
         self, link: str, content_type: str, file_key: str | None = None
     ) -> str:
-        file_key = file_key or str(uuid7())
-        filename = file_key + (mimetypes.guess_extension(content_type) or "")
-
-        timeout = aiohttp.ClientTimeout(
-            total=300,
-            connect=30,
-            sock_read=270,
-        )
-
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(link) as response:
-                if response.status != 200:
-                    raise ValueError(
-                        f"Failed to download file from URL {link} with status {response.status}"
-                    )
-
-                async with S3UnitOfWork() as s3:
-                    await s3.safe_client.upload_fileobj(
-                        response.content,
-                        config.S3_BUCKET,
-                        filename,
-                        ExtraArgs={"ContentType": content_type},
-                    )
-
-        return filename
+        return await self.add_via_link(link, content_type, file_key)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.src.models.product import Product
@@ -6,19 +7,40 @@ from api.src.models.product import Product
 
 class BaseProductRepository(ABC):
     @abstractmethod
-    async def get_user_products(self, session: AsyncSession, user_id: UUID, limit: int | None, offset: int | None) -> list[Product]: ...
+    async def get_user_products(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        limit: int | None,
+        after: tuple[str, UUID] | None = None,
+        family_product_ids: Iterable[UUID] = (),
+    ) -> list[Product]: ...
 
     @abstractmethod
-    async def get_personal_products(self, session: AsyncSession, user_id: UUID, limit: int | None, offset: int | None) -> list[Product]: ...
+    async def get_personal_products(
+        self, session: AsyncSession, user_id: UUID, limit: int | None, after: tuple[str, UUID] | None = None
+    ) -> list[Product]: ...
 
     @abstractmethod
-    async def search_products(self, session: AsyncSession, user_id: UUID, query: str, limit: int | None, offset: int | None) -> list[Product]: ...
+    async def search_products(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        query: str,
+        limit: int | None,
+        after: tuple[float, str, UUID] | None = None,
+        family_product_ids: Iterable[UUID] = (),
+    ) -> list[tuple[Product, float]]: ...
 
     @abstractmethod
-    async def get_by_name(self, session: AsyncSession, product_name: str, user_id: UUID) -> Product | None: ...
+    async def get_by_name(
+        self, session: AsyncSession, product_name: str, user_id: UUID, family_product_ids: Iterable[UUID] = ()
+    ) -> Product | None: ...
 
     @abstractmethod
-    async def get_by_id(self, session: AsyncSession, product_id: UUID, user_id: UUID) -> Product | None: ...
+    async def get_by_id(
+        self, session: AsyncSession, product_id: UUID, user_id: UUID, family_product_ids: Iterable[UUID] = ()
+    ) -> Product | None: ...
 
     @abstractmethod
     async def get_editable_by_id(self, session: AsyncSession, product_id: UUID, user_id: UUID) -> Product | None: ...
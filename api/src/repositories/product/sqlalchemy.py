@@ -1,8 +1,8 @@
 # product_repository.py
 from dataclasses import dataclass
+from typing import Iterable
 from uuid import UUID
-from api.src.models.family import FamilyMember, FamilyProduct
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, tuple_, func, Float
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.src.models.product import Product
 from api.src.repositories.product.base import BaseProductRepository
@@ -14,84 +14,99 @@ class SqlAlchemyProductRepository(BaseProductRepository):
     def __init__(self) -> None:
         self._crud = CrudOperations(Product)
 
-    async def get_user_products(self, session: AsyncSession, user_id: UUID, limit: int | None, offset: int | None) -> list[Product]:
-        family_subquery = select(FamilyMember.family_id).where(
-            FamilyMember.user_id == user_id
-        ).scalar_subquery()
-
-        family_products_subquery = select(FamilyProduct.product_id).where(
-            FamilyProduct.family_id.in_(family_subquery)
-        ).scalar_subquery()
-
-        query = select(Product).where(
-            or_(
-                Product.user_id == user_id,
-                Product.is_public,
-                Product.id.in_(family_products_subquery)
-            ),
-            Product.is_active,
-        ).order_by(Product.name).limit(limit).offset(offset)
-
-        result = await session.execute(query)
+    @staticmethod
+    def _visible_to(user_id: UUID, family_product_ids: Iterable[UUID]):
+        family_product_ids = list(family_product_ids)
+        conditions = [Product.is_public, Product.user_id == user_id]
+        if family_product_ids:
+            conditions.append(Product.id.in_(family_product_ids))
+        return or_(*conditions)
+
+    @staticmethod
+    def _paginate(query, limit: int | None, after: tuple[str, UUID] | None):
+        if after is not None:
+            query = query.where(tuple_(Product.name, Product.id) > after)
+        return query.order_by(Product.name, Product.id).limit(limit)
+
+    async def get_user_products(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        limit: int | None,
+        after: tuple[str, UUID] | None = None,
+        family_product_ids: Iterable[UUID] = (),
+    ) -> list[Product]:
+        visible = self._visible_to(user_id, family_product_ids)
+
+        query = select(Product).where(visible, Product.is_active)
+
+        result = await session.execute(self._paginate(query, limit, after))
         return list(result.scalars().all())
 
-    async def get_personal_products(self, session: AsyncSession, user_id: UUID, limit: int | None, offset: int | None) -> list[Product]:
-        query = select(Product).where(Product.user_id == user_id).limit(limit).offset(offset)
-        result = await session.execute(query)
+    async def get_personal_products(
+        self, session: AsyncSession, user_id: UUID, limit: int | None, after: tuple[str, UUID] | None = None
+    ) -> list[Product]:
+        query = select(Product).where(Product.user_id == user_id)
+        result = await session.execute(self._paginate(query, limit, after))
         return list(result.scalars().all())
 
-    async def search_products(self, session: AsyncSession, user_id: UUID, query: str, limit: int | None, offset: int | None) -> list[Product]:
-        if not query:
-            return await self.get_user_products(session, user_id)
-
-        formatted_query = query.capitalize()
-
-        family_subquery = select(FamilyMember.family_id).where(
-            FamilyMember.user_id == user_id
-        ).scalar_subquery()
+    async def search_products(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        query: str,
+        limit: int | None,
+        after: tuple[float, str, UUID] | None = None,
+        family_product_ids: Iterable[UUID] = (),
+    ) -> list[tuple[Product, float]]:
+        visible = self._visible_to(user_id, family_product_ids)
+
+        rank = func.word_similarity(query, Product.name, type_=Float).label("rank")
+        stmt = select(Product, rank).where(
+            visible,
+            Product.is_active,
+            or_(
+                Product.name.icontains(query, autoescape=True),
+                Product.name.op("%>")(query),
+            ),
+        )
 
-        family_products_subquery = select(FamilyProduct.product_id).where(
-            FamilyProduct.family_id.in_(family_subquery)
-        ).scalar_subquery()
+        if after is not None:
+            after_rank, after_name, after_id = after
+            stmt = stmt.where(
+                or_(
+                    rank < after_rank,
+                    and_(rank == after_rank, tuple_(Product.name, Product.id) > (after_name, after_id)),
+                )
+            )
 
-        stmt = select(Product).where(
-            or_(Product.is_public, (Product.user_id == user_id), Product.id.in_(family_products_subquery)),
-            Product.name.ilike(f"{formatted_query}%")
-        ).limit(limit).offset(offset)
+        stmt = stmt.order_by(rank.desc(), Product.name, Product.id).limit(limit)
         result = await session.execute(stmt)
-        return list(result.scalars().all())
+        return [(product, product_rank) for product, product_rank in result.all()]
 
-    async def get_by_name(self, session: AsyncSession, product_name: str, user_id: UUID) -> Product | None:
-        family_subquery = select(FamilyMember.family_id).where(
-            FamilyMember.user_id == user_id
-        ).scalar_subquery()
-
-        family_products_subquery = select(FamilyProduct.product_id).where(
-            FamilyProduct.family_id.in_(family_subquery)
-        ).scalar_subquery()
+    async def get_by_name(
+        self, session: AsyncSession, product_name: str, user_id: UUID, family_product_ids: Iterable[UUID] = ()
+    ) -> Product | None:
+        visible = self._visible_to(user_id, family_product_ids)
 
         query = select(Product).where(
             and_(
-                or_(Product.is_public, (Product.user_id == user_id), Product.id.in_(family_products_subquery)),
+                visible,
                 (Product.name == product_name),
             )
         )
         result = await session.execute(query)
         return result.scalar_one_or_none()
 
-    async def get_by_id(self, session: AsyncSession, product_id: UUID, user_id: UUID) -> Product | None:
-        family_subquery = select(FamilyMember.family_id).where(
-            FamilyMember.user_id == user_id
-        ).scalar_subquery()
-
-        family_products_subquery = select(FamilyProduct.product_id).where(
-            FamilyProduct.family_id.in_(family_subquery)
-        ).scalar_subquery()
+    async def get_by_id(
+        self, session: AsyncSession, product_id: UUID, user_id: UUID, family_product_ids: Iterable[UUID] = ()
+    ) -> Product | None:
+        visible = self._visible_to(user_id, family_product_ids)
 
         query = select(Product).where(
             and_(
                 (Product.id == product_id),
-                or_(Product.is_public, (Product.user_id == user_id), Product.id.in_(family_products_subquery))
+                visible
             )
         )
         result = await session.execute(query)
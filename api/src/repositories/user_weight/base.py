@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from datetime import date
+from datetime import date, datetime
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.src.models.user_weight import UserWeight
@@ -22,3 +22,9 @@ class BaseUserWeightRepository(ABC):
 
     @abstractmethod
     async def delete(self, session: AsyncSession, user_weight_id: UUID) -> None: ...
+
+    @abstractmethod
+    async def get_user_ids_after(self, session: AsyncSession, after: UUID | None, limit: int) -> list[UUID]: ...
+
+    @abstractmethod
+    async def add_daily_records(self, session: AsyncSession, day_start: datetime, user_ids: list[UUID]) -> int: ...
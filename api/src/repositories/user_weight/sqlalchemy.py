@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from datetime import date, timedelta, datetime
 from uuid import UUID
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, exists, func, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from api.src.models.user import User
 from api.src.models.user_weight import UserWeight
 from api.src.repositories.user_weight.base import BaseUserWeightRepository
 from api.src.repositories.crud import CrudOperations
@@ -58,3 +60,31 @@ class SqlAlchemyUserWeightRepository(BaseUserWeightRepository):
 
     async def delete(self, session: AsyncSession, user_weight_id: UUID) -> None:
         await self._crud.delete(session, user_weight_id)
+
+    async def get_user_ids_after(self, session: AsyncSession, after: UUID | None, limit: int) -> list[UUID]:
+        query = select(User.id).order_by(User.id).limit(limit)
+        if after is not None:
+            query = query.where(User.id > after)
+        result = await session.execute(query)
+        return list(result.scalars().all())
+
+    async def add_daily_records(self, session: AsyncSession, day_start: datetime, user_ids: list[UUID]) -> int:
+        latest = (
+            select(UserWeight.user_id, UserWeight.weight)
+            .where(UserWeight.user_id.in_(user_ids))
+            .distinct(UserWeight.user_id)
+            .order_by(UserWeight.user_id, UserWeight.created_at.desc())
+            .subquery()
+        )
+        todays_weight = aliased(UserWeight)
+        has_todays_record = exists().where(
+            todays_weight.user_id == latest.c.user_id,
+            todays_weight.created_at >= day_start,
+        )
+
+        stmt = insert(UserWeight).from_select(
+            ["id", "user_id", "weight"],
+            select(func.gen_random_uuid(), latest.c.user_id, latest.c.weight).where(~has_todays_record),
+        )
+        result = await session.execute(stmt)
+        return result.rowcount
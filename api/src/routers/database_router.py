@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.src.core.config import config
-from api.src.database.database import get_async_session
+from api.src.core.security import Security
+from api.src.database.database import get_async_session, get_pool_status
 from api.src.database.fill_database import fill_database
 from api.logging_config import logger
 
@@ -21,3 +22,8 @@ async def fill_db(db: AsyncSession = Depends(get_async_session)):
         status_code=status.HTTP_200_OK,
         detail='Database filled successfully'
     )
+
+
+@database_router.get('/pool-status', dependencies=[Depends(Security.get_required_staff)])
+async def pool_status() -> dict:
+    return get_pool_status()
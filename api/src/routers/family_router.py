@@ -1,6 +1,9 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from api.src.cache.notifications import notification_channel
 from api.src.core.security import Security
 from api.src.database.database import get_async_session
 from api.src.dependencies.repositories import get_user_repository
@@ -8,8 +11,9 @@ from api.src.models.user import User
 from api.src.schemas.family import (
     FamilyRead, FamilyCreate, FamilyMemberRead, FamilyProductRead,
     FamilyProductCreate, FamilyInvitationRead, FamilyInvitationCreate,
-    FamilyNotificationRead, FamilyMemberRoleUpdate, FamilyUpdate
+    FamilyNotificationRead, FamilyNotificationPage, FamilyMemberRoleUpdate, FamilyUpdate
 )
+from api.src.schemas.base import CursorPagination
 from api.src.dependencies.services import (
     get_family_service, get_family_member_service,
     get_family_product_service, get_family_invitation_service,
@@ -39,6 +43,59 @@ async def get_user_families(
     return await family_service.get_user_families(session, current_user.id)
 
 
+@family_router.get("/notifications")
+async def get_family_notifications(
+        is_read: bool | None = Query(None, description="Фильтр по статусу прочтения"),
+        pagination: CursorPagination = Depends(),
+        current_user: User = Depends(Security.get_required_user),
+        session: AsyncSession = Depends(get_async_session),
+        notification_service=Depends(get_family_notification_service),
+) -> FamilyNotificationPage:
+    return await notification_service.get_user_notifications(
+        session=session,
+        user_id=current_user.id,
+        pagination=pagination,
+        is_read=is_read
+    )
+
+
+@family_router.get("/notifications/stream")
+async def stream_family_notifications(
+        request: Request,
+        current_user: User = Depends(Security.get_required_user),
+        session: AsyncSession = Depends(get_async_session),
+        notification_service=Depends(get_family_notification_service),
+) -> StreamingResponse:
+    unread = await notification_service.get_unread_count(session, current_user.id)
+    # The stream is long-lived: give the connection back to the pool before it starts.
+    await session.close()
+
+    async def events():
+        yield f"event: unread_count\ndata: {orjson.dumps(unread).decode()}\n\n"
+        async for payload in notification_channel.subscribe(current_user.id):
+            if await request.is_disconnected():
+                break
+            if payload is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"event: notification\ndata: {payload.decode()}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@family_router.get("/notifications/unread-count")
+async def get_unread_notifications_count(
+        current_user: User = Depends(Security.get_required_user),
+        session: AsyncSession = Depends(get_async_session),
+        notification_service=Depends(get_family_notification_service),
+) -> dict:
+    return await notification_service.get_unread_count(session, current_user.id)
+
+
 @family_router.get("/{family_id}")
 async def get_family(
         family_id: UUID,
@@ -97,13 +154,15 @@ async def update_member_role(
 
     if updated_member.user_id != current_user.id:
         current_user_data = await user_repository.get_user_by_id(session, current_user.id)
-        await notification_service.create_role_changed_notification(
+        notification = await notification_service.create_role_changed_notification(
             session=session,
             user_id=user_id,
             family_id=family_id,
             new_role=role_update.role.value,
             changed_by_email=current_user_data.email if current_user_data else current_user.email
         )
+        await session.commit()
+        await notification_service.publish_created([notification])
 
     return updated_member
 
@@ -215,33 +274,6 @@ async def remove_product_from_family(
     return await family_product_service.remove_product_from_family(session, family_id, product_id, current_user.id)
 
 
-@family_router.get("/notifications")
-async def get_family_notifications(
-        is_read: bool | None = Query(None, description="Фильтр по статусу прочтения"),
-        limit: int = Query(50, ge=1, le=100, description="Лимит уведомлений"),
-        offset: int = Query(0, ge=0, description="Смещение"),
-        current_user: User = Depends(Security.get_required_user),
-        session: AsyncSession = Depends(get_async_session),
-        notification_service=Depends(get_family_notification_service),
-) -> list[FamilyNotificationRead]:
-    return await notification_service.get_user_notifications(
-        session=session,
-        user_id=current_user.id,
-        limit=limit,
-        offset=offset,
-        is_read=is_read
-    )
-
-
-@family_router.get("/notifications/unread-count")
-async def get_unread_notifications_count(
-        current_user: User = Depends(Security.get_required_user),
-        session: AsyncSession = Depends(get_async_session),
-        notification_service=Depends(get_family_notification_service),
-) -> dict:
-    return await notification_service.get_unread_count(session, current_user.id)
-
-
 @family_router.patch("/notifications/{notification_id}/read")
 async def mark_notification_as_read(
         notification_id: UUID,
@@ -1,12 +1,14 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from datetime import date
 from api.src.core.security import Security
 from api.src.database.database import get_async_session
 from api.src.models.user import User
-from api.src.schemas.meal import MealRead, MealCreate, MealUpdate
+from api.src.schemas.meal import (
+    MealRead, MealCreate, MealUpdate, DailyNutritionRead, MealBatchRequest, MealBatchResult
+)
 from api.src.services.meal import MealService
 from api.src.dependencies.services import get_meal_service
 
@@ -42,6 +44,17 @@ async def get_recent_meals(
     return await meal_service.get_meals_last_7_days(session, current_user.id)
 
 
+@meal_router.get("/summary")
+async def get_nutrition_summary(
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    current_user: User = Depends(Security.get_required_user),
+    session: AsyncSession = Depends(get_async_session),
+    meal_service: MealService = Depends(get_meal_service),
+) -> list[DailyNutritionRead]:
+    return await meal_service.get_nutrition_summary(session, current_user.id, date_from, date_to)
+
+
 @meal_router.get("/{meal_id}")
 async def get_meal(
     meal_id: UUID,
@@ -65,6 +78,16 @@ async def create_meal(
     return await meal_service.add_meal(session, meal_data, current_user.id)
 
 
+@meal_router.post("/batch")
+async def apply_meal_batch(
+    batch: MealBatchRequest,
+    current_user: User = Depends(Security.get_required_user),
+    session: AsyncSession = Depends(get_async_session),
+    meal_service: MealService = Depends(get_meal_service),
+) -> MealBatchResult:
+    return await meal_service.apply_batch(session, batch, current_user.id)
+
+
 @meal_router.put("/{meal_id}")
 async def update_meal(
     meal_id: UUID,
@@ -4,8 +4,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from api.src.core.security import Security
 from api.src.database.database import get_async_session
 from api.src.models.user import User
-from api.src.schemas.base import Pagination
-from api.src.schemas.product import ProductRead, ProductCreate, ProductUpdate, ProductAdd
+from api.src.schemas.base import CursorPagination
+from api.src.schemas.product import ProductRead, ProductCreate, ProductUpdate, ProductAdd, ProductPage
 from api.src.services.product import ProductService
 from api.src.dependencies.services import get_product_service
 from typing import Optional
@@ -18,8 +18,8 @@ async def get_products(
     current_user: User = Depends(Security.get_required_user),
     session: AsyncSession = Depends(get_async_session),
     product_service: ProductService = Depends(get_product_service),
-    pagination: Pagination = Depends()
-) -> list[ProductRead]:
+    pagination: CursorPagination = Depends()
+) -> ProductPage:
     return await product_service.get_user_products(session, current_user.id, pagination)
 
 
@@ -28,8 +28,8 @@ async def get_personal_products(
     current_user: User = Depends(Security.get_required_user),
     session: AsyncSession = Depends(get_async_session),
     product_service: ProductService = Depends(get_product_service),
-    pagination: Pagination = Depends()
-) -> list[ProductRead]:
+    pagination: CursorPagination = Depends()
+) -> ProductPage:
     return await product_service.get_personal_products(session, current_user.id, pagination)
 
 
@@ -39,8 +39,8 @@ async def search_products(
     current_user: User = Depends(Security.get_required_user),
     session: AsyncSession = Depends(get_async_session),
     product_service: ProductService = Depends(get_product_service),
-    pagination: Pagination = Depends()
-) -> list[ProductRead]:
+    pagination: CursorPagination = Depends()
+) -> ProductPage:
     return await product_service.search_products(session, current_user.id, query, pagination)
 
 
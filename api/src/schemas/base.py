@@ -4,3 +4,8 @@ from pydantic import BaseModel, Field
 class Pagination(BaseModel):
     limit: int = Field(12, gt=0)
     offset: int = Field(0, ge=0)
+
+
+class CursorPagination(BaseModel):
+    limit: int = Field(12, gt=0, le=100)
+    cursor: str | None = None
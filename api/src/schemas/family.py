@@ -140,3 +140,8 @@ class FamilyNotificationRead(FamilyNotificationBase):
 
     class Config:
         from_attributes = True
+
+
+class FamilyNotificationPage(BaseModel):
+    items: list[FamilyNotificationRead]
+    next_cursor: str | None = None
@@ -1,6 +1,7 @@
 from datetime import date
+from typing import Literal
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 from api.src.schemas.meal_products import MealProductsCreate, MealProductsUpdate
 from api.src.schemas.product import ProductRead
 
@@ -43,3 +44,41 @@ class MealUpdate(BaseModel):
 class MealCreate(BaseModel):
     name: str
     products: list[MealProductsCreate] | None = None
+
+
+class DailyNutritionRead(BaseModel):
+    day: date
+    weight: float
+    calories: float
+    proteins: float
+    fats: float
+    carbohydrates: float
+    meal_count: int
+
+    class Config:
+        from_attributes = True
+
+
+class MealBatchOperation(BaseModel):
+    op: Literal["create", "update", "delete"]
+    meal_id: UUID | None = None
+    name: str | None = None
+    products: list[MealProductsCreate] | None = None
+
+    @model_validator(mode='after')
+    def check_operation_fields(self):
+        if self.op == "create" and self.name is None:
+            raise ValueError("'name' is required to create a meal")
+        if self.op != "create" and self.meal_id is None:
+            raise ValueError(f"'meal_id' is required to {self.op} a meal")
+        return self
+
+
+class MealBatchRequest(BaseModel):
+    operations: list[MealBatchOperation] = Field(..., min_length=1, max_length=500)
+
+
+class MealBatchResult(BaseModel):
+    created: list[MealRead]
+    updated: list[MealRead]
+    deleted: list[UUID]
@@ -44,6 +44,11 @@ class ProductRead(BaseModel):
         from_attributes = True
 
 
+class ProductPage(BaseModel):
+    items: list[ProductRead]
+    next_cursor: str | None = None
+
+
 class ProductUpdate(BaseModel):
     name: str | None = None
     weight: float | None = None
@@ -7,7 +7,9 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy import select
 
 from api.logging_config import logger
-from api.src.models.family import FamilyRole, InvitationStatus, FamilyNotification, FamilyMember, FamilyInvitation, \
+from api.src.cache.notifications import notification_channel
+from api.src.cache.visibility import product_visibility
+from api.src.models.family import FamilyRole, InvitationStatus, FamilyNotification, FamilyMember, \
     FamilyProduct
 from api.src.repositories.family.base import BaseFamilyRepository, BaseFamilyMemberRepository, \
     BaseFamilyProductRepository, BaseFamilyInvitationRepository, BaseFamilyNotificationRepository
@@ -15,13 +17,15 @@ from api.src.repositories.user.base import BaseUserRepository
 from api.src.schemas.family import (
     FamilyRead, FamilyCreate, FamilyMemberRead, FamilyProductRead,
     FamilyProductCreate, FamilyInvitationRead, FamilyInvitationCreate,
-    FamilyUpdate, FamilyNotificationRead, FamilyMemberRoleUpdate
+    FamilyUpdate, FamilyNotificationRead, FamilyNotificationPage, FamilyMemberRoleUpdate
 )
+from api.src.schemas.base import CursorPagination
 from api.src.services.converters.family import (
     convert_family_model_to_schema, convert_family_member_model_to_schema,
     convert_family_product_model_to_schema, convert_family_invitation_model_to_schema,
     convert_family_notification_model_to_schema
 )
+from api.src.utils.cursor import decode_cursor, encode_cursor
 
 
 @dataclass(slots=True)
@@ -64,18 +68,10 @@ class FamilyService:
 
         families = await self._family_repository.get_user_families(session, user_id)
 
-        family_schemas = []
-        for family in families:
-            members = await self._family_member_repository.get_family_members(session, family.id)
-            products_count = len(family.shared_products) if hasattr(family, 'shared_products') else 0
-
-            family_schemas.append(convert_family_model_to_schema(
-                family,
-                members_count=len(members),
-                products_count=products_count
-            ))
-
-        return family_schemas
+        return [
+            convert_family_model_to_schema(family, members_count=members_count, products_count=products_count)
+            for family, members_count, products_count in families
+        ]
 
     async def get_family_by_id(self, session: AsyncSession, family_id: UUID, user_id: UUID) -> FamilyRead:
         logger.info(f"Getting family {family_id} for user {user_id}")
@@ -87,17 +83,12 @@ class FamilyService:
                 detail="Access denied to this family"
             )
 
-        family = await self._family_repository.get_family_by_id(session, family_id)
-        if not family:
+        row = await self._family_repository.get_family_with_counts(session, family_id)
+        if not row:
             raise HTTPException(status_code=404, detail="Family not found")
 
-        members = await self._family_member_repository.get_family_members(session, family_id)
-
-        return convert_family_model_to_schema(
-            family,
-            members_count=len(members),
-            products_count=len(family.shared_products)
-        )
+        family, members_count, products_count = row
+        return convert_family_model_to_schema(family, members_count=members_count, products_count=products_count)
 
     async def update_family(self, session: AsyncSession, family_id: UUID, family_update: FamilyUpdate,
                             user_id: UUID) -> FamilyRead:
@@ -121,11 +112,11 @@ class FamilyService:
             await session.commit()
             logger.info(f"Family {family_id} updated successfully")
 
-            members = await self._family_member_repository.get_family_members(session, family_id)
+            _, members_count, products_count = await self._family_repository.get_family_with_counts(session, family_id)
             return convert_family_model_to_schema(
                 updated_family,
-                members_count=len(members),
-                products_count=len(updated_family.shared_products)
+                members_count=members_count,
+                products_count=products_count
             )
 
         except Exception as e:
@@ -150,9 +141,12 @@ class FamilyService:
         if not family:
             raise HTTPException(status_code=404, detail="Family not found")
 
+        member_user_ids = await product_visibility.get_family_user_ids(session, family_id)
+
         try:
             await self._family_repository.delete_family(session, family)
             await session.commit()
+            await product_visibility.invalidate_users(*member_user_ids)
             logger.info(f"Family {family_id} deleted successfully")
             return {"message": "Family deleted successfully"}
 
@@ -262,6 +256,7 @@ class FamilyMemberService:
         try:
             await self._family_member_repository.remove_member(session, target_member)
             await session.commit()
+            await product_visibility.invalidate_users(target_user_id)
             logger.info(f"Member {target_user_id} removed from family {family_id}")
             return {"message": "Member removed successfully"}
 
@@ -308,6 +303,7 @@ class FamilyProductService:
             )
 
             await session.commit()
+            await product_visibility.invalidate_family(session, family_id)
             logger.info(f"Product {product_data.product_id} added to family {family_id}")
 
             return convert_family_product_model_to_schema(family_product, user_id)
@@ -400,6 +396,7 @@ class FamilyProductService:
         try:
             await self._family_product_repository.remove_product_from_family(session, family_product)
             await session.commit()
+            await product_visibility.invalidate_family(session, family_id)
             logger.info(f"Product {product_id} removed from family {family_id}")
             return {"message": "Product removed from family successfully"}
 
@@ -452,26 +449,20 @@ class FamilyNotificationService:
             added_by_email: str,
             exclude_user_id: UUID | None = None
     ) -> list[FamilyNotification]:
-        members = await self._family_member_repository.get_family_members(session, family_id)
+        user_ids = await self._family_member_repository.get_member_user_ids(session, family_id)
 
-        notifications = []
-        for member in members:
-            if exclude_user_id and member.user_id == exclude_user_id:
-                continue
-
-            notification_data = {
-                "user_id": member.user_id,
+        return await self._notification_repository.create_notifications(session, [
+            {
+                "user_id": user_id,
                 "family_id": family_id,
                 "type": "product_added",
                 "title": "Новый продукт в семье",
                 "message": f"Пользователь {added_by_email} добавил продукт '{product_name}' в вашу семью",
                 "is_read": False
             }
-
-            notification = await self._notification_repository.create_notification(session, notification_data)
-            notifications.append(notification)
-
-        return notifications
+            for user_id in user_ids
+            if user_id != exclude_user_id
+        ])
 
     async def create_member_added_notification(
             self,
@@ -480,34 +471,30 @@ class FamilyNotificationService:
             new_member_email: str,
             added_by_email: str
     ) -> list[FamilyNotification]:
-        members = await self._family_member_repository.get_family_members(session, family_id)
+        user_ids = await self._family_member_repository.get_member_user_ids(session, family_id)
+        new_user = await self._user_repository.find_by_email(session, new_member_email)
+        new_user_id = new_user.id if new_user else None
+
+        welcome = {
+            "type": "member_added",
+            "title": "Добро пожаловать в семью",
+            "message": f"Пользователь {added_by_email} добавил вас в семью",
+        }
+        announcement = {
+            "type": "member_added",
+            "title": "Новый участник в семье",
+            "message": f"Пользователь {added_by_email} добавил {new_member_email} в вашу семью",
+        }
 
-        notifications = []
-        for member in members:
-            new_user = await self._user_repository.find_by_email(session, new_member_email)
-            if new_user and member.user_id == new_user.id:
-                notification_data = {
-                    "user_id": member.user_id,
-                    "family_id": family_id,
-                    "type": "member_added",
-                    "title": "Добро пожаловать в семью",
-                    "message": f"Пользователь {added_by_email} добавил вас в семью",
-                    "is_read": False
-                }
-            else:
-                notification_data = {
-                    "user_id": member.user_id,
-                    "family_id": family_id,
-                    "type": "member_added",
-                    "title": "Новый участник в семье",
-                    "message": f"Пользователь {added_by_email} добавил {new_member_email} в вашу семью",
-                    "is_read": False
-                }
-
-            notification = await self._notification_repository.create_notification(session, notification_data)
-            notifications.append(notification)
-
-        return notifications
+        return await self._notification_repository.create_notifications(session, [
+            {
+                "user_id": user_id,
+                "family_id": family_id,
+                "is_read": False,
+                **(welcome if user_id == new_user_id else announcement)
+            }
+            for user_id in user_ids
+        ])
 
     async def create_role_changed_notification(
             self,
@@ -535,26 +522,28 @@ class FamilyNotificationService:
             self,
             session: AsyncSession,
             user_id: UUID,
-            limit: int = 50,
-            offset: int = 0,
+            pagination: CursorPagination,
             is_read: bool | None = None
-    ) -> list[FamilyNotificationRead]:
+    ) -> FamilyNotificationPage:
+        after = None
+        if pagination.cursor:
+            values = decode_cursor(pagination.cursor)
+            try:
+                created_at, notification_id = values
+                after = (datetime.fromisoformat(created_at), UUID(notification_id))
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
         notifications = await self._notification_repository.get_user_notifications(
-            session, user_id, is_read
+            session, user_id, is_read, pagination.limit + 1, after
         )
+        has_next = len(notifications) > pagination.limit
+        notifications = notifications[:pagination.limit]
 
-        result = []
-        for notif in notifications:
-            stmt = select(FamilyNotification).where(FamilyNotification.id == notif.id).options(
-                selectinload(FamilyNotification.user),
-                selectinload(FamilyNotification.family),
-                selectinload(FamilyNotification.invitation)
-            )
-            result_notif = await session.execute(stmt)
-            loaded_notif = result_notif.scalar_one()
-            result.append(convert_family_notification_model_to_schema(loaded_notif))
-
-        return result[offset:offset + limit]
+        return FamilyNotificationPage(
+            items=[convert_family_notification_model_to_schema(notif) for notif in notifications],
+            next_cursor=encode_cursor(notifications[-1].created_at, notifications[-1].id) if has_next else None,
+        )
 
     async def mark_notification_as_read(
             self,
@@ -572,13 +561,9 @@ class FamilyNotificationService:
                 detail="Уведомление не найдено"
             )
 
-        stmt = select(FamilyNotification).where(FamilyNotification.id == notification.id).options(
-            selectinload(FamilyNotification.user),
-            selectinload(FamilyNotification.family),
-            selectinload(FamilyNotification.invitation)
-        )
-        result = await session.execute(stmt)
-        loaded_notification = result.scalar_one()
+        loaded_notification = await self._notification_repository.get_notification_by_id(session, notification.id)
+        count = await self._notification_repository.get_unread_count(session, user_id)
+        await notification_channel.publish_count(user_id, count, "read")
         return convert_family_notification_model_to_schema(loaded_notification)
 
     async def mark_all_notifications_as_read(
@@ -587,6 +572,7 @@ class FamilyNotificationService:
             user_id: UUID
     ) -> dict:
         count = await self._notification_repository.mark_all_as_read(session, user_id)
+        await notification_channel.publish_count(user_id, 0, "read_all")
 
         return {
             "message": f"Отмечено {count} уведомлений как прочитанные",
@@ -598,12 +584,18 @@ class FamilyNotificationService:
             session: AsyncSession,
             user_id: UUID
     ) -> dict:
-        count = await self._notification_repository.get_unread_count(session, user_id)
+        count = await notification_channel.get_unread_count(user_id)
+        if count is None:
+            count = await self._notification_repository.get_unread_count(session, user_id)
+            await notification_channel.fill_unread_count(user_id, count)
 
         return {
             "unread_count": count
         }
 
+    async def publish_created(self, notifications: list[FamilyNotification]) -> None:
+        await notification_channel.publish_created(notification.user_id for notification in notifications)
+
     async def delete_notification(
             self,
             session: AsyncSession,
@@ -658,16 +650,7 @@ class FamilyInvitationService:
             )
 
         invitations = await self._family_invitation_repository.get_family_invitations(session, family_id)
-        result = []
-        for inv in invitations:
-            stmt = select(FamilyInvitation).where(FamilyInvitation.id == inv.id).options(
-                selectinload(FamilyInvitation.inviter),
-                selectinload(FamilyInvitation.family)
-            )
-            result_inv = await session.execute(stmt)
-            loaded_inv = result_inv.scalar_one()
-            result.append(convert_family_invitation_model_to_schema(loaded_inv))
-        return result
+        return [convert_family_invitation_model_to_schema(inv) for inv in invitations]
 
     async def get_user_invitations(
             self,
@@ -676,16 +659,7 @@ class FamilyInvitationService:
     ) -> list[FamilyInvitationRead]:
         logger.info(f"Getting invitations for user {email}")
         invitations = await self._family_invitation_repository.get_user_invitations(session, email)
-        result = []
-        for inv in invitations:
-            stmt = select(FamilyInvitation).where(FamilyInvitation.id == inv.id).options(
-                selectinload(FamilyInvitation.inviter),
-                selectinload(FamilyInvitation.family)
-            )
-            result_inv = await session.execute(stmt)
-            loaded_inv = result_inv.scalar_one()
-            result.append(convert_family_invitation_model_to_schema(loaded_inv))
-        return result
+        return [convert_family_invitation_model_to_schema(inv) for inv in invitations]
 
     async def create_invitation(
             self,
@@ -717,11 +691,12 @@ class FamilyInvitationService:
             })
 
             invited_user = await self._user_repository.find_by_email(session, invitation_data.email)
+            notification = None
 
             if invited_user:
                 inviter = await self._user_repository.get_by_id(session, user_id)
 
-                await self._notification_service.create_invitation_notification(
+                notification = await self._notification_service.create_invitation_notification(
                     session=session,
                     user_id=invited_user.id,
                     family_id=family_id,
@@ -731,6 +706,8 @@ class FamilyInvitationService:
                 )
 
             await session.commit()
+            if notification is not None:
+                await self._notification_service.publish_created([notification])
 
             loaded_invitation = await self._family_invitation_repository.get_invitation_by_id(
                 session, invitation.id
@@ -805,7 +782,7 @@ class FamilyInvitationService:
 
         inviter = await self._user_repository.get_by_id(session, invitation.invited_by)
 
-        await self._notification_service.create_member_added_notification(
+        notifications = await self._notification_service.create_member_added_notification(
             session=session,
             family_id=invitation.family_id,
             new_member_email=user_email,
@@ -813,6 +790,8 @@ class FamilyInvitationService:
         )
 
         await session.commit()
+        await product_visibility.invalidate_users(user.id)
+        await self._notification_service.publish_created(notifications)
         logger.info(f"Invitation accepted for user {user_email}")
 
         return {"message": "Invitation accepted successfully"}
@@ -1,52 +1,76 @@
 from dataclasses import dataclass
 from datetime import date, datetime
+from typing import Iterable
 from uuid import UUID
-import asyncio
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.src.cache.cache import cache
 from api.logging_config import logger
 from api.src.models.meal import Meal
-from api.src.models.product import Product
-from api.src.schemas.meal import MealCreate, MealUpdate, MealRead
+from api.src.schemas.meal import (
+    MealCreate, MealUpdate, MealRead, DailyNutritionRead, MealBatchRequest, MealBatchResult
+)
+from api.src.repositories.daily_nutrition.base import BaseDailyNutritionRepository
 from api.src.repositories.meal.base import BaseMealRepository
 from api.src.repositories.meal_products.base import BaseMealProductsRepository
 from api.src.services.converters.meal import convert_meal_model_to_schema
 
 
+MEAL_ADAPTER = TypeAdapter(MealRead)
+MEAL_LIST_ADAPTER = TypeAdapter(list[MealRead])
+MAX_SUMMARY_DAYS = 366
+NUTRIENT_FIELDS = ("weight", "calories", "proteins", "fats", "carbohydrates")
+
+
 @dataclass(slots=True)
 class MealService:
     _meal_repository: BaseMealRepository
     _meal_products_repository: BaseMealProductsRepository
+    _daily_nutrition_repository: BaseDailyNutritionRepository
 
-    async def recalculate_meal_nutrients(self, session: AsyncSession, meal: Meal) -> Meal:
-        logger.info(f"Recalculating nutrients for meal {meal.id} ({meal.name})")
+    @staticmethod
+    def _meal_nutrients(meal: Meal) -> tuple[float, ...]:
+        return tuple(getattr(meal, field) for field in NUTRIENT_FIELDS)
+
+    @staticmethod
+    def _sum_meal_products(meal: Meal) -> tuple[float, ...]:
         total_weight = 0.0
         total_calories = 0.0
         total_proteins = 0.0
         total_fats = 0.0
         total_carbohydrates = 0.0
 
-        await session.refresh(meal, attribute_names=["meal_products"])
-
         for meal_product in meal.meal_products:
-            db_product = await session.get(Product, meal_product.product_id)
+            db_product = meal_product.product
             if not db_product:
                 logger.warning(f"Product with id {meal_product.product_id} not found in the database.")
                 continue
 
             ratio = meal_product.product_weight / 100.0
-            product_calories = db_product.calories * ratio
-            product_proteins = db_product.proteins * ratio
-            product_fats = db_product.fats * ratio
-            product_carbohydrates = db_product.carbohydrates * ratio
-
             total_weight += meal_product.product_weight
-            total_calories += product_calories
-            total_proteins += product_proteins
-            total_fats += product_fats
-            total_carbohydrates += product_carbohydrates
+            total_calories += db_product.calories * ratio
+            total_proteins += db_product.proteins * ratio
+            total_fats += db_product.fats * ratio
+            total_carbohydrates += db_product.carbohydrates * ratio
+
+        return total_weight, total_calories, total_proteins, total_fats, total_carbohydrates
+
+    @staticmethod
+    def _add_daily_delta(deltas: dict[date, dict[str, float]], day: date, nutrients: Iterable[float],
+                         meal_count: int = 0) -> None:
+        day_delta = deltas.setdefault(day, dict.fromkeys((*NUTRIENT_FIELDS, "meal_count"), 0))
+        for field, value in zip(NUTRIENT_FIELDS, nutrients):
+            day_delta[field] += value
+        day_delta["meal_count"] += meal_count
+
+    async def recalculate_meal_nutrients(self, session: AsyncSession, meal: Meal, meal_count_delta: int = 0) -> Meal:
+        logger.info(f"Recalculating nutrients for meal {meal.id} ({meal.name})")
+        previous = self._meal_nutrients(meal)
+
+        meal = await self._meal_repository.get_meal_by_id_with_products(session, meal.id, meal.user_id)
+        total_weight, total_calories, total_proteins, total_fats, total_carbohydrates = self._sum_meal_products(meal)
 
         logger.info(
             f"Total - Weight: {total_weight}, Calories: {total_calories}, Proteins: {total_proteins}, "
@@ -58,16 +82,27 @@ class MealService:
         meal.fats = total_fats
         meal.carbohydrates = total_carbohydrates
 
-        session.add(meal)
+        await self._daily_nutrition_repository.apply_delta(
+            session,
+            meal.user_id,
+            meal.created_at.date(),
+            weight=total_weight - previous[0],
+            calories=total_calories - previous[1],
+            proteins=total_proteins - previous[2],
+            fats=total_fats - previous[3],
+            carbohydrates=total_carbohydrates - previous[4],
+            meal_count=meal_count_delta,
+        )
         await session.commit()
 
-        refreshed_meal = await self._meal_repository.get_meal_by_id_with_products(session, meal.id, meal.user_id)
-
         logger.info(f"Meal {meal.id} nutrient recalculation completed.")
-        return refreshed_meal
+        return meal
 
     async def add_meal(self, session: AsyncSession, meal: MealCreate, user_id: UUID) -> MealRead:
         logger.info(f"Adding new meal for user {user_id}: {meal.name}")
+        product_weights = {product.product_id: product.product_weight for product in meal.products or []}
+        await self._validate_products_exist(session, product_weights.keys())
+
         try:
             meal_data = {
                 "name": meal.name,
@@ -82,15 +117,11 @@ class MealService:
             db_meal = await self._meal_repository.create_meal(session, meal_data)
             await session.flush()
 
-            for product in meal.products:
-                await self._meal_products_repository.create_meal_product(
-                    session,
-                    db_meal.id,
-                    product.product_id,
-                    product.product_weight
-                )
+            await self._meal_products_repository.sync_meal_products(
+                session, db_meal.id, product_weights, delete_missing=False
+            )
 
-            recalculated_meal = await self.recalculate_meal_nutrients(session, db_meal)
+            recalculated_meal = await self.recalculate_meal_nutrients(session, db_meal, meal_count_delta=1)
             await self._clear_meal_cache(user_id, recalculated_meal.id, recalculated_meal.created_at)
             logger.info(f"Meal {meal.name} with products successfully saved to the database.")
 
@@ -108,91 +139,200 @@ class MealService:
                           user_id: UUID) -> MealRead:
         logger.info(f"Updating meal {meal_id} for user {user_id}.")
 
-        db_meal = await self._meal_repository.get_meal_by_id_with_products(session, meal_id, user_id)
-        if not db_meal:
+        db_meal = await self._meal_repository.get_by_id_for_update(session, meal_id)
+        if not db_meal or db_meal.user_id != user_id:
             logger.warning(f"Meal {meal_id} not found for user {user_id}.")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Meal not found"
             )
 
-        if meal_update.name is not None:
-            db_meal.name = meal_update.name
+        try:
+            if meal_update.name is not None:
+                db_meal.name = meal_update.name
 
-        if meal_update.products is not None:
-            existing_products = {mp.product_id: mp for mp in db_meal.meal_products}
-            update_products = {p.product_id: p for p in meal_update.products}
+            if meal_update.products is not None:
+                product_weights = {p.product_id: p.product_weight for p in meal_update.products}
+                await self._validate_products_exist(session, product_weights.keys())
+                await self._meal_products_repository.sync_meal_products(session, meal_id, product_weights)
 
-            for product_id in existing_products.keys() - update_products.keys():
-                meal_product = await self._meal_products_repository.get_meal_product(session, meal_id, product_id)
-                if meal_product:
-                    await self._meal_products_repository.delete_meal_product(session, meal_product)
+            recalculated_meal = await self.recalculate_meal_nutrients(session, db_meal)
 
-            for product_id, product_data in update_products.items():
-                if product_id in existing_products:
-                    meal_product = existing_products[product_id]
-                    await self._meal_products_repository.update_meal_product(
-                        session, meal_product, product_data.product_weight
-                    )
-                else:
-                    db_product = await session.get(Product, product_id)
-                    if not db_product:
-                        logger.error(f"Product with id {product_id} not found.")
-                        raise HTTPException(
-                            status_code=status.HTTP_404_NOT_FOUND,
-                            detail=f"Product with id {product_id} not found"
-                        )
-                    await self._meal_products_repository.create_meal_product(
-                        session, meal_id, product_id, product_data.product_weight
-                    )
+        except IntegrityError as e:
+            logger.error(f"Error updating meal {meal_id}. Rolling back. Error: {str(e)}")
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Failed to update meal or associated meal products"
+            )
 
-        recalculated_meal = await self.recalculate_meal_nutrients(session, db_meal)
         await self._clear_meal_cache(user_id, meal_id, recalculated_meal.created_at)
         logger.info(f"Meal {meal_id} for user {user_id} updated successfully.")
 
         return convert_meal_model_to_schema(recalculated_meal)
 
+    async def apply_batch(self, session: AsyncSession, batch: MealBatchRequest, user_id: UUID) -> MealBatchResult:
+        logger.info(f"Applying {len(batch.operations)} meal operations for user {user_id}.")
+
+        creates = [operation for operation in batch.operations if operation.op == "create"]
+        updates = {}
+        deletes = []
+        for operation in batch.operations:
+            if operation.op == "create":
+                continue
+            if operation.meal_id in updates or operation.meal_id in deletes:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Meal {operation.meal_id} appears in more than one operation"
+                )
+            if operation.op == "update":
+                updates[operation.meal_id] = operation
+            else:
+                deletes.append(operation.meal_id)
+
+        await self._validate_products_exist(session, {
+            product.product_id
+            for operation in batch.operations
+            for product in operation.products or []
+        })
+
+        existing = {
+            meal.id: meal
+            for meal in await self._meal_repository.get_user_meals_by_ids(
+                session, user_id, [*updates, *deletes], for_update=True
+            )
+        }
+        missing_ids = [meal_id for meal_id in (*updates, *deletes) if meal_id not in existing]
+        if missing_ids:
+            logger.warning(f"Meals {missing_ids} not found for user {user_id}.")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Meals with ids {', '.join(str(meal_id) for meal_id in missing_ids)} not found"
+            )
+
+        deltas: dict[date, dict[str, float]] = {}
+        previous = {meal_id: self._meal_nutrients(existing[meal_id]) for meal_id in updates}
+        for meal_id in deletes:
+            meal = existing[meal_id]
+            self._add_daily_delta(
+                deltas, meal.created_at.date(), (-value for value in self._meal_nutrients(meal)), meal_count=-1
+            )
+
+        try:
+            await self._meal_repository.delete_meals(session, deletes)
+
+            created = await self._meal_repository.create_meals(session, [
+                {"name": operation.name, "user_id": user_id, **dict.fromkeys(NUTRIENT_FIELDS, 0)}
+                for operation in creates
+            ])
+            product_weights = {
+                meal.id: {product.product_id: product.product_weight for product in operation.products}
+                for meal, operation in zip(created, creates)
+                if operation.products
+            }
+            product_weights.update({
+                meal_id: {product.product_id: product.product_weight for product in operation.products}
+                for meal_id, operation in updates.items()
+                if operation.products is not None
+            })
+            await self._meal_products_repository.sync_many_meal_products(session, product_weights)
+
+            created_ids = [meal.id for meal in created]
+            meals = {
+                meal.id: meal
+                for meal in await self._meal_repository.get_user_meals_by_ids(
+                    session, user_id, [*created_ids, *updates]
+                )
+            }
+            for meal in meals.values():
+                nutrients = self._sum_meal_products(meal)
+                operation = updates.get(meal.id)
+                if operation is None:
+                    self._add_daily_delta(deltas, meal.created_at.date(), nutrients, meal_count=1)
+                else:
+                    if operation.name is not None:
+                        meal.name = operation.name
+                    self._add_daily_delta(
+                        deltas,
+                        meal.created_at.date(),
+                        (new - old for new, old in zip(nutrients, previous[meal.id]))
+                    )
+                for field, value in zip(NUTRIENT_FIELDS, nutrients):
+                    setattr(meal, field, value)
+
+            await self._daily_nutrition_repository.apply_deltas(session, user_id, deltas)
+            await session.commit()
+
+        except IntegrityError as e:
+            logger.error(f"Error applying meal batch for user {user_id}. Rolling back. Error: {str(e)}")
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Failed to apply meal batch"
+            )
+
+        await self._clear_meals_cache(user_id, [*created_ids, *updates, *deletes], deltas.keys())
+        logger.info(
+            f"Meal batch for user {user_id} applied: {len(created_ids)} created, "
+            f"{len(updates)} updated, {len(deletes)} deleted."
+        )
+
+        return MealBatchResult(
+            created=[convert_meal_model_to_schema(meals[meal_id]) for meal_id in created_ids],
+            updated=[convert_meal_model_to_schema(meals[meal_id]) for meal_id in updates],
+            deleted=deletes,
+        )
+
+    async def _validate_products_exist(self, session: AsyncSession, product_ids: Iterable[UUID]) -> None:
+        missing_ids = await self._meal_products_repository.get_missing_product_ids(session, product_ids)
+        if missing_ids:
+            logger.error(f"Products with ids {missing_ids} not found.")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Products with ids {', '.join(str(product_id) for product_id in missing_ids)} not found"
+            )
+
     async def get_user_meals(self, session: AsyncSession, user_id: UUID) -> list[MealRead]:
         cache_key = f"user_meals:{user_id}"
         logger.info(f"Checking cache for user {user_id}'s meals.")
-        cached_data = await cache.get(cache_key)
+        cached_data = await cache.get_model(cache_key, MEAL_LIST_ADAPTER)
 
-        if cached_data:
+        if cached_data is not None:
             logger.info(f"Cache hit for user {user_id}'s meals.")
-            return [MealRead.model_validate(meal) for meal in cached_data]
+            return cached_data
 
         logger.info(f"Cache miss for user {user_id}'s meals. Fetching from database.")
         meals = await self._meal_repository.get_user_meals(session, user_id)
         meal_list = [convert_meal_model_to_schema(meal) for meal in meals]
-        await cache.set(cache_key, [meal.model_dump(mode="json") for meal in meal_list], expire=3600)
+        await cache.set_model(cache_key, meal_list, MEAL_LIST_ADAPTER, expire=3600)
         logger.info(f"Meals for user {user_id} cached successfully.")
         return meal_list
 
     async def get_user_meals_with_products_by_date(self, session: AsyncSession, user_id: UUID, target_date: str) -> list[MealRead]:
         cache_key = f"user_meals_products:{user_id}:{target_date}"
         logger.info(f"Checking cache for user {user_id}'s meals on {target_date}.")
-        cached_data = await cache.get(cache_key)
+        cached_data = await cache.get_model(cache_key, MEAL_LIST_ADAPTER)
 
-        if cached_data:
+        if cached_data is not None:
             logger.info(f"Cache hit for user {user_id}'s meals on {target_date}.")
-            return [MealRead.model_validate(meal) for meal in cached_data]
+            return cached_data
 
         logger.info(f"Cache miss for user {user_id}'s meals on {target_date}. Fetching from database.")
         current_date_obj = datetime.strptime(target_date, '%Y-%m-%d').date()
         meals = await self._meal_repository.get_meals_with_products_by_date(session, user_id, current_date_obj)
         meal_list = [convert_meal_model_to_schema(meal) for meal in meals]
 
-        await cache.set(cache_key, [meal.model_dump(mode="json") for meal in meal_list], expire=3600)
+        await cache.set_model(cache_key, meal_list, MEAL_LIST_ADAPTER, expire=3600)
         logger.info(f"Meals for user {user_id} on {target_date} cached successfully.")
         return meal_list
 
     async def get_meal_by_id(self, session: AsyncSession, meal_id: UUID, user_id: UUID) -> MealRead | None:
         cache_key = f"user_meal:{user_id}:{meal_id}"
         logger.info(f"Checking cache for meal {meal_id} of user {user_id}.")
-        cached_data = await cache.get(cache_key)
-        if cached_data:
+        cached_data = await cache.get_model(cache_key, MEAL_ADAPTER)
+        if cached_data is not None:
             logger.info(f"Cache hit for meal {meal_id} of user {user_id}.")
-            return MealRead.model_validate(cached_data)
+            return cached_data
 
         logger.info(f"Cache miss for meal {meal_id} of user {user_id}. Fetching from database.")
         meal = await self._meal_repository.get_meal_by_id_with_products(session, meal_id, user_id)
@@ -201,48 +341,69 @@ class MealService:
             return None
 
         meal_schema = convert_meal_model_to_schema(meal)
-        await cache.set(cache_key, meal_schema.model_dump(mode="json"), expire=3600)
+        await cache.set_model(cache_key, meal_schema, MEAL_ADAPTER, expire=3600)
         logger.info(f"Meal {meal_id} of user {user_id} cached successfully.")
         return meal_schema
 
     async def get_meals_by_date(self, session: AsyncSession, user_id: UUID, target_date: str) -> list[MealRead]:
         cache_key = f"user_meals:{user_id}:{target_date}"
         logger.info(f"Checking cache for meals on {target_date} of user {user_id}.")
-        cached_data = await cache.get(cache_key)
+        cached_data = await cache.get_model(cache_key, MEAL_LIST_ADAPTER)
 
-        if cached_data:
+        if cached_data is not None:
             logger.info(f"Cache hit for user {user_id}'s meals on {target_date}.")
-            return [MealRead.model_validate(meal) for meal in cached_data]
+            return cached_data
 
         logger.info(f"Cache miss for meals on {target_date} of user {user_id}. Fetching from database.")
         current_date_obj = datetime.strptime(target_date, '%Y-%m-%d').date()
         meals = await self._meal_repository.get_meals_by_date(session, user_id, current_date_obj)
         meals_list = [convert_meal_model_to_schema(meal) for meal in meals]
 
-        await cache.set(cache_key, [meal.model_dump(mode="json") for meal in meals_list], expire=3600)
+        await cache.set_model(cache_key, meals_list, MEAL_LIST_ADAPTER, expire=3600)
         logger.info(f"Meals on {target_date} for user {user_id} cached successfully.")
         return meals_list
 
     async def get_meals_last_7_days(self, session: AsyncSession, user_id: UUID) -> list[MealRead]:
         cache_key = f"user_meals_history:{user_id}"
         logger.info(f"Checking cache for last 7 days meals for user {user_id}.")
-        cached_data = await cache.get(cache_key)
-        if cached_data:
+        cached_data = await cache.get_model(cache_key, MEAL_LIST_ADAPTER)
+        if cached_data is not None:
             logger.info(f"Cache hit for last 7 days meals for user {user_id}.")
-            return [MealRead.model_validate(meal) for meal in cached_data]
+            return cached_data
 
         logger.info(f"Cache miss for last 7 days meals for user {user_id}. Fetching from database.")
         meals = await self._meal_repository.get_meals_last_days(session, user_id, days=7)
         meals_list = [convert_meal_model_to_schema(meal) for meal in meals]
 
-        await cache.set(cache_key, [meal.model_dump(mode="json") for meal in meals_list], expire=3600)
+        await cache.set_model(cache_key, meals_list, MEAL_LIST_ADAPTER, expire=3600)
         logger.info(f"Last 7 days meals for user {user_id} cached successfully.")
         return meals_list
 
+    async def get_nutrition_summary(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        date_from: date,
+        date_to: date
+    ) -> list[DailyNutritionRead]:
+        if date_from > date_to:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="'from' must not be after 'to'"
+            )
+        if (date_to - date_from).days >= MAX_SUMMARY_DAYS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Summary range must not exceed {MAX_SUMMARY_DAYS} days"
+            )
+
+        days = await self._daily_nutrition_repository.get_range(session, user_id, date_from, date_to)
+        return [DailyNutritionRead.model_validate(day) for day in days]
+
     async def delete_meal(self, session: AsyncSession, meal_id: UUID, user_id: UUID) -> dict:
         logger.info(f"Deleting meal {meal_id} for user {user_id}.")
 
-        meal = await self._meal_repository.get_by_id(session, meal_id)
+        meal = await self._meal_repository.get_by_id_for_update(session, meal_id)
         if not meal or meal.user_id != user_id:
             logger.warning(f"Meal {meal_id} not found for user {user_id}.")
             raise HTTPException(
@@ -252,6 +413,17 @@ class MealService:
 
         await self._meal_repository.delete_meal_products(session, meal_id)
         await self._meal_repository.delete(session, meal_id)
+        await self._daily_nutrition_repository.apply_delta(
+            session,
+            user_id,
+            meal.created_at.date(),
+            weight=-meal.weight,
+            calories=-meal.calories,
+            proteins=-meal.proteins,
+            fats=-meal.fats,
+            carbohydrates=-meal.carbohydrates,
+            meal_count=-1,
+        )
         await session.commit()
 
         await self._clear_meal_cache(user_id, meal_id, meal.created_at)
@@ -260,19 +432,23 @@ class MealService:
         return {"message": "Meal and its products deleted successfully"}
 
     async def _clear_meal_cache(self, user_id: UUID, meal_id: UUID = None, recorded_at: date = None):
+        await self._clear_meals_cache(
+            user_id,
+            [meal_id] if meal_id else [],
+            [recorded_at] if recorded_at else [],
+        )
+
+    async def _clear_meals_cache(self, user_id: UUID, meal_ids: Iterable[UUID], recorded_dates: Iterable[date]):
         keys = [
             f"user_meals:{user_id}",
             f"user_meals_history:{user_id}",
-            f"personal_products:{user_id}"
         ]
-        if meal_id:
-            keys.append(f"user_meal:{user_id}:{meal_id}")
-        if recorded_at:
-            recorded_date_str = recorded_at.strftime('%Y-%m-%d')
+        keys.extend(f"user_meal:{user_id}:{meal_id}" for meal_id in meal_ids)
+        for recorded_date_str in sorted({recorded_at.strftime('%Y-%m-%d') for recorded_at in recorded_dates}):
             keys.extend([
                 f"user_meals_products:{user_id}:{recorded_date_str}",
                 f"user_meals:{user_id}:{recorded_date_str}"
             ])
 
-        await asyncio.gather(*(cache.delete(k) for k in keys))
+        await cache.invalidate_tags(f"personal_products:{user_id}", keys=keys)
         logger.info(f"Cleared cache for keys: {keys}")
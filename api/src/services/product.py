@@ -1,16 +1,24 @@
 from dataclasses import dataclass
+from typing import Awaitable, Callable
 from uuid import UUID
 from fastapi import HTTPException, status, UploadFile
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.src.cache.cache import cache
+from api.src.cache.visibility import product_visibility
 from api.logging_config import logger
-from api.src.models import MealProducts
+from api.src.models import MealProducts, Product
 from api.src.repositories.objects.base import BaseObjectRepository
-from api.src.schemas.base import Pagination
-from api.src.schemas.product import ProductRead, ProductCreate, ProductUpdate, ProductAdd
+from api.src.schemas.base import CursorPagination
+from api.src.schemas.product import ProductRead, ProductCreate, ProductUpdate, ProductAdd, ProductPage
 from api.src.repositories.product.base import BaseProductRepository
 from api.src.services.converters.product import convert_product_model_to_schema
+from api.src.utils.cursor import encode_cursor, decode_cursor
+
+
+PRODUCT_ADAPTER = TypeAdapter(ProductRead)
+PRODUCT_PAGE_ADAPTER = TypeAdapter(ProductPage)
 
 
 @dataclass(slots=True)
@@ -22,79 +30,136 @@ class ProductService:
         self,
         session: AsyncSession,
         user_id: UUID,
-        pagination: Pagination
-    ) -> list[ProductRead]:
-        cache_key = f"user_products:{user_id}"
-        logger.info(f"Checking cache for user {user_id}'s products.")
-
-        cached_data = await cache.get(cache_key)
-        if cached_data:
-            logger.info(f"Cache hit for user {user_id}'s products.")
-            return [ProductRead.model_validate(product) for product in cached_data]
-
-        logger.info(f"Cache miss for user {user_id}'s products. Fetching from database.")
-        products = await self._product_repository.get_user_products(session, user_id=user_id, limit=pagination.limit, offset=pagination.offset)
-        product_list = [convert_product_model_to_schema(product) for product in products]
-
-        await cache.set(cache_key, [product.model_dump(mode="json") for product in product_list], expire=3600)
-        logger.info(f"Products for user {user_id} cached successfully.")
-        return product_list
-
-    async def get_personal_products(self, session: AsyncSession, user_id: UUID, pagination: Pagination) -> list[ProductRead]:
-        cache_key = f"personal_products:{user_id}"
-        logger.info(f"Checking cache for personal products of user {user_id}.")
-
-        cached_data = await cache.get(cache_key)
-        if cached_data:
-            logger.info(f"Cache hit for personal products of user {user_id}.")
-            return [ProductRead.model_validate(product) for product in cached_data]
-
-        logger.info(f"Cache miss for personal products of user {user_id}. Fetching from database.")
-        products = await self._product_repository.get_personal_products(session, user_id, limit=pagination.limit, offset=pagination.offset)
-        product_list = [convert_product_model_to_schema(product) for product in products]
-
-        await cache.set(cache_key, [product.model_dump(mode="json") for product in product_list], expire=3600)
-        logger.info(f"Personal products for user {user_id} cached successfully.")
-        return product_list
-
-    async def search_products(self, session: AsyncSession, user_id: UUID, query: str, pagination: Pagination) -> list[ProductRead]:
-        cache_key = f"product_search:{user_id}:{query.lower()}"
+        pagination: CursorPagination
+    ) -> ProductPage:
+        cache_key = f"user_products:{user_id}:{pagination.limit}:{pagination.cursor or ''}"
+        return await self._get_product_page(
+            cache_key,
+            pagination,
+            lambda limit, after: self._keyed_by_name(
+                self._get_visible_products(session, user_id, limit, after)
+            ),
+            cursor_types=(str, UUID),
+            expire=3600,
+            tag=f"user_products:{user_id}",
+        )
+
+    async def get_personal_products(self, session: AsyncSession, user_id: UUID, pagination: CursorPagination) -> ProductPage:
+        cache_key = f"personal_products:{user_id}:{pagination.limit}:{pagination.cursor or ''}"
+        return await self._get_product_page(
+            cache_key,
+            pagination,
+            lambda limit, after: self._keyed_by_name(
+                self._product_repository.get_personal_products(session, user_id, limit, after)
+            ),
+            cursor_types=(str, UUID),
+            expire=3600,
+            tag=f"personal_products:{user_id}",
+        )
+
+    async def search_products(self, session: AsyncSession, user_id: UUID, query: str, pagination: CursorPagination) -> ProductPage:
         logger.info(f"Searching products for user {user_id} with query: {query}")
+        query = query.strip().lower()
+        cache_key = f"product_search:{user_id}:{query}:{pagination.limit}:{pagination.cursor or ''}"
+        return await self._get_product_page(
+            cache_key,
+            pagination,
+            lambda limit, after: self._keyed_by_rank(
+                self._search_visible_products(session, user_id, query, limit, after)
+            ),
+            cursor_types=(float, str, UUID),
+            expire=1800,
+            tag=f"product_search:{user_id}",
+        )
 
-        cached_data = await cache.get(cache_key)
-        if cached_data:
-            logger.info(f"Cache hit for product search: {query}")
-            return [ProductRead.model_validate(product) for product in cached_data]
+    async def _get_visible_products(
+        self, session: AsyncSession, user_id: UUID, limit: int, after: tuple | None
+    ) -> list[Product]:
+        family_product_ids = await product_visibility.get_family_product_ids(session, user_id)
+        return await self._product_repository.get_user_products(
+            session, user_id, limit, after, family_product_ids=family_product_ids
+        )
 
-        products = await self._product_repository.search_products(session, user_id, query, limit=pagination.limit, offset=pagination.offset)
-        product_list = [convert_product_model_to_schema(product) for product in products]
+    async def _search_visible_products(
+        self, session: AsyncSession, user_id: UUID, query: str, limit: int, after: tuple | None
+    ) -> list[tuple[Product, float]]:
+        family_product_ids = await product_visibility.get_family_product_ids(session, user_id)
+        return await self._product_repository.search_products(
+            session, user_id, query, limit, after, family_product_ids=family_product_ids
+        )
 
-        await cache.set(cache_key, [product.model_dump(mode="json") for product in product_list], expire=1800)
-        logger.info(f"Search results for '{query}' cached successfully.")
-        return product_list
+    @staticmethod
+    async def _keyed_by_name(products: Awaitable[list[Product]]) -> list[tuple[Product, tuple]]:
+        return [(product, (product.name, product.id)) for product in await products]
+
+    @staticmethod
+    async def _keyed_by_rank(rows: Awaitable[list[tuple[Product, float]]]) -> list[tuple[Product, tuple]]:
+        return [(product, (rank, product.name, product.id)) for product, rank in await rows]
+
+    async def _get_product_page(
+        self,
+        cache_key: str,
+        pagination: CursorPagination,
+        fetch: Callable[[int, tuple | None], Awaitable[list[tuple[Product, tuple]]]],
+        cursor_types: tuple[type, ...],
+        expire: int,
+        tag: str,
+    ) -> ProductPage:
+        cached_page = await cache.get_model(cache_key, PRODUCT_PAGE_ADAPTER)
+        if cached_page is not None:
+            logger.info(f"Cache hit for {cache_key}")
+            return cached_page
+
+        logger.info(f"Cache miss for {cache_key}. Fetching from database.")
+        after = None
+        if pagination.cursor:
+            values = decode_cursor(pagination.cursor)
+            if len(values) != len(cursor_types):
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+            try:
+                after = tuple(cursor_type(value) for cursor_type, value in zip(cursor_types, values))
+            except ValueError:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+        rows = await fetch(pagination.limit + 1, after)
+        has_next = len(rows) > pagination.limit
+        rows = rows[:pagination.limit]
+
+        page = ProductPage(
+            items=[convert_product_model_to_schema(product) for product, _ in rows],
+            next_cursor=encode_cursor(*rows[-1][1]) if has_next else None,
+        )
+        await cache.set_model(cache_key, page, PRODUCT_PAGE_ADAPTER, expire=expire, tags=[tag])
+        return page
 
     async def get_product_by_id(self, session: AsyncSession, product_id: UUID, user_id: UUID) -> ProductRead | None:
         cache_key = f"product:{user_id}:{product_id}"
         logger.info(f"Checking cache for product {product_id} of user {user_id}.")
 
-        cached_data = await cache.get(cache_key)
-        if cached_data:
+        cached_product = await cache.get_model(cache_key, PRODUCT_ADAPTER)
+        if cached_product is not None:
             logger.info(f"Cache hit for product {product_id} of user {user_id}.")
-            return ProductRead.model_validate(cached_data)
+            return cached_product
 
         logger.info(f"Cache miss for product {product_id} of user {user_id}. Fetching from database.")
-        product = await self._product_repository.get_by_id(session, product_id, user_id)
+        family_product_ids = await product_visibility.get_family_product_ids(session, user_id)
+        product = await self._product_repository.get_by_id(
+            session, product_id, user_id, family_product_ids=family_product_ids
+        )
         if not product:
             logger.warning(f"Product with id {product_id} not found for user {user_id}.")
             return None
 
         product_schema = convert_product_model_to_schema(product)
-        await cache.set(cache_key, product_schema.model_dump(mode="json"), expire=3600)
+        await cache.set_model(cache_key, product_schema, PRODUCT_ADAPTER, expire=3600)
         logger.info(f"Product {product_id} of user {user_id} cached successfully.")
         return product_schema
 
     async def get_product_by_name(self, session: AsyncSession, product_name: str, user_id: UUID) -> ProductRead | None:
-        product = await self._product_repository.get_by_name(session, product_name, user_id)
+        family_product_ids = await product_visibility.get_family_product_ids(session, user_id)
+        product = await self._product_repository.get_by_name(
+            session, product_name, user_id, family_product_ids=family_product_ids
+        )
         if not product:
             logger.warning(f"Product with name {product_name} not found for user {user_id}.")
             return None
@@ -291,15 +356,11 @@ class ProductService:
         return await self.create_product(session, product_create, user_id)
 
     async def _clear_product_cache(self, user_id: UUID, product_id: UUID | None = None):
-        keys = [
+        keys = [f"product:{user_id}:{product_id}"] if product_id else []
+        await cache.invalidate_tags(
             f"user_products:{user_id}",
             f"personal_products:{user_id}",
-        ]
-
-        if product_id:
-            keys.append(f"product:{user_id}:{product_id}")
-            keys.append(f"product_search:{user_id}:*")
-
-        for key in keys:
-            await cache.delete(key)
+            f"product_search:{user_id}",
+            keys=keys,
+        )
         logger.info(f"Cleared product cache for user {user_id}")
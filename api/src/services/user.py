@@ -3,8 +3,10 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status, UploadFile, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.src.cache.cache import cache
+from api.src.cache.principal import user_principal_cache
 from api.src.core.config import config, Configuration
 from api.src.core.security import Security
 from api.logging_config import logger
@@ -23,6 +25,9 @@ from api.src.fone_tasks.task import send_code
 from api.src.services.user_weight import UserWeightService
 
 
+USER_ADAPTER = TypeAdapter(UserRead)
+
+
 @dataclass(slots=True)
 class UserService:
     _user_repository: BaseUserRepository
@@ -36,7 +41,7 @@ class UserService:
 
             user = await self._user_repository.find_by_login_or_email(session, email_login)
 
-            if user and Security.verify_password(password, user.hashed_password):
+            if user and await Security.verify_password_async(password, user.hashed_password):
                 return convert_user_model_to_schema(user)
 
             raise HTTPException(
@@ -98,7 +103,7 @@ class UserService:
                     detail="User with this email already exists."
                 )
 
-            hashed_password = Security.get_password_hash(user_data.password)
+            hashed_password = await Security.get_password_hash_async(user_data.password)
             user = await self._user_repository.create_user(
                 session,
                 login=user_data.login,
@@ -140,7 +145,7 @@ class UserService:
                     detail="User not found"
                 )
 
-            if not Security.verify_password(current_password, user.hashed_password):
+            if not await Security.verify_password_async(current_password, user.hashed_password):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Current password is incorrect"
@@ -149,7 +154,7 @@ class UserService:
             self.validate_english_only("New password", new_password)
             Security.validate_password_strength(new_password)
 
-            new_hashed_password = Security.get_password_hash(new_password)
+            new_hashed_password = await Security.get_password_hash_async(new_password)
             updated_user = await self._user_repository.update_password(
                 session,
                 user_id=user_id,
@@ -163,6 +168,7 @@ class UserService:
                 )
 
             await session.commit()
+            await user_principal_cache.invalidate(user.login, user.email)
             logger.info(f"Password successfully changed for user ID: {user_id}")
             return updated_user
 
@@ -180,16 +186,16 @@ class UserService:
     async def find_user_by_login_and_email(self, session: AsyncSession, email_login: str) -> UserRead | None:
         cache_key = f"user:{email_login}"
         try:
-            cached_user = await cache.get(cache_key)
-            if cached_user:
+            cached_user = await cache.get_model(cache_key, USER_ADAPTER)
+            if cached_user is not None:
                 logger.info(f"Cache hit for user: {email_login}")
-                return UserRead.model_validate(cached_user)
+                return cached_user
             logger.info(f"Cache miss for user: {email_login}. Fetching from database.")
             user = await self._user_repository.find_by_login_or_email(session, email_login)
 
             if user:
                 user_schema = convert_user_model_to_schema(user)
-                await cache.set(cache_key, user_schema.model_dump(mode="json"), expire=3600)
+                await cache.set_model(cache_key, user_schema, USER_ADAPTER, expire=3600)
                 logger.info(f"User {email_login} fetched from DB and cached")
                 return user_schema
 
@@ -207,6 +213,7 @@ class UserService:
             await session.commit()
 
             await cache.delete(cache_key)
+            await user_principal_cache.invalidate(user.login, user.email)
             logger.info(f"User deleted from cache: {user.login}")
 
             return convert_user_model_to_schema(user)
@@ -246,6 +253,7 @@ class UserService:
                 logger.warning(f"Недостаточно данных для расчета нутриентов у пользователя {user.id}")
 
             await cache.delete(cache_key)
+            await user_principal_cache.invalidate(current_user.login, current_user.email)
             logger.info(f"User {current_user.login} deleted from cache")
 
             return convert_user_model_to_schema(updated_user)
@@ -388,6 +396,7 @@ class UserService:
         current_user.recommended_calories = adjusted_calories
         await self._user_repository.update_user(session, current_user,
                                                 {"recommended_calories": adjusted_calories})
+        await user_principal_cache.invalidate(current_user.login, current_user.email)
         logger.info(f"Premium nutrients calculation completed for user ID {current_user.id}")
         return premium_result
 
@@ -424,6 +433,7 @@ class UserService:
 
             current_user.avatar = filename
             await self._user_repository.update_user(session, current_user, {"avatar": filename})
+            await user_principal_cache.invalidate(current_user.login, current_user.email)
 
             logger.info(f"Avatar uploaded successfully for user {current_user.id}")
 
@@ -475,10 +485,14 @@ class UserService:
         if code_data != user_data.email:
             raise CodeIsNotValidException
 
+        old_user = await self._user_repository.get_by_id(session, user_id)
+        old_logins = (old_user.login, old_user.email) if old_user else ()
+
         user = await self._user_repository.update_email(session, user_id, user_data.email)
 
         await session.commit()
         await session.refresh(user)
+        await user_principal_cache.invalidate(*old_logins)
 
         await delete_code("change email", user_data.code)
 
@@ -528,11 +542,12 @@ class UserService:
 
         await delete_code("change_password", user_data.code)
 
-        hashed_password = Security.get_password_hash(user_data.new_password)
+        hashed_password = await Security.get_password_hash_async(user_data.new_password)
         updated_user = await self._user_repository.update_password(
             session, existed_user.id, hashed_password
         )
         await session.commit()
+        await user_principal_cache.invalidate(current_user.login, current_user.email)
         await self.logout_user(response)
         return convert_user_model_to_schema(updated_user)
 
@@ -547,13 +562,14 @@ class UserService:
             raise PasswordsAreNotTheSameException
 
         user_with_password = await self._user_repository.get_by_id(session, current_user.id)
-        if not Security.verify_password(passwords.old_password, user_with_password.hashed_password):
+        if not await Security.verify_password_async(passwords.old_password, user_with_password.hashed_password):
             raise WrongOldPasswordException
 
-        hashed_password = Security.get_password_hash(passwords.new_password)
+        hashed_password = await Security.get_password_hash_async(passwords.new_password)
         await self._user_repository.update_password(
             session, current_user.id, hashed_password
         )
         await session.commit()
+        await user_principal_cache.invalidate(current_user.login, current_user.email)
 
         await self.logout_user(response)
@@ -9,6 +9,7 @@ from api.src.repositories.user_weight.base import BaseUserWeightRepository
 from api.src.services.converters.user_weight import convert_user_weight_model_to_schema
 from api.src.repositories.user.base import BaseUserRepository  # добавлен импорт
 from api.src.cache.cache import cache  # добавлен импорт
+from api.src.cache.principal import user_principal_cache
 
 
 @dataclass(slots=True)
@@ -63,6 +64,7 @@ class UserWeightService:
                 await session.commit()
                 # Сбрасываем кэш пользователя
                 await cache.delete(f"user:{user.login}")
+                await user_principal_cache.invalidate(user.login, user.email)
                 logger.info(f"Updated user {user_id} weight to {weight_data.weight}kg and cleared cache")
 
             logger.info(f"Weight record created for user {user_id}")
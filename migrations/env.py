@@ -5,7 +5,7 @@ from alembic import context
 from api.src.models.base import Base
 from api.src.core.config import config as configuration
 from api.src.models import (
-    User, Staff, Product, Meal, MealProducts, UserWeight, Brand,
+    User, Staff, Product, Meal, MealProducts, DailyNutrition, UserWeight, Brand,
     Family, FamilyMember, FamilyInvitation, FamilyProduct,
     FamilyRole, InvitationStatus, Permission, Role, PermissionsEnum
 )
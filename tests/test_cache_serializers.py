@@ -0,0 +1,66 @@
+import uuid
+from datetime import datetime
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from pydantic import TypeAdapter
+from api.src.cache.cache import Cache
+from api.src.cache.serializers import JsonSerializer, OrjsonSerializer
+from api.src.schemas.product import ProductRead
+
+
+PRODUCTS_ADAPTER = TypeAdapter(list[ProductRead])
+
+
+def make_products(count: int) -> list[ProductRead]:
+    return [
+        ProductRead(
+            id=uuid.uuid4(),
+            name=f"Product {i}",
+            weight=100,
+            calories=100,
+            proteins=10,
+            fats=5,
+            carbohydrates=20,
+            is_public=True,
+            created_at=datetime(2025, 1, 1, 12, 0),
+        )
+        for i in range(count)
+    ]
+
+
+def test_orjson_model_roundtrip():
+    serializer = OrjsonSerializer()
+    products = make_products(3)
+
+    data = serializer.dumps_model(PRODUCTS_ADAPTER, products)
+
+    assert serializer.loads_model(PRODUCTS_ADAPTER, data) == products
+
+
+def test_payload_is_compressed_above_threshold():
+    serializer = OrjsonSerializer(compress_threshold=256)
+    products = make_products(50)
+
+    data = serializer.dumps_model(PRODUCTS_ADAPTER, products)
+
+    assert data[:1] == serializer.COMPRESSED
+    assert len(data) < len(PRODUCTS_ADAPTER.dump_json(products))
+    assert serializer.loads_model(PRODUCTS_ADAPTER, data) == products
+
+
+def test_plain_values_roundtrip_between_json_serializers():
+    value = {"ids": ["a", "b"], "count": 2}
+
+    assert OrjsonSerializer().loads(JsonSerializer().dumps(value)) == value
+
+
+@pytest.mark.asyncio
+async def test_legacy_payload_is_treated_as_cache_miss():
+    redis_cache = Cache(redis_url="redis://localhost", serializer=OrjsonSerializer())
+    redis_cache.pool = MagicMock()
+    redis_cache.pool.get = AsyncMock(return_value=b'[{"name": "Apple"}]')
+    redis_cache.pool.delete = AsyncMock()
+
+    assert await redis_cache.get_model("user_meals:1", PRODUCTS_ADAPTER) is None
+    assert await redis_cache.get("user_meals:1") is None
+    redis_cache.pool.delete.assert_awaited_with("user_meals:1")
@@ -0,0 +1,57 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from api.src.cache.cache import Cache
+from api.src.cache.serializers import OrjsonSerializer
+
+
+def make_cache() -> tuple[Cache, MagicMock, AsyncMock]:
+    redis_cache = Cache(redis_url="redis://localhost", serializer=OrjsonSerializer(), tag_max_members=500)
+    script = AsyncMock(return_value=3)
+    redis_cache.pool = MagicMock()
+    redis_cache.pool.set = AsyncMock()
+    redis_cache.pool.register_script.return_value = script
+    return redis_cache, redis_cache.pool, script
+
+
+@pytest.mark.asyncio
+async def test_set_registers_key_in_tag_sets():
+    redis_cache, pool, script = make_cache()
+
+    await redis_cache.set("user_products:1:12:", {"items": []}, expire=60, tags=["user_products:1"])
+
+    script.assert_awaited_once_with(
+        keys=["user_products:1:12:", "tag:user_products:1"],
+        args=[b'\x00{"items":[]}', 60, 500],
+    )
+    pool.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_set_without_tags_is_a_plain_set():
+    redis_cache, pool, script = make_cache()
+
+    await redis_cache.set("product:1:2", {"id": 2}, expire=60)
+
+    pool.set.assert_awaited_once_with("product:1:2", b'\x00{"id":2}', ex=60)
+    script.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tags_runs_single_script_call():
+    redis_cache, _, script = make_cache()
+
+    await redis_cache.invalidate_tags("user_products:1", "product_search:1", keys=["product:1:2"])
+
+    script.assert_awaited_once_with(
+        keys=["tag:user_products:1", "tag:product_search:1", "product:1:2"],
+        args=[2],
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_many_skips_round_trip_without_keys():
+    redis_cache, _, script = make_cache()
+
+    await redis_cache.delete_many()
+
+    script.assert_not_awaited()
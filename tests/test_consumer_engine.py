@@ -0,0 +1,99 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from api.src.rabbitmq.consumer import ConsumerEngine, RETRY_HEADER
+
+
+def make_engine(max_retries: int = 2) -> ConsumerEngine:
+    client = MagicMock()
+    client.channel.default_exchange.publish = AsyncMock()
+    return ConsumerEngine(client=client, prefetch_count=4, concurrency=2, max_retries=max_retries, retry_delay=5)
+
+
+def make_message(data, headers=None) -> MagicMock:
+    message = MagicMock()
+    message.body = data if isinstance(data, bytes) else json.dumps(data).encode()
+    message.headers = headers or {}
+    message.routing_key = "registration_queue"
+    message.ack = AsyncMock()
+    message.nack = AsyncMock()
+    return message
+
+
+@pytest.mark.asyncio
+async def test_message_is_dispatched_by_type():
+    engine = make_engine()
+    handler = AsyncMock()
+    engine.register("welcome")(handler)
+    message = make_message({"type": "welcome", "email": "a@example.com"})
+
+    await engine.process_message(message)
+
+    handler.assert_awaited_once_with({"type": "welcome", "email": "a@example.com"})
+    message.ack.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_message_is_delayed_with_retry_count():
+    engine = make_engine()
+    engine.register("registration")(AsyncMock(side_effect=RuntimeError("smtp down")))
+    message = make_message({"email": "a@example.com"})
+
+    await engine.process_message(message)
+
+    published, = engine.client.channel.default_exchange.publish.await_args_list
+    assert published.kwargs["routing_key"] == "registration_queue.retry.1"
+    assert published.args[0].headers[RETRY_HEADER] == 1
+    message.ack.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_exhausted_or_malformed_messages_go_to_dead_letter_queue():
+    engine = make_engine(max_retries=2)
+    engine.register("registration")(AsyncMock(side_effect=RuntimeError("smtp down")))
+
+    await engine.process_message(make_message({"email": "a@example.com"}, headers={RETRY_HEADER: 2}))
+    await engine.process_message(make_message(b"not json"))
+
+    routing_keys = [call.kwargs["routing_key"] for call in engine.client.channel.default_exchange.publish.await_args_list]
+    assert routing_keys == ["registration_queue.dead", "registration_queue.dead"]
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_in_flight_messages():
+    engine = make_engine()
+    release = asyncio.Event()
+
+    async def slow_handler(data):
+        await release.wait()
+
+    engine.register("registration")(slow_handler)
+    queue = MagicMock()
+    queue.consume = AsyncMock(return_value="ctag")
+    queue.cancel = AsyncMock()
+    engine.client.channel.set_qos = AsyncMock()
+    engine.client.declare_queue = AsyncMock(return_value=queue)
+
+    await engine.start("registration_queue")
+    message = make_message({"email": "a@example.com"})
+    await engine._pending.put(message)
+
+    stopping = asyncio.create_task(engine.stop())
+    await asyncio.sleep(0)
+    assert not stopping.done()
+    release.set()
+    await stopping
+
+    queue.cancel.assert_awaited_once_with("ctag")
+    message.ack.assert_awaited_once()
+    engine.client.channel.set_qos.assert_awaited_once_with(prefetch_count=4)
+    engine.client.declare_queue.assert_any_await(
+        "registration_queue.retry.2",
+        durable=True,
+        arguments={
+            "x-message-ttl": 10000,
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": "registration_queue",
+        },
+    )
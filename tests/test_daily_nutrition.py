@@ -0,0 +1,74 @@
+import uuid
+from datetime import date, datetime, timezone
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException
+from api.src.services.meal import MealService
+
+
+def make_meal(user_id, **values):
+    meal = MagicMock(
+        id=uuid.uuid4(),
+        user_id=user_id,
+        created_at=datetime(2025, 3, 1, 9, 30, tzinfo=timezone.utc),
+        meal_products=[],
+    )
+    for key in ("weight", "calories", "proteins", "fats", "carbohydrates"):
+        setattr(meal, key, values.get(key, 0.0))
+    return meal
+
+
+@pytest.mark.asyncio
+async def test_recalculate_applies_difference_to_daily_rollup():
+    user_id = uuid.uuid4()
+    meal = make_meal(user_id, weight=100.0, calories=200.0, proteins=10.0, fats=5.0, carbohydrates=20.0)
+    product = MagicMock(calories=100.0, proteins=10.0, fats=2.0, carbohydrates=15.0)
+    meal.meal_products = [MagicMock(product=product, product_weight=300.0)]
+
+    meal_repository = AsyncMock()
+    meal_repository.get_meal_by_id_with_products.return_value = meal
+    daily_nutrition_repository = AsyncMock()
+    service = MealService(meal_repository, AsyncMock(), daily_nutrition_repository)
+
+    await service.recalculate_meal_nutrients(AsyncMock(), meal)
+
+    kwargs = daily_nutrition_repository.apply_delta.await_args.kwargs
+    assert daily_nutrition_repository.apply_delta.await_args.args[1:] == (user_id, date(2025, 3, 1))
+    assert kwargs == {
+        "weight": 200.0,
+        "calories": 100.0,
+        "proteins": 20.0,
+        "fats": 1.0,
+        "carbohydrates": 25.0,
+        "meal_count": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_delete_meal_subtracts_meal_from_daily_rollup():
+    user_id = uuid.uuid4()
+    meal = make_meal(user_id, weight=150.0, calories=300.0, proteins=12.0, fats=8.0, carbohydrates=40.0)
+    meal_repository = AsyncMock()
+    meal_repository.get_by_id_for_update.return_value = meal
+    daily_nutrition_repository = AsyncMock()
+    service = MealService(meal_repository, AsyncMock(), daily_nutrition_repository)
+
+    session = AsyncMock()
+
+    with patch.object(MealService, "_clear_meal_cache", AsyncMock()):
+        await service.delete_meal(session, meal.id, user_id)
+
+    meal_repository.get_by_id_for_update.assert_awaited_once_with(session, meal.id)
+    kwargs = daily_nutrition_repository.apply_delta.await_args.kwargs
+    assert kwargs["calories"] == -300.0
+    assert kwargs["meal_count"] == -1
+
+
+@pytest.mark.asyncio
+async def test_summary_rejects_inverted_range():
+    service = MealService(AsyncMock(), AsyncMock(), AsyncMock())
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_nutrition_summary(AsyncMock(), uuid.uuid4(), date(2025, 3, 2), date(2025, 3, 1))
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,22 @@
+import uuid
+from datetime import datetime
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from api.src.repositories.user_weight.sqlalchemy import SqlAlchemyUserWeightRepository
+
+
+@pytest.mark.asyncio
+async def test_add_daily_records_is_a_single_insert_select():
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(rowcount=2)
+    repository = SqlAlchemyUserWeightRepository()
+
+    inserted = await repository.add_daily_records(session, datetime(2025, 3, 1), [uuid.uuid4(), uuid.uuid4()])
+
+    assert inserted == 2
+    session.execute.assert_awaited_once()
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("INSERT INTO user_weight (id, user_id, weight) SELECT")
+    assert "DISTINCT ON (user_weight.user_id)" in sql
+    assert "NOT (EXISTS" in sql
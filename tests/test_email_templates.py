@@ -0,0 +1,42 @@
+from unittest.mock import patch
+from api.src.mail.templates import EmailTemplates
+
+
+def make_templates(tmp_path, **kwargs) -> EmailTemplates:
+    emails = tmp_path / "templates" / "email_notifications"
+    emails.mkdir(parents=True)
+    (emails / "code.html").write_text("<p>{{ code }}</p>", encoding="utf-8")
+    (emails / "static.html").write_text("<p>Welcome!</p>", encoding="utf-8")
+    (tmp_path / "templates" / "form.html").write_text("{{ field }}", encoding="utf-8")
+    return EmailTemplates(directory=str(tmp_path / "templates"), cache_dir=str(tmp_path), **kwargs)
+
+
+def test_templates_are_compiled_once(tmp_path):
+    templates = make_templates(tmp_path)
+
+    with patch.object(templates.environment, "get_template", wraps=templates.environment.get_template) as get:
+        assert templates.render("/email_notifications/code.html", code="123456") == "<p>123456</p>"
+        assert templates.render("email_notifications/code.html", code="654321") == "<p>654321</p>"
+
+    assert get.call_count == 2
+    assert "form.html" not in templates._templates
+
+
+def test_static_templates_are_prerendered(tmp_path):
+    templates = make_templates(tmp_path)
+    templates.load_all()
+
+    assert templates._static == {"email_notifications/static.html": "<p>Welcome!</p>"}
+
+
+def test_context_is_escaped(tmp_path):
+    templates = make_templates(tmp_path)
+
+    assert templates.render("email_notifications/code.html", code="<b>") == "<p>&lt;b&gt;</p>"
+
+
+def test_auto_reload_skips_prerendering(tmp_path):
+    templates = make_templates(tmp_path, auto_reload=True)
+
+    assert templates.render("email_notifications/static.html") == "<p>Welcome!</p>"
+    assert templates._static == {}
@@ -0,0 +1,59 @@
+import uuid
+from datetime import datetime
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import HTTPException
+from api.src.services.family import FamilyService
+
+
+def make_family() -> MagicMock:
+    family = MagicMock()
+    family.id = uuid.uuid4()
+    family.name = "Home"
+    family.description = None
+    family.is_active = True
+    family.created_by = uuid.uuid4()
+    family.created_at = family.updated_at = datetime.now()
+    return family
+
+
+def make_service() -> tuple[FamilyService, AsyncMock, AsyncMock]:
+    family_repository = AsyncMock()
+    member_repository = AsyncMock()
+    return FamilyService(family_repository, member_repository), family_repository, member_repository
+
+
+@pytest.mark.asyncio
+async def test_user_families_use_aggregated_counts():
+    service, family_repository, member_repository = make_service()
+    first, second = make_family(), make_family()
+    family_repository.get_user_families.return_value = [(first, 3, 10), (second, 1, 0)]
+
+    families = await service.get_user_families(AsyncMock(), uuid.uuid4())
+
+    assert [(f.id, f.members_count, f.products_count) for f in families] == [(first.id, 3, 10), (second.id, 1, 0)]
+    member_repository.get_family_members.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_family_by_id_uses_aggregated_counts():
+    service, family_repository, member_repository = make_service()
+    family = make_family()
+    family_repository.get_family_with_counts.return_value = (family, 5, 42)
+
+    result = await service.get_family_by_id(AsyncMock(), family.id, uuid.uuid4())
+
+    assert (result.members_count, result.products_count) == (5, 42)
+    member_repository.get_family_members.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_family_by_id_requires_membership():
+    service, family_repository, member_repository = make_service()
+    member_repository.get_family_member.return_value = None
+
+    with pytest.raises(HTTPException) as error:
+        await service.get_family_by_id(AsyncMock(), uuid.uuid4(), uuid.uuid4())
+
+    assert error.value.status_code == 403
+    family_repository.get_family_with_counts.assert_not_awaited()
@@ -0,0 +1,43 @@
+import uuid
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from api.src.services.family import FamilyNotificationService
+
+
+def make_service(user_ids: list[uuid.UUID]) -> tuple[FamilyNotificationService, AsyncMock, AsyncMock]:
+    notification_repository = AsyncMock()
+    notification_repository.create_notifications.side_effect = lambda session, rows: rows
+    member_repository = AsyncMock()
+    member_repository.get_member_user_ids.return_value = user_ids
+    user_repository = AsyncMock()
+    service = FamilyNotificationService(notification_repository, member_repository, user_repository, AsyncMock())
+    return service, notification_repository, user_repository
+
+
+@pytest.mark.asyncio
+async def test_product_added_notifications_are_written_in_one_call():
+    adder, *others = [uuid.uuid4() for _ in range(50)]
+    service, notification_repository, _ = make_service([adder, *others])
+
+    rows = await service.create_product_added_notification(
+        AsyncMock(), uuid.uuid4(), "Oats", "owner@example.com", exclude_user_id=adder
+    )
+
+    notification_repository.create_notifications.assert_awaited_once()
+    notification_repository.create_notification.assert_not_awaited()
+    assert [row["user_id"] for row in rows] == others
+
+
+@pytest.mark.asyncio
+async def test_member_added_resolves_new_member_once():
+    new_member, existing = uuid.uuid4(), uuid.uuid4()
+    service, notification_repository, user_repository = make_service([existing, new_member])
+    user_repository.find_by_email.return_value = MagicMock(id=new_member)
+
+    rows = await service.create_member_added_notification(
+        AsyncMock(), uuid.uuid4(), "new@example.com", "owner@example.com"
+    )
+
+    user_repository.find_by_email.assert_awaited_once()
+    notification_repository.create_notifications.assert_awaited_once()
+    assert [row["title"] for row in rows] == ["Новый участник в семье", "Добро пожаловать в семью"]
@@ -0,0 +1,81 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import HTTPException
+from api.src.schemas.base import CursorPagination
+from api.src.services.family import FamilyInvitationService, FamilyNotificationService
+from api.src.utils.cursor import encode_cursor
+
+
+def make_notification(created_at: datetime) -> MagicMock:
+    notification = MagicMock()
+    notification.id = uuid.uuid4()
+    notification.user_id = uuid.uuid4()
+    notification.family_id = uuid.uuid4()
+    notification.invitation_id = None
+    notification.invitation = None
+    notification.family.name = "Home"
+    notification.type = "product_added"
+    notification.title = "title"
+    notification.message = "message"
+    notification.is_read = False
+    notification.read_at = None
+    notification.created_at = notification.updated_at = created_at
+    return notification
+
+
+def make_service(notifications) -> tuple[FamilyNotificationService, AsyncMock]:
+    repository = AsyncMock()
+    repository.get_user_notifications.return_value = notifications
+    return FamilyNotificationService(repository, AsyncMock(), AsyncMock(), AsyncMock()), repository
+
+
+@pytest.mark.asyncio
+async def test_notifications_page_is_one_query_with_next_cursor():
+    now = datetime.now(timezone.utc)
+    notifications = [make_notification(now - timedelta(minutes=i)) for i in range(3)]
+    service, repository = make_service(notifications)
+    session = AsyncMock()
+    user_id = uuid.uuid4()
+
+    page = await service.get_user_notifications(session, user_id, CursorPagination(limit=2))
+
+    repository.get_user_notifications.assert_awaited_once_with(session, user_id, None, 3, None)
+    session.execute.assert_not_awaited()
+    assert [item.id for item in page.items] == [n.id for n in notifications[:2]]
+    assert page.next_cursor == encode_cursor(notifications[1].created_at, notifications[1].id)
+
+
+@pytest.mark.asyncio
+async def test_notifications_cursor_is_decoded_into_keyset():
+    service, repository = make_service([])
+    created_at, notification_id = datetime.now(timezone.utc), uuid.uuid4()
+
+    page = await service.get_user_notifications(
+        AsyncMock(), uuid.uuid4(), CursorPagination(limit=10, cursor=encode_cursor(created_at, notification_id)), is_read=False
+    )
+
+    assert repository.get_user_notifications.await_args.args[2:] == (False, 11, (created_at, notification_id))
+    assert page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_notifications_cursor_is_rejected():
+    service, _ = make_service([])
+
+    with pytest.raises(HTTPException) as error:
+        await service.get_user_notifications(AsyncMock(), uuid.uuid4(), CursorPagination(cursor=encode_cursor("x")))
+
+    assert error.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_user_invitations_are_not_reloaded_per_row():
+    invitation_repository = AsyncMock()
+    invitation_repository.get_user_invitations.return_value = []
+    service = FamilyInvitationService(invitation_repository, AsyncMock(), AsyncMock(), AsyncMock())
+    session = AsyncMock()
+
+    assert await service.get_user_invitations(session, "user@example.com") == []
+    session.execute.assert_not_awaited()
@@ -0,0 +1,93 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from api.src.mail.backends import MailBackend, MailConnectionError, MemoryBackend, SmtpBackend
+from api.src.mail.mailer import Mailer, build_message
+
+
+@pytest.mark.asyncio
+async def test_queued_messages_are_sent_as_one_batch():
+    backend = MemoryBackend()
+    backend.send_batch = AsyncMock(wraps=backend.send_batch)
+    mailer = Mailer(backend=backend, batch_size=10)
+
+    messages = [build_message(f"user{i}@example.com", "Code", f"{i}") for i in range(5)]
+    await asyncio.gather(*(mailer.send(message) for message in messages))
+    await mailer.close()
+
+    assert backend.outbox == messages
+    backend.send_batch.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_message_raises_for_its_sender_only():
+    backend = MemoryBackend()
+    error = RuntimeError("rejected")
+    backend.send_batch = AsyncMock(return_value=[None, error])
+    mailer = Mailer(backend=backend)
+
+    results = await asyncio.gather(
+        mailer.send(build_message("ok@example.com", "Code", "1")),
+        mailer.send(build_message("bad@example.com", "Code", "2")),
+        return_exceptions=True,
+    )
+    await mailer.close()
+
+    assert results == [None, error]
+
+
+@pytest.mark.asyncio
+async def test_smtp_backend_reuses_authenticated_connection():
+    client = MagicMock(is_connected=True)
+    client.send_message = AsyncMock()
+    backend = SmtpBackend(host="smtp.example.com", port=587, username="user", password="secret")
+    backend._connect = AsyncMock(return_value=client)
+
+    await backend.send_batch([build_message("a@example.com", "Code", "1")])
+    await backend.send_batch([build_message("b@example.com", "Code", "2")])
+
+    backend._connect.assert_awaited_once()
+    assert client.send_message.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_smtp_backend_fails_rest_of_batch_after_connection_error():
+    backend = SmtpBackend(host="smtp.example.com", port=587, username="user", password="secret")
+    error = MailConnectionError("unreachable")
+    backend._connect = AsyncMock(side_effect=error)
+    reported = []
+
+    results = await backend.send_batch(
+        [build_message(f"user{i}@example.com", "Code", f"{i}") for i in range(3)],
+        on_result=lambda index, result: reported.append((index, result)),
+    )
+
+    backend._connect.assert_awaited_once()
+    assert results == [error, error, error]
+    assert reported == [(0, error), (1, error), (2, error)]
+
+
+class SlowBackend(MailBackend):
+    def __init__(self):
+        self.release = asyncio.Event()
+
+    async def send_batch(self, messages, on_result=None):
+        on_result(0, None)
+        await self.release.wait()
+        on_result(1, None)
+        return [None, None]
+
+
+@pytest.mark.asyncio
+async def test_sender_is_released_when_its_message_is_sent():
+    backend = SlowBackend()
+    mailer = Mailer(backend=backend, batch_size=10)
+
+    first = asyncio.create_task(mailer.send(build_message("a@example.com", "Code", "1")))
+    second = asyncio.create_task(mailer.send(build_message("b@example.com", "Code", "2")))
+    await asyncio.wait_for(first, timeout=1)
+
+    assert not second.done()
+    backend.release.set()
+    await asyncio.wait_for(second, timeout=1)
+    await mailer.close()
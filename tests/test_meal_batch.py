@@ -0,0 +1,141 @@
+import uuid
+from datetime import date, datetime, timezone
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException
+from pydantic import ValidationError
+from api.src.schemas.meal import MealBatchOperation, MealBatchRequest, MealRead
+from api.src.schemas.meal_products import MealProductsCreate
+from api.src.services.meal import MealService
+
+
+def make_meal(user_id, meal_id=None, products=(), **values):
+    meal = MagicMock(
+        id=meal_id or uuid.uuid4(),
+        user_id=user_id,
+        created_at=datetime(2025, 3, 1, 9, 30, tzinfo=timezone.utc),
+        meal_products=[
+            MagicMock(product=MagicMock(calories=100.0, proteins=10.0, fats=5.0, carbohydrates=20.0),
+                      product_weight=weight)
+            for weight in products
+        ],
+    )
+    for key in ("weight", "calories", "proteins", "fats", "carbohydrates"):
+        setattr(meal, key, values.get(key, 0.0))
+    return meal
+
+
+def to_read(meal):
+    return MealRead(
+        id=meal.id, name="Meal", weight=meal.weight, calories=meal.calories, proteins=meal.proteins,
+        fats=meal.fats, carbohydrates=meal.carbohydrates, created_at=meal.created_at.date(), user_id=meal.user_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_each_step_once_and_aggregates_daily_deltas():
+    user_id = uuid.uuid4()
+    product_id = uuid.uuid4()
+    updated_id = uuid.uuid4()
+    deleted_id = uuid.uuid4()
+    created_id = uuid.uuid4()
+
+    updated_before = make_meal(user_id, updated_id, calories=300.0, weight=300.0)
+    deleted = make_meal(user_id, deleted_id, calories=150.0, weight=100.0)
+    created_after = make_meal(user_id, created_id, products=[200.0])
+    updated_after = make_meal(user_id, updated_id, products=[100.0], calories=300.0, weight=300.0)
+
+    meal_repository = AsyncMock()
+    meal_repository.get_user_meals_by_ids.side_effect = [
+        [updated_before, deleted],
+        [created_after, updated_after],
+    ]
+    meal_repository.create_meals.return_value = [MagicMock(id=created_id)]
+    meal_products_repository = AsyncMock()
+    meal_products_repository.get_missing_product_ids.return_value = set()
+    daily_nutrition_repository = AsyncMock()
+    service = MealService(meal_repository, meal_products_repository, daily_nutrition_repository)
+    session = AsyncMock()
+
+    batch = MealBatchRequest(operations=[
+        MealBatchOperation(op="create", name="Breakfast",
+                           products=[MealProductsCreate(product_id=product_id, product_weight=200)]),
+        MealBatchOperation(op="update", meal_id=updated_id, name="Lunch",
+                           products=[MealProductsCreate(product_id=product_id, product_weight=100)]),
+        MealBatchOperation(op="delete", meal_id=deleted_id),
+    ])
+
+    with patch("api.src.services.meal.cache") as cache, \
+            patch("api.src.services.meal.convert_meal_model_to_schema", MagicMock(side_effect=to_read)):
+        cache.invalidate_tags = AsyncMock()
+        result = await service.apply_batch(session, batch, user_id)
+
+    meal_products_repository.get_missing_product_ids.assert_awaited_once()
+    meal_repository.create_meals.assert_awaited_once()
+    meal_repository.delete_meals.assert_awaited_once_with(session, [deleted_id])
+    meal_products_repository.sync_many_meal_products.assert_awaited_once_with(session, {
+        created_id: {product_id: 200},
+        updated_id: {product_id: 100},
+    })
+    session.commit.assert_awaited_once()
+    cache.invalidate_tags.assert_awaited_once()
+    locked_load = meal_repository.get_user_meals_by_ids.await_args_list[0]
+    assert set(locked_load.args[2]) == {updated_id, deleted_id}
+    assert locked_load.kwargs == {"for_update": True}
+
+    _, delta_user_id, deltas = daily_nutrition_repository.apply_deltas.await_args.args
+    assert delta_user_id == user_id
+    assert list(deltas) == [date(2025, 3, 1)]
+    assert deltas[date(2025, 3, 1)]["calories"] == 200.0 - 200.0 - 150.0
+    assert deltas[date(2025, 3, 1)]["meal_count"] == 0
+    assert updated_after.name == "Lunch"
+    assert updated_after.calories == 100.0
+
+    assert [meal.id for meal in result.created] == [created_id]
+    assert [meal.id for meal in result.updated] == [updated_id]
+    assert result.deleted == [deleted_id]
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_meal_in_several_operations():
+    meal_id = uuid.uuid4()
+    meal_repository = AsyncMock()
+    service = MealService(meal_repository, AsyncMock(), AsyncMock())
+    batch = MealBatchRequest(operations=[
+        MealBatchOperation(op="update", meal_id=meal_id, name="Dinner"),
+        MealBatchOperation(op="delete", meal_id=meal_id),
+    ])
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.apply_batch(AsyncMock(), batch, uuid.uuid4())
+
+    assert exc_info.value.status_code == 400
+    meal_repository.get_user_meals_by_ids.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_batch_fails_whole_request_for_unknown_meal():
+    meal_repository = AsyncMock()
+    meal_repository.get_user_meals_by_ids.return_value = []
+    meal_products_repository = AsyncMock()
+    meal_products_repository.get_missing_product_ids.return_value = set()
+    service = MealService(meal_repository, meal_products_repository, AsyncMock())
+    session = AsyncMock()
+    batch = MealBatchRequest(operations=[
+        MealBatchOperation(op="create", name="Snack"),
+        MealBatchOperation(op="delete", meal_id=uuid.uuid4()),
+    ])
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.apply_batch(session, batch, uuid.uuid4())
+
+    assert exc_info.value.status_code == 404
+    meal_repository.create_meals.assert_not_awaited()
+    session.commit.assert_not_awaited()
+
+
+def test_batch_operation_requires_fields_for_its_type():
+    with pytest.raises(ValidationError):
+        MealBatchOperation(op="create")
+    with pytest.raises(ValidationError):
+        MealBatchOperation(op="update", name="Dinner")
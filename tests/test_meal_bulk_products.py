@@ -0,0 +1,54 @@
+import uuid
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException
+from api.src.schemas.meal import MealUpdate
+from api.src.schemas.meal_products import MealProductsUpdate
+from api.src.services.meal import MealService
+
+
+@pytest.mark.asyncio
+async def test_update_meal_syncs_products_in_one_call():
+    user_id = uuid.uuid4()
+    meal_id = uuid.uuid4()
+    product_id = uuid.uuid4()
+
+    db_meal = MagicMock(id=meal_id, user_id=user_id)
+    meal_repository = AsyncMock()
+    meal_repository.get_by_id_for_update.return_value = db_meal
+    meal_products_repository = AsyncMock()
+    meal_products_repository.get_missing_product_ids.return_value = set()
+
+    service = MealService(meal_repository, meal_products_repository, AsyncMock())
+    meal_update = MealUpdate(name="Dinner", products=[MealProductsUpdate(product_id=product_id, product_weight=150)])
+
+    with patch.object(MealService, "recalculate_meal_nutrients", AsyncMock(return_value=db_meal)), \
+            patch.object(MealService, "_clear_meal_cache", AsyncMock()), \
+            patch("api.src.services.meal.convert_meal_model_to_schema", MagicMock()):
+        await service.update_meal(AsyncMock(), meal_update, meal_id, user_id)
+
+    meal_products_repository.get_missing_product_ids.assert_awaited_once()
+    meal_products_repository.sync_meal_products.assert_awaited_once()
+    _, synced_meal_id, product_weights = meal_products_repository.sync_meal_products.await_args.args
+    assert synced_meal_id == meal_id
+    assert product_weights == {product_id: 150}
+
+
+@pytest.mark.asyncio
+async def test_update_meal_rejects_unknown_products():
+    user_id = uuid.uuid4()
+    missing_id = uuid.uuid4()
+
+    meal_repository = AsyncMock()
+    meal_repository.get_by_id_for_update.return_value = MagicMock(user_id=user_id)
+    meal_products_repository = AsyncMock()
+    meal_products_repository.get_missing_product_ids.return_value = {missing_id}
+
+    service = MealService(meal_repository, meal_products_repository, AsyncMock())
+    meal_update = MealUpdate(name="Dinner", products=[MealProductsUpdate(product_id=missing_id, product_weight=50)])
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.update_meal(AsyncMock(), meal_update, uuid.uuid4(), user_id)
+
+    assert exc_info.value.status_code == 404
+    meal_products_repository.sync_meal_products.assert_not_awaited()
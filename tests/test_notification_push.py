@@ -0,0 +1,66 @@
+import uuid
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from api.src.cache.notifications import NotificationChannel
+from api.src.services.family import FamilyNotificationService
+
+
+def make_channel(counter=None) -> tuple[NotificationChannel, MagicMock, AsyncMock]:
+    redis_cache = MagicMock()
+    redis_cache.pool.get = AsyncMock(return_value=counter)
+    redis_cache.pool.set = AsyncMock()
+    script = AsyncMock()
+    redis_cache.pool.register_script.return_value = script
+    return NotificationChannel(redis_cache=redis_cache, ttl=60, fill_ttl=5), redis_cache, script
+
+
+@pytest.mark.asyncio
+async def test_created_notifications_are_published_in_one_script_call():
+    channel, _, script = make_channel()
+    first, second = uuid.uuid4(), uuid.uuid4()
+
+    await channel.publish_created([first, second])
+
+    script.assert_awaited_once_with(
+        keys=[f"unread_notifications:{first}", f"unread_notifications:{second}"],
+        args=[1, "created", f"notifications:{first}", f"notifications:{second}"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_unread_count_is_served_from_redis():
+    channel, _, _ = make_channel(counter=b"7")
+    repository = AsyncMock()
+    service = FamilyNotificationService(repository, AsyncMock(), AsyncMock(), AsyncMock())
+
+    with patch("api.src.services.family.notification_channel", channel):
+        assert await service.get_unread_count(AsyncMock(), uuid.uuid4()) == {"unread_count": 7}
+
+    repository.get_unread_count.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_unread_count_miss_is_loaded_and_stored():
+    channel, redis_cache, _ = make_channel()
+    repository = AsyncMock()
+    repository.get_unread_count.return_value = 3
+    service = FamilyNotificationService(repository, AsyncMock(), AsyncMock(), AsyncMock())
+    user_id = uuid.uuid4()
+
+    with patch("api.src.services.family.notification_channel", channel):
+        assert await service.get_unread_count(AsyncMock(), user_id) == {"unread_count": 3}
+
+    redis_cache.pool.set.assert_awaited_once_with(f"unread_notifications:{user_id}", 3, ex=5, nx=True)
+
+
+@pytest.mark.asyncio
+async def test_unread_count_falls_back_to_database_when_redis_fails():
+    channel, redis_cache, _ = make_channel()
+    redis_cache.pool.get.side_effect = ConnectionError("redis down")
+    redis_cache.pool.set.side_effect = ConnectionError("redis down")
+    repository = AsyncMock()
+    repository.get_unread_count.return_value = 4
+    service = FamilyNotificationService(repository, AsyncMock(), AsyncMock(), AsyncMock())
+
+    with patch("api.src.services.family.notification_channel", channel):
+        assert await service.get_unread_count(AsyncMock(), uuid.uuid4()) == {"unread_count": 4}
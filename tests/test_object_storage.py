@@ -0,0 +1,48 @@
+import io
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import UploadFile
+from api.src.database.database import S3ClientManager
+from api.src.repositories.objects.filesystem import FileSystemObjectRepository
+
+
+@pytest.mark.asyncio
+async def test_s3_client_is_created_once_and_shared():
+    client = MagicMock()
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=client)
+    context.__aexit__ = AsyncMock()
+    session = MagicMock()
+    session.client.return_value = context
+    clients = S3ClientManager(session=session)
+
+    assert await clients.get() is client
+    assert await clients.get() is client
+    session.client.assert_called_once()
+
+    await clients.close()
+    context.__aexit__.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_filesystem_repository_round_trip(tmp_path):
+    repository = FileSystemObjectRepository(root=str(tmp_path), base_url="/media/")
+    upload = UploadFile(file=io.BytesIO(b"avatar"), filename="me.png")
+
+    filename = await repository.add(upload, file_key="avatar")
+
+    assert filename == "avatar.png"
+    assert (tmp_path / filename).read_bytes() == b"avatar"
+    assert repository.get_url(filename) == "/media/avatar.png"
+    assert await repository.is_exist(filename)
+
+    await repository.delete(filename)
+    assert not await repository.is_exist(filename)
+
+
+@pytest.mark.asyncio
+async def test_filesystem_repository_rejects_paths_outside_root(tmp_path):
+    repository = FileSystemObjectRepository(root=str(tmp_path / "objects"))
+
+    with pytest.raises(ValueError):
+        await repository.delete("../escape.txt")
@@ -0,0 +1,54 @@
+import asyncio
+import statistics
+import time
+import pytest
+from api.src.core.security import Security
+
+
+LOGINS = 32
+PROBE_INTERVAL = 0.005
+
+
+async def _probe_latencies(stop: asyncio.Event) -> list[float]:
+    latencies = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        latencies.append(time.perf_counter() - started - PROBE_INTERVAL)
+    return latencies
+
+
+async def _run_logins(login, hashed_password: str) -> tuple[float, list[float]]:
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe_latencies(stop))
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login("Password1!", hashed_password) for _ in range(LOGINS)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    return LOGINS / elapsed, await probe
+
+
+def _p99(latencies: list[float]) -> float:
+    return statistics.quantiles(latencies, n=100)[98] if len(latencies) > 1 else max(latencies, default=0.0)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_password_hashing_does_not_stall_event_loop():
+    hashed_password = Security.get_password_hash("Password1!")
+
+    async def blocking_login(password, hashed):
+        return Security.verify_password(password, hashed)
+
+    blocking_throughput, blocking_latencies = await _run_logins(blocking_login, hashed_password)
+    offloaded_throughput, offloaded_latencies = await _run_logins(Security.verify_password_async, hashed_password)
+
+    print(
+        f"\nblocking:  {blocking_throughput:.1f} logins/s, probe p99 {_p99(blocking_latencies) * 1000:.1f} ms"
+        f"\noffloaded: {offloaded_throughput:.1f} logins/s, probe p99 {_p99(offloaded_latencies) * 1000:.1f} ms"
+    )
+
+    assert _p99(offloaded_latencies) < _p99(blocking_latencies)
@@ -0,0 +1,94 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException
+from api.src.models.product import Product
+from api.src.schemas.base import CursorPagination
+from api.src.services.product import ProductService
+from api.src.utils.cursor import encode_cursor, decode_cursor
+
+
+def make_product(name: str) -> Product:
+    return Product(
+        id=uuid.uuid4(),
+        name=name,
+        weight=100,
+        calories=100,
+        proteins=10,
+        fats=5,
+        carbohydrates=20,
+        is_public=True,
+        created_at=datetime.now(),
+    )
+
+
+def test_cursor_roundtrip():
+    product_id = uuid.uuid4()
+    assert decode_cursor(encode_cursor("Apple", product_id)) == ["Apple", str(product_id)]
+
+
+@pytest.mark.asyncio
+async def test_user_products_page_returns_next_cursor_and_caches_by_page():
+    user_id = uuid.uuid4()
+    products = [make_product("Apple"), make_product("Banana"), make_product("Cherry")]
+    product_repository = AsyncMock()
+    product_repository.get_user_products.return_value = products
+    service = ProductService(product_repository, MagicMock())
+
+    with patch("api.src.services.product.cache") as cache_mock, \
+            patch("api.src.services.product.product_visibility") as visibility_mock:
+        visibility_mock.get_family_product_ids = AsyncMock(return_value=[])
+        cache_mock.get_model = AsyncMock(return_value=None)
+        cache_mock.set_model = AsyncMock()
+        page = await service.get_user_products(AsyncMock(), user_id, CursorPagination(limit=2))
+
+    assert [item.name for item in page.items] == ["Apple", "Banana"]
+    assert decode_cursor(page.next_cursor) == ["Banana", str(products[1].id)]
+    _, _, limit, after = product_repository.get_user_products.await_args.args
+    assert (limit, after) == (3, None)
+    assert cache_mock.set_model.await_args.args[0] == f"user_products:{user_id}:2:"
+
+
+@pytest.mark.asyncio
+async def test_user_products_page_passes_cursor_to_repository():
+    product_id = uuid.uuid4()
+    product_repository = AsyncMock()
+    product_repository.get_user_products.return_value = [make_product("Cherry")]
+    service = ProductService(product_repository, MagicMock())
+    cursor = encode_cursor("Banana", product_id)
+
+    with patch("api.src.services.product.cache") as cache_mock, \
+            patch("api.src.services.product.product_visibility") as visibility_mock:
+        visibility_mock.get_family_product_ids = AsyncMock(return_value=[])
+        cache_mock.get_model = AsyncMock(return_value=None)
+        cache_mock.set_model = AsyncMock()
+        page = await service.get_user_products(AsyncMock(), uuid.uuid4(), CursorPagination(limit=2, cursor=cursor))
+
+    assert page.next_cursor is None
+    assert product_repository.get_user_products.await_args.args[3] == ("Banana", product_id)
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected():
+    service = ProductService(AsyncMock(), MagicMock())
+
+    with patch("api.src.services.product.cache") as cache_mock, \
+            patch("api.src.services.product.product_visibility") as visibility_mock:
+        visibility_mock.get_family_product_ids = AsyncMock(return_value=[])
+        cache_mock.get_model = AsyncMock(return_value=None)
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_user_products(AsyncMock(), uuid.uuid4(), CursorPagination(cursor="not-a-cursor"))
+
+    assert exc_info.value.status_code == 400
+
+
+def test_cursor_with_non_string_values_is_rejected():
+    cursor = base64.urlsafe_b64encode(json.dumps(["2024-01-01", 5]).encode()).decode()
+
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,54 @@
+import statistics
+import time
+import uuid
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from api.src.repositories.product.sqlalchemy import SqlAlchemyProductRepository
+
+
+CATALOGUE_SIZE = 100_000
+QUERIES = ["chick", "брок", "yogurt", "aple", "greek yog", "rice", "tomatoe", "молок"]
+
+
+async def seed_catalogue(session: AsyncSession) -> None:
+    await session.execute(text("""
+        INSERT INTO product (id, slug, name, weight, calories, proteins, fats, carbohydrates, is_public, is_active)
+        SELECT gen_random_uuid(), 'product-' || n, words.word || ' ' || n, 100, 100, 10, 5, 20, true, true
+        FROM generate_series(1, :size) AS n
+        CROSS JOIN LATERAL (
+            SELECT (ARRAY['Chicken breast', 'Brown rice', 'Greek yogurt', 'Apple', 'Tomato',
+                          'Брокколи', 'Молоко', 'Oat flakes'])[1 + n % 8] AS word
+        ) AS words
+    """), {"size": CATALOGUE_SIZE})
+    await session.commit()
+    await session.execute(text("ANALYZE product"))
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_product_search_over_large_catalogue(test_db: AsyncSession):
+    await seed_catalogue(test_db)
+    repository = SqlAlchemyProductRepository()
+    user_id = uuid.uuid4()
+
+    latencies = []
+    for _ in range(5):
+        for query in QUERIES:
+            started = time.perf_counter()
+            rows = await repository.search_products(test_db, user_id, query, limit=20)
+            latencies.append(time.perf_counter() - started)
+            assert rows
+
+    plan = await test_db.execute(text(
+        "EXPLAIN SELECT id FROM product WHERE name ILIKE '%yogurt%' OR name %> 'yogurt'"
+    ))
+    plan_text = "\n".join(row[0] for row in plan)
+
+    print(
+        f"\nsearch over {CATALOGUE_SIZE} products: "
+        f"p50 {statistics.median(latencies) * 1000:.1f} ms, "
+        f"p95 {statistics.quantiles(latencies, n=20)[18] * 1000:.1f} ms\n{plan_text}"
+    )
+
+    assert "ix_product_name_trgm" in plan_text
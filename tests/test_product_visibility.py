@@ -0,0 +1,72 @@
+import uuid
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from api.src.cache.visibility import ProductVisibility
+from api.src.services.product import ProductService
+
+
+def make_cache(cached=None) -> MagicMock:
+    redis_cache = MagicMock()
+    redis_cache.get = AsyncMock(return_value=cached)
+    redis_cache.set = AsyncMock()
+    redis_cache.invalidate_tags = AsyncMock()
+    return redis_cache
+
+
+@pytest.mark.asyncio
+async def test_family_product_ids_are_served_from_cache():
+    product_id = uuid.uuid4()
+    visibility = ProductVisibility(redis_cache=make_cache([str(product_id)]))
+    session = AsyncMock()
+
+    assert await visibility.get_family_product_ids(session, uuid.uuid4()) == [product_id]
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_family_product_ids_are_loaded_once_and_cached():
+    user_id = uuid.uuid4()
+    product_id = uuid.uuid4()
+    redis_cache = make_cache()
+    visibility = ProductVisibility(redis_cache=redis_cache, ttl=60)
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = [product_id]
+    session = AsyncMock()
+    session.execute.return_value = result
+
+    assert await visibility.get_family_product_ids(session, user_id) == [product_id]
+    session.execute.assert_awaited_once()
+    redis_cache.set.assert_awaited_once_with(f"visible_family_products:{user_id}", [str(product_id)], expire=60)
+
+
+@pytest.mark.asyncio
+async def test_invalidate_users_drops_visibility_and_product_lists():
+    user_id = uuid.uuid4()
+    redis_cache = make_cache()
+    visibility = ProductVisibility(redis_cache=redis_cache)
+
+    await visibility.invalidate_users(user_id)
+
+    redis_cache.invalidate_tags.assert_awaited_once_with(
+        f"user_products:{user_id}",
+        f"product_search:{user_id}",
+        keys=[f"visible_family_products:{user_id}"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_service_resolves_family_products_for_repository():
+    user_id = uuid.uuid4()
+    product_id = uuid.uuid4()
+    product_repository = AsyncMock()
+    product_repository.get_by_name.return_value = None
+    service = ProductService(product_repository, MagicMock())
+    session = AsyncMock()
+
+    with patch("api.src.services.product.product_visibility") as visibility_mock:
+        visibility_mock.get_family_product_ids = AsyncMock(return_value=[product_id])
+        await service.get_product_by_name(session, "Apple", user_id)
+
+    product_repository.get_by_name.assert_awaited_once_with(
+        session, "Apple", user_id, family_product_ids=[product_id]
+    )
@@ -0,0 +1,82 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from aio_pika import DeliveryMode
+from api.src.rabbitmq.producer import Publisher
+
+
+def make_publisher(**kwargs) -> tuple[Publisher, AsyncMock]:
+    client = MagicMock()
+    publish = AsyncMock()
+    client.channel.default_exchange.publish = publish
+    return Publisher(client=client, **kwargs), publish
+
+
+@pytest.mark.asyncio
+async def test_publish_many_flushes_when_batch_is_full():
+    publisher, publish = make_publisher(batch_size=3, flush_interval=60)
+
+    publisher.publish_many([{"n": 1}, {"n": 2}, {"n": 3}], "notifications")
+    await asyncio.gather(*publisher._flushing)
+
+    assert publish.await_count == 3
+    message = publish.await_args_list[0].args[0]
+    assert message.body == b'{"n":1}'
+    assert message.delivery_mode == DeliveryMode.PERSISTENT
+
+
+@pytest.mark.asyncio
+async def test_small_batches_wait_for_the_flush_interval():
+    publisher, publish = make_publisher(batch_size=100, flush_interval=0.01)
+
+    publisher.publish({"n": 1}, "notifications", persistent=False)
+    assert publish.await_count == 0
+
+    await asyncio.sleep(0.05)
+    await publisher.close()
+
+    publish.assert_awaited_once()
+    assert publish.await_args.args[0].delivery_mode == DeliveryMode.NOT_PERSISTENT
+
+
+@pytest.mark.asyncio
+async def test_unconfirmed_messages_are_kept_for_retry():
+    publisher, publish = make_publisher(batch_size=100, flush_interval=60, max_attempts=3)
+    publish.side_effect = [None, RuntimeError("nack")]
+
+    publisher.publish_many([{"n": 1}, {"n": 2}], "notifications")
+    assert await publisher.flush() == 1
+
+    assert [pending.body for pending in publisher._buffer] == [b'{"n":2}']
+    publisher._timer.cancel()
+
+
+@pytest.mark.asyncio
+async def test_publish_fails_fast_without_connection_or_buffer_space():
+    publisher, publish = make_publisher(batch_size=100, flush_interval=60, max_buffer=2)
+
+    publisher.publish_many([{"n": 1}, {"n": 2}], "notifications")
+    with pytest.raises(RuntimeError):
+        publisher.publish({"n": 3}, "notifications")
+
+    publisher.client.channel = None
+    with pytest.raises(RuntimeError):
+        Publisher(client=publisher.client).publish({"n": 1}, "notifications")
+
+    assert len(publisher._buffer) == 2
+    publisher._timer.cancel()
+
+
+@pytest.mark.asyncio
+async def test_flush_without_channel_keeps_timer_armed():
+    publisher, publish = make_publisher(batch_size=100, flush_interval=60)
+    publisher.publish({"n": 1}, "notifications")
+    publisher._timer.cancel()
+    publisher._timer = None
+    publisher.client.channel = None
+
+    assert await publisher.flush() == 0
+
+    assert publisher._timer is not None
+    assert len(publisher._buffer) == 1
+    publisher._timer.cancel()
@@ -0,0 +1,78 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from api.src.core.config import config
+from api.src.repositories.objects import s3 as s3_module
+from api.src.repositories.objects.s3 import S3ObjectRepository
+
+
+class FakeStream:
+    def __init__(self, data: bytes, chunk_size: int = 3):
+        self.data = data
+        self.chunk_size = chunk_size
+        self.reads = 0
+
+    async def read(self, size: int) -> bytes:
+        self.reads += 1
+        chunk, self.data = self.data[:min(size, self.chunk_size)], self.data[min(size, self.chunk_size):]
+        return chunk
+
+
+@pytest.fixture
+def s3_client(monkeypatch):
+    client = MagicMock()
+    client.put_object = AsyncMock()
+    client.create_multipart_upload = AsyncMock(return_value={"UploadId": "upload"})
+    client.upload_part = AsyncMock(side_effect=lambda **kwargs: {"ETag": f"etag-{kwargs['PartNumber']}"})
+    client.complete_multipart_upload = AsyncMock()
+    client.abort_multipart_upload = AsyncMock()
+
+    uow = MagicMock()
+    uow.safe_client = client
+    uow.__aenter__ = AsyncMock(return_value=uow)
+    uow.__aexit__ = AsyncMock(return_value=None)
+    monkeypatch.setattr(s3_module, "S3UnitOfWork", lambda: uow)
+    monkeypatch.setattr(s3_module, "from_buffer", lambda data, mime: "image/png")
+    monkeypatch.setattr(config, "S3_MULTIPART_THRESHOLD", 10)
+    monkeypatch.setattr(config, "S3_MULTIPART_PART_SIZE", 4)
+    monkeypatch.setattr(config, "S3_MULTIPART_CONCURRENCY", 2)
+    monkeypatch.setattr(config, "REMOTE_FILE_MAX_SIZE", 20)
+    monkeypatch.setattr(config, "ALLOWED_MIME_TYPES", ["image/png"])
+    return client
+
+
+@pytest.mark.asyncio
+async def test_small_file_is_uploaded_with_sniffed_type(s3_client):
+    filename = await S3ObjectRepository()._ingest(FakeStream(b"png-data"), "key", "http://x")
+
+    assert filename == "key.png"
+    s3_client.put_object.assert_awaited_once()
+    assert s3_client.put_object.await_args.kwargs["ContentType"] == "image/png"
+    s3_client.create_multipart_upload.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_large_file_is_uploaded_in_parts(s3_client):
+    await S3ObjectRepository()._ingest(FakeStream(b"x" * 18), "key", "http://x")
+
+    assert s3_client.upload_part.await_count == 5
+    parts = s3_client.complete_multipart_upload.await_args.kwargs["MultipartUpload"]["Parts"]
+    assert [part["PartNumber"] for part in parts] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_oversized_file_aborts_multipart_upload(s3_client):
+    with pytest.raises(ValueError):
+        await S3ObjectRepository()._ingest(FakeStream(b"x" * 30), "key", "http://x")
+
+    s3_client.abort_multipart_upload.assert_awaited_once()
+    s3_client.complete_multipart_upload.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_unsupported_type_is_rejected_before_upload(s3_client, monkeypatch):
+    monkeypatch.setattr(s3_module, "from_buffer", lambda data, mime: "text/html")
+
+    with pytest.raises(ValueError):
+        await S3ObjectRepository()._ingest(FakeStream(b"<html>"), "key", "http://x")
+
+    s3_client.put_object.assert_not_awaited()
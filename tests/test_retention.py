@@ -0,0 +1,34 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy import select
+from api.src.fone_tasks.retention import run_batched_retention
+from api.src.models.user_weight import UserWeight
+
+
+def make_session_maker(rowcounts: list[int]) -> tuple[MagicMock, AsyncMock]:
+    session = AsyncMock()
+    session.execute.side_effect = [MagicMock(rowcount=rowcount) for rowcount in rowcounts]
+    session_context = MagicMock()
+    session_context.__aenter__ = AsyncMock(return_value=session)
+    session_context.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=session_context), session
+
+
+@pytest.mark.asyncio
+async def test_retention_deletes_in_bounded_batches_until_exhausted():
+    session_maker, session = make_session_maker([100, 100, 30])
+
+    with patch("api.src.fone_tasks.retention.asyncio.sleep", AsyncMock()) as sleep_mock:
+        stats = await run_batched_retention(
+            "user_weight",
+            UserWeight,
+            select(UserWeight.id),
+            batch_size=100,
+            sleep_seconds=0.5,
+            session_maker=session_maker,
+        )
+
+    assert (stats.batches, stats.deleted) == (3, 230)
+    assert session.commit.await_count == 3
+    assert sleep_mock.await_count == 2
+    assert "LIMIT" in str(session.execute.await_args.args[0])
@@ -0,0 +1,53 @@
+import uuid
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from api.src.cache.principal import UserPrincipalCache
+from api.src.models.user import User, GenderEnum
+
+
+def make_user() -> User:
+    return User(
+        id=uuid.uuid4(),
+        login="test_user",
+        email="test@example.com",
+        hashed_password="hash",
+        gender=GenderEnum.MALE,
+        weight=80.5,
+    )
+
+
+def test_dump_load_roundtrip_skips_password():
+    principal_cache = UserPrincipalCache(redis_cache=MagicMock(pool=None))
+    user = make_user()
+
+    data = principal_cache._dump(user)
+    loaded = principal_cache._load(data)
+
+    assert "hashed_password" not in data
+    assert loaded.id == user.id
+    assert loaded.gender is GenderEnum.MALE
+    assert loaded.weight == 80.5
+
+
+def test_local_cache_evicts_least_recently_used():
+    principal_cache = UserPrincipalCache(redis_cache=MagicMock(pool=None), max_size=2)
+
+    principal_cache._set_local("a", {"login": "a"})
+    principal_cache._set_local("b", {"login": "b"})
+    principal_cache._get_local("a")
+    principal_cache._set_local("c", {"login": "c"})
+
+    assert principal_cache._get_local("b") is None
+    assert principal_cache._get_local("a") == {"login": "a"}
+
+
+@pytest.mark.asyncio
+async def test_invalidate_removes_local_and_redis_keys():
+    redis_pool = AsyncMock()
+    principal_cache = UserPrincipalCache(redis_cache=MagicMock(pool=redis_pool))
+    principal_cache._set_local("test_user", {"login": "test_user"})
+
+    await principal_cache.invalidate("test_user", "test@example.com", None)
+
+    assert principal_cache._get_local("test_user") is None
+    redis_pool.delete.assert_awaited_once_with("user_principal:test_user", "user_principal:test@example.com")
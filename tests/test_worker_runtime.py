@@ -0,0 +1,46 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from api.src.fone_tasks.runtime import WorkerRuntime
+
+
+def make_runtime() -> tuple[WorkerRuntime, MagicMock]:
+    engine = MagicMock()
+    engine.dispose = AsyncMock()
+    return WorkerRuntime(engine_factory=MagicMock(return_value=engine)), engine
+
+
+def test_runtime_reuses_loop_and_engine_between_tasks():
+    runtime, engine = make_runtime()
+
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = runtime.run(current_loop())
+    second = runtime.run(current_loop())
+
+    assert first is second is runtime.loop
+    assert runtime.engine is engine
+    runtime._engine_factory.assert_called_once()
+    runtime.stop()
+
+
+def test_stop_disposes_engine_and_closes_loop():
+    runtime, engine = make_runtime()
+    runtime.start()
+    loop = runtime.loop
+
+    runtime.stop()
+
+    engine.dispose.assert_awaited_once()
+    assert loop.is_closed()
+    assert runtime.loop is None
+
+
+def test_session_maker_starts_runtime_lazily():
+    runtime, engine = make_runtime()
+
+    session_maker = runtime.session_maker
+
+    assert session_maker.kw["bind"] is engine
+    assert runtime.loop is not None
+    runtime.stop()